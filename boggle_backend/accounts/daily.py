@@ -5,7 +5,8 @@ from typing import Optional
 from django.utils import timezone
 
 from game.models import Challenge
-from game.word_solver import generate_solvable_grid, solve_boggle
+from game.board_pool import take_or_generate_board
+from game.solver import solve
 from .models import DailyChallenge, DailyChallengeResult, User
 
 
@@ -30,7 +31,7 @@ def pick_or_generate_challenge() -> Challenge:
     If none exist or none have valid words, generate a new solvable challenge.
     """
     # First, try to find an existing challenge with valid_words
-    active = list(Challenge.objects.active().exclude(valid_words=[]))
+    active = list(Challenge.objects.active().exclude(valid_words=[], valid_words_packed__isnull=True))
     if active:
         return random.choice(active)
     
@@ -42,8 +43,8 @@ def generate_daily_challenge() -> Challenge:
     """
     Generate a new solvable challenge for the daily.
     """
-    # Generate a solvable 4x4 grid with medium difficulty
-    grid, valid_words = generate_solvable_grid(size=4, difficulty='medium', language='en', min_words=20)
+    # Take a solvable 4x4 medium grid from the board pool (generated live if the pool is empty)
+    grid, valid_words = take_or_generate_board(4, 'medium', 'en', min_words=20)
     
     # Create the challenge with the generated grid
     challenge = Challenge.objects.create(
@@ -59,12 +60,13 @@ def generate_daily_challenge() -> Challenge:
     return challenge
 
 
-def record_daily_result(challenge: Challenge, user, session_score: int, session_obj=None, player_user_id: str | None = None):
+def record_daily_result(challenge: Challenge, user, session_score: int, session_obj=None, player_user_id: str | None = None,
+                        for_date: date | None = None):
     """
-    Upsert the user's score for today's daily challenge if the challenge matches today's daily.
+    Upsert the user's score for the daily challenge of `for_date` (default today) if the
+    challenge matches that day's daily.
     """
-    today = date.today()
-    daily = DailyChallenge.objects.filter(date=today, challenge=challenge).first()
+    daily = DailyChallenge.objects.filter(date=for_date or date.today(), challenge=challenge).first()
     if not daily:
         return
 
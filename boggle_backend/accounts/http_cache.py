@@ -0,0 +1,83 @@
+"""
+HTTP validators and a short server-side cache for endpoints clients poll
+(the daily challenge and the leaderboards).
+
+Each response is identified by a cheap version lookup (for leaderboards, the
+challenge's LeaderboardVersion, bumped when a session on it ends). The version
+becomes the ETag and Last-Modified headers, so a conditional GET for an unchanged
+resource is answered with 304 before any payload is built. Built payloads are kept
+in CACHES[POLL_CACHE] for POLL_CACHE_SECONDS under that ETag. Concurrent misses
+for the same ETag wait on a cache lock, so a burst of polls computes the payload once.
+"""
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from game.live_sessions import cache_lock
+
+logger = logging.getLogger(__name__)
+
+
+def get_poll_cache():
+    return caches[getattr(settings, "POLL_CACHE", "default")]
+
+
+def make_etag(resource: str, version: Any) -> str:
+    return '"%s"' % hashlib.sha1(f"{resource}|{version!r}".encode()).hexdigest()[:32]
+
+
+def _with_validators(response, etag: str, last_modified: Optional[datetime], vary_on_auth: bool):
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    # Stored copies must be revalidated; the 304 path makes that cheap.
+    response["Cache-Control"] = "no-cache"
+    if vary_on_auth:
+        patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+def conditional_response(request, resource: str, version: Any, last_modified: Optional[datetime],
+                         build: Callable[[], Any], vary_on_auth: bool = False):
+    """
+    Respond for `resource` at `version`: 304 if the client already has it, else the
+    payload from the poll cache or from build(). build() may return a Response
+    (e.g. a validation error), which is passed through uncached.
+    """
+    etag = make_etag(resource, version)
+    last_modified_ts = int(last_modified.timestamp()) if last_modified is not None else None
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+    if not_modified is not None:
+        return _with_validators(not_modified, etag, last_modified, vary_on_auth)
+
+    seconds = getattr(settings, "POLL_CACHE_SECONDS", 2)
+    if seconds <= 0:
+        payload = build()
+    else:
+        cache = get_poll_cache()
+        key = f"poll:{etag.strip(chr(34))}"
+        payload = cache.get(key)
+        if payload is None:
+            try:
+                with cache_lock(cache, f"{key}:lock", timeout=5, wait=2.0):
+                    payload = cache.get(key)
+                    if payload is None:
+                        payload = build()
+                        if not isinstance(payload, HttpResponseBase):
+                            cache.set(key, payload, seconds)
+            except TimeoutError:
+                logger.warning("Timed out waiting for %s to be built; building it here.", resource)
+                payload = build()
+
+    if isinstance(payload, HttpResponseBase):
+        return payload
+    return _with_validators(Response(payload, status=status.HTTP_200_OK), etag, last_modified, vary_on_auth)
@@ -1,14 +1,24 @@
-from datetime import date
-from typing import List, Dict, Any, Tuple
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple
 
 from django.contrib.auth import get_user_model
-from django.db.models import F
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
 
 from accounts.daily import get_or_create_daily_challenge
+from accounts.models import ChallengeLeaderboardEntry, LeaderboardVersion
+from game.boggle_engine import lazy_lru
 from game.models import GameSession
 
 User = get_user_model()
 
+# player_user_id of the entry that collects guest sessions.
+GUEST_PLAYER = ""
+
 
 def _session_queryset_for_challenge(challenge_id: int):
     return GameSession.objects.filter(
@@ -18,68 +28,359 @@ def _session_queryset_for_challenge(challenge_id: int):
     )
 
 
-def get_challenge_leaderboard(challenge_id: int, limit: int = 50) -> List[Dict[str, Any]]:
-    """
-    Get leaderboard aggregated by user - one entry per user with their stats.
-    """
-    from django.db.models import Max, Count, Sum
-    
-    # Aggregate sessions by player_user_id
-    qs = (
-        _session_queryset_for_challenge(challenge_id)
-        .values("player_user_id")
-        .annotate(
-            total_score=Sum("score"),
-            games_played=Count("id"),
-            best_score=Max("score"),
+# Leaderboard order: total score, then best score, then who reached their best first.
+# The player id makes it a total order, so every entry has a unique keyset position.
+_KEY_FIELDS = ("total_score", "best_score", "best_end_time", "player_user_id")
+_ORDER = [
+    F("total_score").desc(), F("best_score").desc(),
+    F("best_end_time").asc(nulls_last=True), F("player_user_id").asc(),
+]
+_REVERSE_ORDER = [
+    F("total_score").asc(), F("best_score").asc(),
+    F("best_end_time").desc(nulls_first=True), F("player_user_id").desc(),
+]
+
+
+def _after(key: Tuple[int, int, Any, str]) -> Q:
+    """Entries ranked strictly below the entry with this key."""
+    total, best, end_time, player = key
+    if end_time is None:
+        later = Q(best_end_time__isnull=True, player_user_id__gt=player)
+    else:
+        later = (
+            Q(best_end_time__gt=end_time) | Q(best_end_time__isnull=True)
+            | Q(best_end_time=end_time, player_user_id__gt=player)
         )
-        .order_by("-total_score", "-best_score")
-    )[:limit]
-    
+    return (
+        Q(total_score__lt=total)
+        | Q(total_score=total, best_score__lt=best)
+        | (Q(total_score=total, best_score=best) & later)
+    )
+
+
+def _before(key: Tuple[int, int, Any, str]) -> Q:
+    """Entries ranked strictly above the entry with this key."""
+    total, best, end_time, player = key
+    if end_time is None:
+        earlier = Q(best_end_time__isnull=False) | Q(best_end_time__isnull=True, player_user_id__lt=player)
+    else:
+        earlier = Q(best_end_time__lt=end_time) | Q(best_end_time=end_time, player_user_id__lt=player)
+    return (
+        Q(total_score__gt=total)
+        | Q(total_score=total, best_score__gt=best)
+        | (Q(total_score=total, best_score=best) & earlier)
+    )
+
+
+def _entry_rows(challenge_id: int, order=_ORDER):
+    return (
+        ChallengeLeaderboardEntry.objects.filter(challenge_id=challenge_id)
+        .order_by(*order)
+        .values(*_KEY_FIELDS, "games_played")
+    )
+
+
+def _row_key(row: Dict[str, Any]) -> Tuple[int, int, Any, str]:
+    return tuple(row[field] for field in _KEY_FIELDS)
+
+
+def _build_entries(challenge_id: int, rows: List[Dict[str, Any]], top_total: Optional[int], last_score=None,
+                   current_rank: int = 0, position: int = 0) -> List[Dict[str, Any]]:
+    # Rank of each player's best session among all sessions, in one bulk query.
+    session_ranks = _rank_scores(
+        challenge_id, [(row["best_score"], row["best_end_time"]) for row in rows if row["best_end_time"]],
+    )
     entries = []
-    for row in qs:
+    for row in rows:
+        best_rank = session_ranks.get((row["best_score"], row["best_end_time"]))
         entries.append({
-            "player_user_id": row["player_user_id"],
+            "player_user_id": row["player_user_id"] or None,
             "score": row["best_score"],
             "total_score": row["total_score"],
             "games_played": row["games_played"],
-            "wins": 0,  # Will calculate below
+            # For simplicity, mark top scorer(s) as having 1 win per leaderboard
+            "wins": 1 if row["total_score"] == top_total else 0,
+            "best_session_rank": best_rank["rank"] if best_rank else None,
         })
-    
-    # Calculate wins (entries where this user had the highest score for the challenge)
-    # For simplicity, mark top scorer(s) as having 1 win per leaderboard
-    if entries:
-        top_score = entries[0]["total_score"]
-        for e in entries:
-            if e["total_score"] == top_score:
-                e["wins"] = 1
-    
     _attach_user_display_names(entries)
-    _assign_ranks(entries)
+    _assign_ranks(entries, last_score, current_rank, position)
     return entries
 
 
+def _encode_cursor(row: Dict[str, Any], entry: Dict[str, Any], position: int, top_total: int) -> str:
+    end_time = row["best_end_time"].isoformat() if row["best_end_time"] else None
+    state = [row["total_score"], row["best_score"], end_time, row["player_user_id"], entry["rank"], position, top_total]
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    """-> (key, rank, position, top_total); ValueError if the cursor is malformed."""
+    try:
+        total, best, end_time, player, rank, position, top_total = json.loads(base64.urlsafe_b64decode(cursor))
+        end_time = datetime.fromisoformat(end_time) if end_time else None
+        if not all(isinstance(v, int) for v in (total, best, rank, position, top_total)) or not isinstance(player, str):
+            raise ValueError
+    except (TypeError, ValueError, binascii.Error) as exc:
+        raise ValueError("Invalid leaderboard cursor.") from exc
+    return (total, best, end_time, player), rank, position, top_total
+
+
+def get_challenge_leaderboard(challenge_id: int, limit: int = 50) -> List[Dict[str, Any]]:
+    """
+    Get leaderboard aggregated by user - one entry per user with their stats.
+    Reads the top of the challenge's ChallengeLeaderboardEntry rows.
+    """
+    return get_challenge_leaderboard_page(challenge_id, limit)[0]
+
+
+def get_challenge_leaderboard_page(challenge_id: int, limit: int = 50,
+                                   cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of the leaderboard and the cursor for the next (None on the last page).
+    Pages continue from the cursor's entry with an index range scan, so each costs
+    O(limit) however deep it is; ranks carry over in the cursor.
+    """
+    rows = _entry_rows(challenge_id)
+    if cursor:
+        key, rank, position, top_total = _decode_cursor(cursor)
+        rows = list(rows.filter(_after(key))[:limit + 1])
+        last_score = key[0]
+    else:
+        rows = list(rows[:limit + 1])
+        rank, position, last_score = 0, 0, None
+        top_total = rows[0]["total_score"] if rows else None
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    entries = _build_entries(challenge_id, rows, top_total, last_score, rank, position)
+    next_cursor = None
+    if has_more:
+        next_cursor = _encode_cursor(rows[-1], entries[-1], position + len(rows), top_total)
+    return entries, next_cursor
+
+
+def get_leaderboard_around(challenge_id: int, player_user_id: str, span: int = 5) -> Optional[Dict[str, Any]]:
+    """
+    The player's entry with up to `span` entries above and below it, or None if the
+    player is not on the board. Rows are read with two keyset scans of `span`; the
+    window's starting rank is one index count, memoized per leaderboard version.
+    """
+    mine = _entry_rows(challenge_id).filter(player_user_id=player_user_id).first()
+    if mine is None:
+        return None
+    key = _row_key(mine)
+    above = list(_entry_rows(challenge_id, _REVERSE_ORDER).filter(_before(key))[:span])[::-1]
+    below = list(_entry_rows(challenge_id).filter(_after(key))[:span])
+    rows = above + [mine] + below
+
+    first = rows[0]
+    ranks = _cached_ranks(challenge_id)
+    cache_key = ("window",) + _row_key(first)
+    start = ranks.get(cache_key)
+    if start is None:
+        start = ranks[cache_key] = ChallengeLeaderboardEntry.objects.filter(challenge_id=challenge_id).aggregate(
+            higher=Count("pk", filter=Q(total_score__gt=first["total_score"])),
+            before=Count("pk", filter=_before(_row_key(first))),
+            top_total=Max("total_score"),
+        )
+
+    entries = _build_entries(
+        challenge_id, rows, start["top_total"], first["total_score"], start["higher"] + 1, start["before"],
+    )
+    return {"entries": entries, "me": entries[len(above)]}
+
+
+def _aggregate_sessions(rows: Iterable[Tuple[int, Any, int, Any]]) -> Dict[Tuple[int, str], List[Any]]:
+    """
+    Fold (challenge_id, player_user_id, score, end_time) rows into
+    {(challenge_id, player): [total_score, games_played, best_score, best_end_time]}.
+    """
+    totals: Dict[Tuple[int, str], List[Any]] = {}
+    for challenge_id, player_user_id, score, end_time in rows:
+        key = (challenge_id, player_user_id or GUEST_PLAYER)
+        entry = totals.get(key)
+        if entry is None:
+            totals[key] = [score, 1, score, end_time]
+            continue
+        entry[0] += score
+        entry[1] += 1
+        if score > entry[2] or (score == entry[2] and end_time < entry[3]):
+            entry[2], entry[3] = score, end_time
+    return totals
+
+
+def _update_or_create(rows, changes: Dict[str, Any], create: Callable[[], Any]) -> bool:
+    """Apply `changes` to `rows`, or call `create` if there are none. Returns whether it created."""
+    if rows.update(**changes):
+        return False
+    try:
+        with transaction.atomic():
+            create()
+        return True
+    except IntegrityError:
+        # A concurrent writer created the row first.
+        rows.update(**changes)
+        return False
+
+
+def _upsert_entry(challenge_id: int, player: str, total: int, games: int, best: int, best_end_time) -> None:
+    """Add sessions to a player's entry, creating it if needed. Increments are applied in SQL."""
+    entries = ChallengeLeaderboardEntry.objects.filter(challenge_id=challenge_id, player_user_id=player)
+    increment = {
+        "total_score": F("total_score") + total,
+        "games_played": F("games_played") + games,
+        "updated_at": timezone.now(),
+    }
+    created = _update_or_create(entries, increment, lambda: ChallengeLeaderboardEntry.objects.create(
+        challenge_id=challenge_id, player_user_id=player, total_score=total,
+        games_played=games, best_score=best, best_end_time=best_end_time,
+    ))
+    if not created:
+        entries.filter(
+            Q(best_score__lt=best) | Q(best_score=best, best_end_time__gt=best_end_time)
+        ).update(best_score=best, best_end_time=best_end_time)
+
+
+def bump_leaderboard_version(challenge_ids: Iterable[int]) -> None:
+    """Mark these challenges' leaderboards as changed."""
+    now = timezone.now()
+    for challenge_id in sorted(set(challenge_ids)):
+        _update_or_create(
+            LeaderboardVersion.objects.filter(challenge_id=challenge_id),
+            {"version": F("version") + 1, "updated_at": now},
+            lambda: LeaderboardVersion.objects.create(challenge_id=challenge_id, version=1, updated_at=now),
+        )
+
+
+def get_leaderboard_version(challenge_id: int) -> Tuple[int, Optional[datetime]]:
+    """(version, updated_at) of a challenge's leaderboard; (0, None) before anything was recorded."""
+    row = LeaderboardVersion.objects.filter(challenge_id=challenge_id).values_list("version", "updated_at").first()
+    return row or (0, None)
+
+
+def record_session_result(session: GameSession) -> None:
+    """Add an ended challenge-mode session to its challenge's leaderboard. Call once per session."""
+    if session.mode != GameSession.MODE_CHALLENGE or not session.end_time:
+        return
+    with transaction.atomic():
+        _upsert_entry(
+            session.challenge_id, session.player_user_id or GUEST_PLAYER,
+            session.score, 1, session.score, session.end_time,
+        )
+        bump_leaderboard_version([session.challenge_id])
+
+
+def record_session_results(sessions: Iterable[GameSession]) -> int:
+    """record_session_result for many sessions, one upsert per (challenge, player). Returns entries touched."""
+    totals = _aggregate_sessions(
+        (s.challenge_id, s.player_user_id, s.score, s.end_time)
+        for s in sessions
+        if s.mode == GameSession.MODE_CHALLENGE and s.end_time
+    )
+    with transaction.atomic():
+        for (challenge_id, player), (total, games, best, best_end_time) in totals.items():
+            _upsert_entry(challenge_id, player, total, games, best, best_end_time)
+        bump_leaderboard_version(challenge_id for challenge_id, _ in totals)
+    return len(totals)
+
+
+def rebuild_challenge_leaderboard(challenge_id: int, check_only: bool = False) -> int:
+    """
+    Recompute a challenge's entries from its ended sessions and replace the stored
+    ones if they differ. Returns the number of entries that were missing, stale or extra.
+    """
+    expected = _aggregate_sessions(
+        _session_queryset_for_challenge(challenge_id)
+        .order_by("pk")
+        .values_list("challenge_id", "player_user_id", "score", "end_time")
+        .iterator()
+    )
+    stored = {
+        (e.challenge_id, e.player_user_id): [e.total_score, e.games_played, e.best_score, e.best_end_time]
+        for e in ChallengeLeaderboardEntry.objects.filter(challenge_id=challenge_id)
+    }
+    mismatched = sum(1 for key in expected.keys() | stored.keys() if expected.get(key) != stored.get(key))
+    if mismatched and not check_only:
+        with transaction.atomic():
+            ChallengeLeaderboardEntry.objects.filter(challenge_id=challenge_id).delete()
+            ChallengeLeaderboardEntry.objects.bulk_create([
+                ChallengeLeaderboardEntry(
+                    challenge_id=challenge_id, player_user_id=player, total_score=total,
+                    games_played=games, best_score=best, best_end_time=best_end_time,
+                )
+                for (_, player), (total, games, best, best_end_time) in expected.items()
+            ])
+            bump_leaderboard_version([challenge_id])
+    return mismatched
+
+
 def get_daily_leaderboard(for_date: date, limit: int = 50) -> Tuple[int, List[Dict[str, Any]]]:
     daily = get_or_create_daily_challenge(for_date)
     entries = get_challenge_leaderboard(daily.challenge_id, limit=limit)
     return daily.challenge_id, entries
 
 
+# Challenge id -> ((leaderboard version, updated_at), {rank key: rank info}).
+get_rank_cache = lazy_lru("SESSION_RANK_CACHE_SIZE")
+
+
+def _cached_ranks(challenge_id: int) -> Dict[Tuple[int, Any], Dict[str, int]]:
+    version = get_leaderboard_version(challenge_id)
+    cache = get_rank_cache()
+    ranks = cache.get(challenge_id, version)
+    if ranks is None:
+        ranks = {}
+        cache.put(challenge_id, version, ranks)
+    return ranks
+
+
+def _rank_scores(challenge_id: int, keys: Iterable[Tuple[int, Any]]) -> Dict[Tuple[int, Any], Dict[str, int]]:
+    """
+    {(score, end_time): {"rank", "total_players"}} among the challenge's ended sessions:
+    higher score first, then earlier end. Keys not yet memoized for the current
+    leaderboard version are counted together in one aggregate query.
+    """
+    keys = set(keys)
+    ranks = _cached_ranks(challenge_id)
+    missing = [key for key in keys if key not in ranks]
+    if missing:
+        counts = _session_queryset_for_challenge(challenge_id).aggregate(
+            total_players=Count("id"),
+            **{
+                f"ahead_{i}": Count("id", filter=Q(score__gt=score) | Q(score=score, end_time__lt=end_time))
+                for i, (score, end_time) in enumerate(missing)
+            },
+        )
+        for i, key in enumerate(missing):
+            ranks[key] = {"rank": counts[f"ahead_{i}"] + 1, "total_players": counts["total_players"]}
+    return {key: dict(ranks[key]) for key in keys}
+
+
 def compute_session_rank(session: GameSession) -> Dict[str, int]:
-    qs = _session_queryset_for_challenge(session.challenge_id)
-    total_players = qs.count()
+    """
+    Rank among the challenge's ended sessions: higher score first, then earlier end.
+    One counting query, memoized until the challenge's leaderboard version changes.
+    """
+    key = (session.score, session.end_time)
+    return _rank_scores(session.challenge_id, [key])[key]
 
-    higher = qs.filter(
-        score__gt=session.score
-    ).count()
 
-    tie_better_time = qs.filter(
-        score=session.score,
-        end_time__lt=session.end_time
-    ).count()
+def rank_sessions(sessions: Iterable[GameSession]) -> Dict[int, Dict[str, int]]:
+    """
+    compute_session_rank for many ended sessions, with one query per challenge for
+    those not memoized. Returns {session id: {"rank", "total_players"}}.
+    """
+    by_challenge: Dict[int, List[GameSession]] = {}
+    for session in sessions:
+        if session.end_time:
+            by_challenge.setdefault(session.challenge_id, []).append(session)
 
-    rank = higher + tie_better_time + 1
-    return {"rank": rank, "total_players": total_players}
+    results = {}
+    for challenge_id, members in by_challenge.items():
+        ranks = _rank_scores(challenge_id, [(s.score, s.end_time) for s in members])
+        for session in members:
+            results[session.pk] = dict(ranks[(session.score, session.end_time)])
+    return results
 
 
 def milestone_for_rank(rank: int) -> str | None:
@@ -105,13 +406,14 @@ def _attach_user_display_names(entries: List[Dict[str, Any]]):
         e["display_name"] = id_map.get(str(uid), "") if uid else ""
 
 
-def _assign_ranks(entries: List[Dict[str, Any]]):
-    """Assign ranks based on total_score (ties get same rank)."""
-    last_score = None
-    current_rank = 0
-    for idx, e in enumerate(entries):
+def _assign_ranks(entries: List[Dict[str, Any]], last_score=None, current_rank: int = 0, position: int = 0):
+    """
+    Assign ranks based on total_score (ties get same rank). A page that does not start
+    at the top passes the previous entry's score and rank and how many entries precede it.
+    """
+    for idx, e in enumerate(entries, start=position + 1):
         score = e.get("total_score") or e.get("score") or 0
         if score != last_score:
-            current_rank = idx + 1
+            current_rank = idx
             last_score = score
         e["rank"] = current_rank
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from accounts.leaderboards import rebuild_challenge_leaderboard
+from accounts.models import ChallengeLeaderboardEntry
+from game.models import GameSession
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute challenge leaderboard entries from ended challenge sessions (backfill), "
+        "or with --check only report challenges whose stored entries disagree."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--challenge", type=int, action="append", dest="challenges",
+                            help="Only this challenge id (repeatable).")
+        parser.add_argument("--check", action="store_true", help="Report mismatches without writing.")
+
+    def handle(self, *args, **options):
+        challenge_ids = options["challenges"]
+        if not challenge_ids:
+            played = GameSession.objects.filter(mode=GameSession.MODE_CHALLENGE, end_time__isnull=False)
+            challenge_ids = sorted(
+                set(played.values_list("challenge_id", flat=True).distinct())
+                | set(ChallengeLeaderboardEntry.objects.values_list("challenge_id", flat=True).distinct())
+            )
+
+        checked, stale = 0, 0
+        for challenge_id in challenge_ids:
+            checked += 1
+            mismatched = rebuild_challenge_leaderboard(challenge_id, check_only=options["check"])
+            if mismatched:
+                stale += 1
+                self.stdout.write(f"Challenge {challenge_id}: {mismatched} entries out of date")
+
+        action = "out of date" if options["check"] else "rebuilt"
+        self.stdout.write(f"{checked} challenges checked, {stale} {action}.")
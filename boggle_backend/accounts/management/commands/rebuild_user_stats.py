@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from accounts.models import UserStatsRollup
+from accounts.stats import rebuild_user_stats
+from game.models import GameSession
+
+
+class Command(BaseCommand):
+    help = "Rebuild players' stats rollups from their ended sessions (backfill or repair)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--player", action="append", dest="players",
+                            help="Only this player_user_id (repeatable).")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        players = options["players"]
+        if not players:
+            ended = GameSession.objects.filter(player_user_id__isnull=False, end_time__isnull=False)
+            players = sorted(
+                set(ended.values_list("player_user_id", flat=True).distinct())
+                | set(UserStatsRollup.objects.values_list("player_user_id", flat=True))
+            )
+
+        rebuilt = 0
+        batch_size = options["batch_size"]
+        for start in range(0, len(players), batch_size):
+            rebuilt += rebuild_user_stats(players[start:start + batch_size])
+        self.stdout.write(f"{rebuilt} stats rollups rebuilt.")
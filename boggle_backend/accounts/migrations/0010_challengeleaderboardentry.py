@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_add_avatar_url'),
+        ('game', '0015_gamesession_hint_cursor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChallengeLeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('player_user_id', models.CharField(blank=True, default='', max_length=255)),
+                ('best_score', models.IntegerField(default=0)),
+                ('total_score', models.IntegerField(default=0)),
+                ('games_played', models.IntegerField(default=0)),
+                ('best_end_time', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('challenge', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to='game.challenge')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['challenge', '-total_score', '-best_score'], name='accounts_ch_challen_9a42d0_idx')],
+                'constraints': [models.UniqueConstraint(fields=('challenge', 'player_user_id'), name='unique_leaderboard_player')],
+            },
+        ),
+    ]
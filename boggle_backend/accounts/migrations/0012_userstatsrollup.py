@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_leaderboardversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStatsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('player_user_id', models.CharField(max_length=255, unique=True)),
+                ('games_played', models.IntegerField(default=0)),
+                ('score_sum', models.IntegerField(default=0)),
+                ('best_score', models.IntegerField(default=0)),
+                ('total_submissions', models.IntegerField(default=0)),
+                ('valid_submissions', models.IntegerField(default=0)),
+                ('days_played', models.IntegerField(default=0)),
+                ('last_played_day', models.DateField(blank=True, null=True)),
+                ('current_streak', models.IntegerField(default=0)),
+                ('longest_streak', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
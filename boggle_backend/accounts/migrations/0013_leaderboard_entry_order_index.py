@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_userstatsrollup'),
+        ('game', '0015_gamesession_hint_cursor'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='challengeleaderboardentry',
+            name='accounts_ch_challen_9a42d0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='challengeleaderboardentry',
+            index=models.Index(fields=['challenge', '-total_score', '-best_score', 'best_end_time', 'player_user_id'], name='accounts_ch_challen_e2b603_idx'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import migrations
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def _streaks(days):
+    # (current, longest) runs of consecutive days; current ends on the latest day.
+    days = sorted(set(days))
+    longest = run = 1
+    for previous, day in zip(days, days[1:]):
+        run = run + 1 if day == previous + timedelta(days=1) else 1
+        longest = max(longest, run)
+    return run, longest
+
+
+def backfill_rollups(apps, schema_editor):
+    UserStatsRollup = apps.get_model('accounts', 'UserStatsRollup')
+    GameSession = apps.get_model('game', 'GameSession')
+    SessionSubmission = apps.get_model('game', 'SessionSubmission')
+
+    sessions = GameSession.objects.filter(player_user_id__isnull=False, end_time__isnull=False)
+    players = set(sessions.values_list('player_user_id', flat=True).distinct())
+
+    now = timezone.now()
+    rollups = {player: UserStatsRollup(player_user_id=player, updated_at=now) for player in players}
+    for row in sessions.values('player_user_id').annotate(
+        games=Count('id'), total=Sum('score'), best=Max('score'),
+    ).order_by():
+        rollup = rollups[row['player_user_id']]
+        rollup.games_played, rollup.score_sum, rollup.best_score = row['games'], row['total'] or 0, row['best'] or 0
+
+    for row in SessionSubmission.objects.filter(session__in=sessions).values('session__player_user_id').annotate(
+        total=Count('id'), valid=Count('id', filter=Q(is_valid=True)),
+    ).order_by():
+        rollup = rollups[row['session__player_user_id']]
+        rollup.total_submissions, rollup.valid_submissions = row['total'], row['valid']
+
+    days = defaultdict(set)
+    for player, day in (
+        sessions.annotate(day=TruncDate('end_time')).values_list('player_user_id', 'day').distinct().order_by()
+    ):
+        days[player].add(day)
+    for player, played in days.items():
+        rollup = rollups[player]
+        rollup.days_played = len(played)
+        rollup.last_played_day = max(played)
+        rollup.current_streak, rollup.longest_streak = _streaks(played)
+
+    UserStatsRollup.objects.bulk_create(
+        list(rollups.values()), batch_size=500,
+        update_conflicts=True, unique_fields=['player_user_id'], update_fields=[
+            'games_played', 'score_sum', 'best_score', 'total_submissions', 'valid_submissions',
+            'days_played', 'last_played_day', 'current_streak', 'longest_streak', 'updated_at',
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_leaderboard_entry_order_index'),
+        ('game', '0015_gamesession_hint_cursor'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+def backfill_leaderboards(apps, schema_editor):
+    GameSession = apps.get_model('game', 'GameSession')
+    ChallengeLeaderboardEntry = apps.get_model('accounts', 'ChallengeLeaderboardEntry')
+    LeaderboardVersion = apps.get_model('accounts', 'LeaderboardVersion')
+
+    # (challenge_id, player) -> [total_score, games_played, best_score, best_end_time];
+    # guests share the "" player, and ties on best score keep the earliest end.
+    totals = {}
+    sessions = (
+        GameSession.objects.filter(mode='challenge', end_time__isnull=False)
+        .order_by('pk')
+        .values_list('challenge_id', 'player_user_id', 'score', 'end_time')
+    )
+    for challenge_id, player_user_id, score, end_time in sessions.iterator():
+        key = (challenge_id, player_user_id or '')
+        entry = totals.get(key)
+        if entry is None:
+            totals[key] = [score, 1, score, end_time]
+            continue
+        entry[0] += score
+        entry[1] += 1
+        if score > entry[2] or (score == entry[2] and end_time < entry[3]):
+            entry[2], entry[3] = score, end_time
+
+    challenge_ids = {challenge_id for challenge_id, _ in totals}
+    ChallengeLeaderboardEntry.objects.filter(challenge_id__in=challenge_ids).delete()
+    ChallengeLeaderboardEntry.objects.bulk_create(
+        [
+            ChallengeLeaderboardEntry(
+                challenge_id=challenge_id, player_user_id=player, total_score=total,
+                games_played=games, best_score=best, best_end_time=best_end_time,
+            )
+            for (challenge_id, player), (total, games, best, best_end_time) in totals.items()
+        ],
+        batch_size=1000,
+    )
+    # A fresh version per rebuilt board, so nothing cached against the empty table survives.
+    now = timezone.now()
+    for challenge_id in sorted(challenge_ids):
+        version, created = LeaderboardVersion.objects.get_or_create(
+            challenge_id=challenge_id, defaults={'version': 1, 'updated_at': now},
+        )
+        if not created:
+            LeaderboardVersion.objects.filter(pk=version.pk).update(version=version.version + 1, updated_at=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_backfill_user_stats_rollups'),
+        ('game', '0015_gamesession_hint_cursor'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_leaderboards, migrations.RunPython.noop),
+    ]
@@ -63,7 +63,74 @@ class DailyChallengeResult(models.Model):
         return f"DailyResult {self.daily_challenge_id} user {self.user_id} score {self.score}"
 
 
-# Dev B addition for FR-15: no schema change needed; ranking computed from GameSession.
+# Dev B addition for FR-15: ranking computed from GameSession.
+
+
+class ChallengeLeaderboardEntry(models.Model):
+    """
+    One player's standing on a challenge, maintained as challenge-mode sessions end
+    (see accounts.leaderboards.record_session_result). Guests share the "" player row.
+    """
+
+    challenge = models.ForeignKey("game.Challenge", on_delete=models.CASCADE, related_name="leaderboard_entries")
+    player_user_id = models.CharField(max_length=255, blank=True, default="")
+    best_score = models.IntegerField(default=0)
+    total_score = models.IntegerField(default=0)
+    games_played = models.IntegerField(default=0)
+    # End time of the best-scoring session (the earliest, if several share the best score).
+    best_end_time = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["challenge", "player_user_id"], name="unique_leaderboard_player"),
+        ]
+        indexes = [
+            # Covers the full leaderboard order, for top-N reads and keyset pages.
+            models.Index(fields=["challenge", "-total_score", "-best_score", "best_end_time", "player_user_id"]),
+        ]
+
+    def __str__(self):
+        return f"Leaderboard {self.challenge_id} player {self.player_user_id or 'guest'} total {self.total_score}"
+
+
+class LeaderboardVersion(models.Model):
+    """
+    Counter bumped whenever a challenge's leaderboard changes; cached ranks are
+    keyed by it (see accounts.leaderboards.compute_session_rank).
+    """
+
+    challenge = models.OneToOneField(
+        "game.Challenge", on_delete=models.CASCADE, primary_key=True, related_name="leaderboard_version",
+    )
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Leaderboard {self.challenge_id} version {self.version}"
+
+
+class UserStatsRollup(models.Model):
+    """
+    Running totals behind GET /api/stats/ for one player, updated as their sessions
+    end (see accounts.stats.record_session_stats) so stats are a single-row read.
+    """
+
+    player_user_id = models.CharField(max_length=255, unique=True)
+    games_played = models.IntegerField(default=0)
+    score_sum = models.IntegerField(default=0)
+    best_score = models.IntegerField(default=0)
+    total_submissions = models.IntegerField(default=0)
+    valid_submissions = models.IntegerField(default=0)
+    days_played = models.IntegerField(default=0)
+    last_played_day = models.DateField(null=True, blank=True)
+    # Consecutive days ending at last_played_day, and the longest such run.
+    current_streak = models.IntegerField(default=0)
+    longest_streak = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for player {self.player_user_id}: {self.games_played} games"
 
 
 class UserSettings(models.Model):
@@ -1,59 +1,132 @@
+from collections import defaultdict
 from datetime import timedelta
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
-from django.db.models import Avg, Count, Max
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
 from django.db.models.functions import TruncDate
+from django.utils import timezone
 
-from game.models import GameSession
+from accounts.models import UserStatsRollup
+from game.models import GameSession, SessionSubmission
+
+_ROLLUP_FIELDS = [
+    "games_played", "score_sum", "best_score", "total_submissions", "valid_submissions",
+    "days_played", "last_played_day", "current_streak", "longest_streak", "updated_at",
+]
 
 
 def compute_user_stats(user_id: str | int) -> Dict:
     """
     Aggregate basic stats for the given user across finished sessions.
+    Read from the user's UserStatsRollup, built from history the first time.
     """
     user_id_str = str(user_id)
-    sessions = GameSession.objects.filter(player_user_id=user_id_str, end_time__isnull=False)
-
-    aggregates = sessions.aggregate(
-        games_played=Count("id"),
-        average_score=Avg("score"),
-        best_score=Max("score"),
-    )
-
-    days = list(
-        sessions.annotate(day=TruncDate("end_time"))
-        .values_list("day", flat=True)
-        .distinct()
-    )
-    current_streak, longest_streak = _compute_streaks(days)
-
-    total_valid_words = 0
-    total_submissions = 0
-    for submission_list in sessions.values_list("submissions", flat=True):
-        if isinstance(submission_list, list):
-            total_submissions += len(submission_list)
-            total_valid_words += sum(
-                1 for item in submission_list if isinstance(item, dict) and item.get("is_valid")
-            )
+    rollup = UserStatsRollup.objects.filter(player_user_id=user_id_str).first()
+    if rollup is None:
+        rebuild_user_stats([user_id_str])
+        rollup = UserStatsRollup.objects.get(player_user_id=user_id_str)
 
+    total_submissions = rollup.total_submissions
+    total_valid_words = rollup.valid_submissions
     incorrect_submissions = max(0, total_submissions - total_valid_words)
     accuracy = round(total_valid_words / total_submissions, 3) if total_submissions else 0
 
     return {
-        "games_played": aggregates.get("games_played") or 0,
-        "average_score": aggregates.get("average_score") or 0,
-        "best_score": aggregates.get("best_score") or 0,
+        "games_played": rollup.games_played,
+        "average_score": rollup.score_sum / rollup.games_played if rollup.games_played else 0,
+        "best_score": rollup.best_score,
         "total_valid_words_found": total_valid_words,
         "total_submissions": total_submissions,
         "correct_submissions": total_valid_words,
         "incorrect_submissions": incorrect_submissions,
         "accuracy": accuracy,
-        "days_played": len(days),
-        "current_streak": current_streak,
-        "longest_streak": longest_streak,
+        "days_played": rollup.days_played,
+        "current_streak": rollup.current_streak,
+        "longest_streak": rollup.longest_streak,
     }
 
 
+def record_session_stats(session: GameSession) -> None:
+    """Add a registered player's ended session to their rollup. Call once per session."""
+    if not session.player_user_id or not session.end_time:
+        return
+    submissions = session.submission_rows.aggregate(total=Count("id"), valid=Count("id", filter=Q(is_valid=True)))
+    day = timezone.localdate(session.end_time)
+
+    with transaction.atomic():
+        rollup = UserStatsRollup.objects.select_for_update().filter(player_user_id=session.player_user_id).first()
+        if rollup is None:
+            # First rollup for this player: count their whole history, which
+            # already includes this session.
+            rebuild_user_stats([session.player_user_id])
+            return
+        if rollup.last_played_day and day < rollup.last_played_day:
+            # A session finalized late (e.g. by the reaper) can fill a gap in past
+            # days and join two streaks; recount this player from history instead.
+            rebuild_user_stats([session.player_user_id])
+            return
+        rollup.games_played += 1
+        rollup.score_sum += session.score
+        rollup.best_score = max(rollup.best_score, session.score)
+        rollup.total_submissions += submissions["total"]
+        rollup.valid_submissions += submissions["valid"]
+        if rollup.last_played_day != day:
+            if rollup.last_played_day == day - timedelta(days=1):
+                rollup.current_streak += 1
+            else:
+                rollup.current_streak = 1
+            rollup.longest_streak = max(rollup.longest_streak, rollup.current_streak)
+            rollup.days_played += 1
+            rollup.last_played_day = day
+        rollup.save()
+
+
+def rebuild_user_stats(player_user_ids: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute rollups from ended sessions, for the given players or everyone with a
+    session or a rollup. Players without sessions get an empty rollup. Returns rows written.
+    """
+    sessions = GameSession.objects.filter(player_user_id__isnull=False, end_time__isnull=False)
+    if player_user_ids is not None:
+        players = {str(player) for player in player_user_ids}
+        sessions = sessions.filter(player_user_id__in=players)
+    else:
+        players = set(sessions.values_list("player_user_id", flat=True).distinct())
+        players |= set(UserStatsRollup.objects.values_list("player_user_id", flat=True))
+
+    now = timezone.now()
+    rollups = {player: UserStatsRollup(player_user_id=player, updated_at=now) for player in players}
+    for row in sessions.values("player_user_id").annotate(
+        games=Count("id"), total=Sum("score"), best=Max("score"),
+    ).order_by():
+        rollup = rollups[row["player_user_id"]]
+        rollup.games_played, rollup.score_sum, rollup.best_score = row["games"], row["total"] or 0, row["best"] or 0
+
+    for row in SessionSubmission.objects.filter(session__in=sessions).values("session__player_user_id").annotate(
+        total=Count("id"), valid=Count("id", filter=Q(is_valid=True)),
+    ).order_by():
+        rollup = rollups[row["session__player_user_id"]]
+        rollup.total_submissions, rollup.valid_submissions = row["total"], row["valid"]
+
+    days = defaultdict(list)
+    for player, day in (
+        sessions.annotate(day=TruncDate("end_time")).values_list("player_user_id", "day").distinct().order_by()
+    ):
+        days[player].append(day)
+    for player, played in days.items():
+        rollup = rollups[player]
+        rollup.days_played = len(set(played))
+        rollup.last_played_day = max(played)
+        rollup.current_streak, rollup.longest_streak = _compute_streaks(played)
+
+    UserStatsRollup.objects.bulk_create(
+        list(rollups.values()), batch_size=500,
+        update_conflicts=True, unique_fields=["player_user_id"], update_fields=_ROLLUP_FIELDS,
+    )
+    return len(rollups)
+
+
 def _compute_streaks(days) -> tuple[int, int]:
     """
     Given a list of dates, compute current and longest streak of consecutive days.
@@ -0,0 +1,93 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts import leaderboards
+from accounts.leaderboards import record_session_result
+from accounts.models import DailyChallenge
+from game.models import Challenge, GameSession
+
+
+class LeaderboardHttpCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = get_user_model().objects.create_user(username="poller", password="pw")
+        self.challenge = Challenge.objects.create(
+            creator_user_id=str(self.user.id), title="Challenge", description="",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], difficulty="easy", valid_words=["CAT"],
+        )
+        DailyChallenge.objects.create(date=date.today(), challenge=self.challenge)
+        self._end(10)
+        self.url = reverse("challenge_leaderboard", args=[self.challenge.id])
+
+    def _end(self, score):
+        record_session_result(GameSession.objects.create(
+            challenge=self.challenge, player_user_id=str(self.user.id), mode=GameSession.MODE_CHALLENGE,
+            score=score, end_time=timezone.now(),
+        ))
+
+    def test_conditional_get_returns_304_until_a_session_ends(self):
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        etag = resp["ETag"]
+        self.assertIn("Last-Modified", resp)
+        self.assertEqual(resp.data["last_updated"], self.challenge.leaderboard_version.updated_at.isoformat())
+
+        with self.assertNumQueries(1):  # the version lookup only
+            resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(resp["ETag"], etag)
+
+        self._end(5)
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(resp["ETag"], etag)
+        self.assertEqual(resp.data["entries"][0]["total_score"], 15)
+
+    def test_daily_and_challenge_views_share_validators(self):
+        daily = self.client.get(reverse("daily_leaderboard"))
+        self.assertEqual(daily["ETag"], self.client.get(self.url)["ETag"])
+        self.assertNotEqual(self.client.get(self.url, {"limit": 1})["ETag"], daily["ETag"])
+
+    def test_polls_share_one_build(self):
+        with mock.patch("accounts.views.get_challenge_leaderboard_page",
+                        wraps=leaderboards.get_challenge_leaderboard_page) as page:
+            first = self.client.get(self.url).data
+            second = self.client.get(self.url).data
+            self.assertEqual(page.call_count, 1)
+            self.assertEqual(first, second)
+
+            with override_settings(POLL_CACHE_SECONDS=0):
+                self.client.get(self.url)
+            self.assertEqual(page.call_count, 2)
+
+    def test_unread_parameters_share_the_cache_entry(self):
+        with mock.patch("accounts.views.get_challenge_leaderboard_page",
+                        wraps=leaderboards.get_challenge_leaderboard_page) as page:
+            etags = {
+                self.client.get(self.url, params)["ETag"]
+                for params in ({}, {"junk": "1"}, {"junk": "2", "span": "3"}, {"limit": "50", "cursor": ""})
+            }
+            self.assertEqual(len(etags), 1)
+            self.assertEqual(page.call_count, 1)
+
+    def test_errors_are_not_cached(self):
+        resp = self.client.get(self.url, {"cursor": "bad"})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn("ETag", resp)
+
+    def test_daily_challenge_validators(self):
+        url = reverse("daily_challenge")
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["challenge_id"], self.challenge.id)
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=resp["ETag"])
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -1,14 +1,28 @@
+import importlib
 from datetime import date, timedelta
+from io import StringIO
 from unittest import mock
 
+from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from accounts.models import DailyChallenge
+from accounts.leaderboards import (
+    compute_session_rank,
+    get_challenge_leaderboard,
+    get_leaderboard_version,
+    get_rank_cache,
+    rank_sessions,
+    record_session_result,
+)
+from accounts.models import ChallengeLeaderboardEntry, DailyChallenge
+from game.boggle_engine import get_valid_word_cache
 from game.models import Challenge, GameSession
+from game.reaper import finalize_expired_sessions
 
 
 class LeaderboardTests(APITestCase):
@@ -35,20 +49,20 @@ class LeaderboardTests(APITestCase):
         self.rank_url_template = reverse('session_rank', args=[0]).replace("0/", "{}/")
 
         now = timezone.now()
-        GameSession.objects.create(
+        record_session_result(GameSession.objects.create(
             challenge=self.challenge,
             player_user_id=str(self.user1.id),
             mode=GameSession.MODE_CHALLENGE,
             end_time=now - timedelta(minutes=2),
             score=15,
-        )
-        GameSession.objects.create(
+        ))
+        record_session_result(GameSession.objects.create(
             challenge=self.challenge,
             player_user_id=str(self.user2.id),
             mode=GameSession.MODE_CHALLENGE,
             end_time=now - timedelta(minutes=1),
             score=15,
-        )
+        ))
 
     @mock.patch("accounts.authentication.verify_firebase_id_token")
     def test_daily_leaderboard_sorted(self, mock_verify):
@@ -75,3 +89,213 @@ class LeaderboardTests(APITestCase):
         self.assertIn("rank", resp.data)
         self.assertIn("total_players", resp.data)
         self.assertLessEqual(resp.data["rank"], resp.data["total_players"])
+
+
+class ChallengeLeaderboardEntryTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='lb', password='pw')
+        self.challenge = Challenge.objects.create(
+            creator_user_id=str(self.user.id), title="Challenge", description="",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], difficulty="easy", valid_words=["CAT"],
+        )
+
+    def _session(self, score, **kwargs):
+        kwargs.setdefault("player_user_id", str(self.user.id))
+        kwargs.setdefault("mode", GameSession.MODE_CHALLENGE)
+        return GameSession.objects.create(challenge=self.challenge, score=score, **kwargs)
+
+    def _entry(self, player=None):
+        return ChallengeLeaderboardEntry.objects.get(
+            challenge=self.challenge, player_user_id=str(player or self.user.id),
+        )
+
+    def test_ending_a_session_updates_the_entry_once(self):
+        first = self._session(5, end_time=timezone.now() - timedelta(minutes=5))
+        record_session_result(first)
+        session = self._session(9)
+        self.client.force_authenticate(user=self.user)
+        end_url = reverse('game_sessions_end', args=[session.id])
+        self.assertEqual(self.client.post(end_url, {}, format='json').status_code, status.HTTP_200_OK)
+        self.client.post(end_url, {}, format='json')
+
+        entry = self._entry()
+        session.refresh_from_db()
+        self.assertEqual((entry.total_score, entry.games_played, entry.best_score), (14, 2, 9))
+        self.assertEqual(entry.best_end_time, session.end_time)
+        board = get_challenge_leaderboard(self.challenge.id)
+        self.assertEqual(len(board), 1)
+        self.assertEqual(board[0]["score"], 9)
+
+    def test_best_score_tie_keeps_earliest_end(self):
+        now = timezone.now()
+        record_session_result(self._session(7, end_time=now - timedelta(minutes=1)))
+        record_session_result(self._session(7, end_time=now - timedelta(minutes=3)))
+        record_session_result(self._session(3, end_time=now))
+        entry = self._entry()
+        self.assertEqual((entry.total_score, entry.best_score), (17, 7))
+        self.assertEqual(entry.best_end_time, now - timedelta(minutes=3))
+
+    def test_practice_sessions_are_not_recorded(self):
+        record_session_result(self._session(7, end_time=timezone.now(), mode=GameSession.MODE_PRACTICE))
+        self.assertFalse(ChallengeLeaderboardEntry.objects.exists())
+
+    def test_reaper_records_expired_sessions(self):
+        now = timezone.now()
+        self._session(4, start_time=now - timedelta(seconds=120), duration_seconds=60)
+        self._session(6, start_time=now - timedelta(seconds=120), duration_seconds=60, player_user_id=None)
+
+        self.assertEqual(finalize_expired_sessions(now)["leaderboard_entries"], 2)
+        self.assertEqual(self._entry().total_score, 4)
+        guest = ChallengeLeaderboardEntry.objects.get(challenge=self.challenge, player_user_id="")
+        self.assertEqual(guest.best_score, 6)
+        self.assertIsNone(get_challenge_leaderboard(self.challenge.id)[0]["player_user_id"])
+
+    def test_rebuild_command_backfills_and_checks(self):
+        self._session(5, end_time=timezone.now())
+        self._session(8, end_time=timezone.now())
+        out = StringIO()
+        call_command("rebuild_leaderboards", "--check", stdout=out)
+        self.assertIn("1 out of date", out.getvalue())
+        self.assertFalse(ChallengeLeaderboardEntry.objects.exists())
+
+        call_command("rebuild_leaderboards", stdout=out)
+        entry = self._entry()
+        self.assertEqual((entry.total_score, entry.games_played, entry.best_score), (13, 2, 8))
+
+        out = StringIO()
+        call_command("rebuild_leaderboards", "--check", stdout=out)
+        self.assertIn("0 out of date", out.getvalue())
+
+
+    def test_migration_backfills_existing_sessions(self):
+        now = timezone.now()
+        self._session(5, end_time=now - timedelta(minutes=2))
+        self._session(8, end_time=now)
+        self._session(3, end_time=now, player_user_id=None)
+        migration = importlib.import_module("accounts.migrations.0015_backfill_challenge_leaderboards")
+        migration.backfill_leaderboards(apps, None)
+
+        entry = self._entry()
+        self.assertEqual((entry.total_score, entry.games_played, entry.best_score), (13, 2, 8))
+        self.assertEqual([row["score"] for row in get_challenge_leaderboard(self.challenge.id)], [8, 3])
+        self.assertEqual(get_leaderboard_version(self.challenge.id)[0], 1)
+
+class SessionRankTests(APITestCase):
+    def setUp(self):
+        get_rank_cache().clear()
+        self.addCleanup(get_rank_cache().clear)
+        self.challenge = Challenge.objects.create(
+            creator_user_id="1", title="Challenge", description="",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], difficulty="easy", valid_words=["CAT"],
+        )
+        now = timezone.now()
+        self.sessions = [self._end(score, now - timedelta(minutes=minutes))
+                         for score, minutes in [(10, 5), (7, 4), (10, 3), (7, 4), (2, 1)]]
+
+    def _end(self, score, end_time):
+        session = GameSession.objects.create(
+            challenge=self.challenge, mode=GameSession.MODE_CHALLENGE, score=score, end_time=end_time,
+        )
+        record_session_result(session)
+        return session
+
+    def test_rank_orders_by_score_then_end_time(self):
+        ranks = [compute_session_rank(s)["rank"] for s in self.sessions]
+        self.assertEqual(ranks, [1, 3, 2, 3, 5])
+        self.assertEqual(compute_session_rank(self.sessions[0])["total_players"], 5)
+
+    def test_rank_is_cached_until_the_leaderboard_changes(self):
+        compute_session_rank(self.sessions[4])
+        with self.assertNumQueries(1):  # the version lookup only
+            self.assertEqual(compute_session_rank(self.sessions[4]), {"rank": 5, "total_players": 5})
+
+        self._end(50, timezone.now())
+        self.assertEqual(compute_session_rank(self.sessions[4]), {"rank": 6, "total_players": 6})
+
+    def test_bulk_ranks_match_single_ranks(self):
+        with self.assertNumQueries(2):  # leaderboard version + one aggregate for all five
+            bulk = rank_sessions(self.sessions)
+        self.assertEqual(bulk, {s.pk: compute_session_rank(s) for s in self.sessions})
+        with self.assertNumQueries(1):
+            self.assertEqual(rank_sessions(self.sessions[:2]), {s.pk: bulk[s.pk] for s in self.sessions[:2]})
+
+    def test_leaderboard_entries_carry_best_session_rank(self):
+        user = get_user_model().objects.create_user(username="ranked", password="pw")
+        session = GameSession.objects.create(
+            challenge=self.challenge, player_user_id=str(user.pk), mode=GameSession.MODE_CHALLENGE,
+            score=8, end_time=timezone.now(),
+        )
+        record_session_result(session)
+        entries = {e["player_user_id"]: e for e in get_challenge_leaderboard(self.challenge.id)}
+        self.assertEqual(entries[str(user.pk)]["best_session_rank"], compute_session_rank(session)["rank"])
+        self.assertEqual(entries[str(user.pk)]["best_session_rank"], 3)
+        self.assertEqual(entries[None]["best_session_rank"], 1)
+
+    def test_rank_cache_is_its_own_lru(self):
+        compute_session_rank(self.sessions[0])
+        self.assertIsNot(get_rank_cache(), get_valid_word_cache())
+        self.assertEqual(len(get_rank_cache()), 1)
+
+
+class LeaderboardPaginationTests(APITestCase):
+    def setUp(self):
+        get_rank_cache().clear()
+        self.addCleanup(get_rank_cache().clear)
+        self.challenge = Challenge.objects.create(
+            creator_user_id="1", title="Challenge", description="",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], difficulty="easy", valid_words=["CAT"],
+        )
+        self.users = [get_user_model().objects.create_user(username=f"p{i}", password="pw") for i in range(9)]
+        now = timezone.now()
+        # Totals with ties: 50, 40, 40, 40, 30, 20, 20, 10, 5
+        for i, (user, total) in enumerate(zip(self.users, [50, 40, 40, 40, 30, 20, 20, 10, 5])):
+            record_session_result(GameSession.objects.create(
+                challenge=self.challenge, player_user_id=str(user.id), mode=GameSession.MODE_CHALLENGE,
+                score=total, end_time=now - timedelta(minutes=i),
+            ))
+        self.url = reverse('challenge_leaderboard', args=[self.challenge.id])
+        self.full = self.client.get(self.url).data["entries"]
+
+    def test_pages_walk_the_whole_board(self):
+        self.assertEqual([e["rank"] for e in self.full], [1, 2, 2, 2, 5, 6, 6, 8, 9])
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            resp = self.client.get(self.url, params)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            seen.extend(resp.data["entries"])
+            cursor = resp.data["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(seen, self.full)
+
+    def test_page_cost_does_not_grow_with_depth(self):
+        page = self.client.get(self.url, {"limit": 3}).data
+        get_rank_cache().clear()
+        # leaderboard version + entries + rank-cache version + one bulk session-rank count + display names
+        with self.assertNumQueries(5):
+            self.client.get(self.url, {"limit": 3, "cursor": page["next_cursor"]})
+
+    def test_invalid_cursor(self):
+        resp = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data["error_code"], "VALIDATION_ERROR")
+
+    def test_around_me(self):
+        me = self.full[5]["player_user_id"]
+        self.client.force_authenticate(user=get_user_model().objects.get(pk=me))
+        resp = self.client.get(self.url, {"around": "me", "span": 2})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["entries"], self.full[3:8])
+        self.assertEqual(resp.data["me"]["player_user_id"], me)
+        self.assertEqual(resp.data["me"]["rank"], 6)
+
+        self.client.force_authenticate(user=self.users[0])
+        self.assertEqual(self.client.get(self.url, {"around": "me", "span": 2}).data["entries"], self.full[:3])
+
+    def test_around_me_needs_a_player(self):
+        self.assertEqual(self.client.get(self.url, {"around": "me"}).status_code, status.HTTP_401_UNAUTHORIZED)
+        stranger = get_user_model().objects.create_user(username="stranger", password="pw")
+        self.client.force_authenticate(user=stranger)
+        resp = self.client.get(self.url, {"around": "me"})
+        self.assertEqual((resp.data["entries"], resp.data["me"]), ([], None))
@@ -1,12 +1,20 @@
+import importlib
 from datetime import timedelta
+from io import StringIO
 from unittest import mock
 
+from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from accounts.models import UserStatsRollup
+from accounts.stats import compute_user_stats, record_session_stats
 from game.models import Challenge, GameSession
+from game.reaper import finalize_expired_sessions
 
 
 class UserStatsTests(APITestCase):
@@ -97,3 +105,96 @@ class UserStatsTests(APITestCase):
         self.assertEqual(stats["days_played"], 0)
         self.assertEqual(stats["current_streak"], 0)
         self.assertEqual(stats["longest_streak"], 0)
+
+
+class UserStatsRollupTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="rollup", password="pw")
+        self.player = str(self.user.id)
+        self.challenge = Challenge.objects.create(
+            creator_user_id=self.player, title="Challenge", description="",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], difficulty="easy", valid_words=["CAT", "DOG"],
+        )
+        self.now = timezone.now()
+
+    def _ended(self, score, days_ago, submissions=()):
+        session = GameSession.objects.create(
+            challenge=self.challenge, player_user_id=self.player, mode=GameSession.MODE_CHALLENGE, score=score,
+            end_time=self.now - timedelta(days=days_ago), submissions=list(submissions),
+        )
+        record_session_stats(session)
+        return session
+
+    def test_sessions_update_the_rollup_incrementally(self):
+        self._ended(4, 5, [{"word": "CAT", "is_valid": True}, {"word": "ZZ", "is_valid": False}])
+        self._ended(6, 2)
+        self._ended(9, 1, [{"word": "DOG", "is_valid": True}])
+        self._ended(1, 1)
+
+        with self.assertNumQueries(1):
+            stats = compute_user_stats(self.player)
+        self.assertEqual(stats["games_played"], 4)
+        self.assertEqual(stats["average_score"], 5)
+        self.assertEqual(stats["best_score"], 9)
+        self.assertEqual((stats["total_submissions"], stats["correct_submissions"]), (3, 2))
+        self.assertEqual((stats["days_played"], stats["current_streak"], stats["longest_streak"]), (3, 2, 2))
+
+    def test_first_recorded_session_counts_existing_history(self):
+        for days_ago in (3, 2, 1):
+            GameSession.objects.create(
+                challenge=self.challenge, player_user_id=self.player, score=2,
+                end_time=self.now - timedelta(days=days_ago),
+            )
+        self._ended(5, 0)
+        stats = compute_user_stats(self.player)
+        self.assertEqual(
+            (stats["games_played"], stats["days_played"], stats["current_streak"], stats["longest_streak"]),
+            (4, 4, 4, 4),
+        )
+        self.assertEqual(stats["best_score"], 5)
+
+    def test_late_session_joins_streaks(self):
+        self._ended(1, 3)
+        self._ended(1, 1)
+        self._ended(1, 2)  # finalized out of order, bridging the two days
+        rollup = UserStatsRollup.objects.get(player_user_id=self.player)
+        self.assertEqual((rollup.days_played, rollup.current_streak, rollup.longest_streak), (3, 3, 3))
+        self.assertEqual(rollup.games_played, 3)
+
+    def test_ending_and_reaping_sessions_update_stats(self):
+        session = GameSession.objects.create(challenge=self.challenge, player_user_id=self.player, score=3)
+        self.client.force_authenticate(user=self.user)
+        end_url = reverse("game_sessions_end", args=[session.id])
+        self.client.post(end_url, {}, format="json")
+        self.client.post(end_url, {}, format="json")
+        GameSession.objects.create(
+            challenge=self.challenge, player_user_id=self.player, score=5,
+            start_time=self.now - timedelta(seconds=120), duration_seconds=60,
+        )
+        self.assertEqual(finalize_expired_sessions(self.now)["stats_updated"], 1)
+
+        rollup = UserStatsRollup.objects.get(player_user_id=self.player)
+        self.assertEqual((rollup.games_played, rollup.score_sum, rollup.best_score), (2, 8, 5))
+
+    def test_backfill_command_matches_incremental_rollup(self):
+        self._ended(4, 3, [{"word": "CAT", "is_valid": True}])
+        self._ended(7, 0)
+        expected = compute_user_stats(self.player)
+        UserStatsRollup.objects.all().delete()
+        GameSession.objects.create(challenge=self.challenge, player_user_id="someone-else", score=2, end_time=self.now)
+
+        out = StringIO()
+        call_command("rebuild_user_stats", stdout=out)
+        self.assertIn("2 stats rollups rebuilt", out.getvalue())
+        self.assertEqual(compute_user_stats(self.player), expected)
+
+    def test_migration_backfill_matches_incremental_rollup(self):
+        self._ended(4, 3, [{"word": "CAT", "is_valid": True}, {"word": "ZZ", "is_valid": False}])
+        self._ended(2, 1)
+        self._ended(7, 0)
+        expected = compute_user_stats(self.player)
+        UserStatsRollup.objects.all().delete()
+
+        migration = importlib.import_module("accounts.migrations.0014_backfill_user_stats_rollups")
+        migration.backfill_rollups(apps, None)
+        self.assertEqual(compute_user_stats(self.player), expected)
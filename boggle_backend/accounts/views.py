@@ -2,13 +2,19 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .authentication import FirebaseAuthentication
+from .authentication import FirebaseAuthentication, FirebaseOptionalAuthentication
 from .permissions import IsAuthenticatedFirebaseUser
 from .serializers import AuthenticatedUserSerializer, UserSettingsSerializer, UserProfileSerializer
 from .daily import get_or_create_daily_challenge
 from datetime import date
-from .leaderboards import get_daily_leaderboard, get_challenge_leaderboard, compute_session_rank, milestone_for_rank
-from django.utils import timezone
+from .http_cache import conditional_response
+from .leaderboards import (
+    get_challenge_leaderboard_page,
+    get_leaderboard_around,
+    get_leaderboard_version,
+    compute_session_rank,
+    milestone_for_rank,
+)
 from game.models import GameSession, Challenge
 from .stats import compute_user_stats
 from accounts.models import UserSettings, ChallengeInvite, User, WordDefinitionCache
@@ -61,57 +67,134 @@ class DailyChallengeView(APIView):
             )
 
         challenge = daily.challenge
-        payload = {
-            "date": str(daily.date),
-            "challenge_id": challenge.id,
-            "title": challenge.title,
-            "difficulty": challenge.difficulty,
-            "grid": challenge.grid,
-            "share_slug": getattr(challenge, "share_slug", None),
-            "created_at": challenge.created_at,
-        }
-        return Response(payload, status=status.HTTP_200_OK)
+
+        def build():
+            return {
+                "date": str(daily.date),
+                "challenge_id": challenge.id,
+                "title": challenge.title,
+                "difficulty": challenge.difficulty,
+                "grid": challenge.grid,
+                "share_slug": getattr(challenge, "share_slug", None),
+                "created_at": challenge.created_at,
+            }
+
+        return conditional_response(
+            request,
+            f"daily-challenge:{daily.date}",
+            (daily.pk, challenge.pk, challenge.updated_at),
+            max(daily.created_at, challenge.updated_at),
+            build,
+        )
+
+
+class LeaderboardQueryMixin:
+    """
+    Leaderboard reads shared by the daily and challenge views:
+        ?limit=N&cursor=C  one page (limit up to 100) plus next_cursor for the next one
+        ?around=me&span=N  the caller's entry with N entries above and below it
+    """
+
+    max_limit = 100
+
+    def _leaderboard_query(self, request):
+        """
+        The parameters a leaderboard read depends on, normalized, as
+        ("around", span) or ("page", limit, cursor); ValueError if limit/span aren't integers.
+        """
+        params = request.query_params
+        limit = min(max(int(params.get("limit", 50)), 1), self.max_limit)
+        span = min(max(int(params.get("span", 5)), 0), self.max_limit // 2)
+        if params.get("around") == "me":
+            return ("around", span)
+        return ("page", limit, params.get("cursor") or None)
+
+    def _leaderboard_payload(self, request, challenge_id, query):
+        """Return (payload, error response)."""
+        if query[0] == "around":
+            user = getattr(request, "user", None)
+            if not (user and getattr(user, "is_authenticated", False)):
+                return None, Response(
+                    {"error_code": "AUTH_REQUIRED", "message": "Authentication is required to find your position."},
+                    status=status.HTTP_401_UNAUTHORIZED,
+                )
+            window = get_leaderboard_around(challenge_id, str(user.pk), span=query[1])
+            if window is None:
+                return {"entries": [], "me": None}, None
+            return window, None
+
+        _, limit, cursor = query
+        try:
+            entries, next_cursor = get_challenge_leaderboard_page(challenge_id, limit, cursor)
+        except ValueError as exc:
+            return None, Response(
+                {"error_code": "VALIDATION_ERROR", "message": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return {"entries": entries, "next_cursor": next_cursor}, None
+
+    def _leaderboard_response(self, request, challenge_id):
+        """The leaderboard payload behind ETag/Last-Modified from the challenge's leaderboard version."""
+        try:
+            query = self._leaderboard_query(request)
+        except ValueError:
+            return Response(
+                {"error_code": "VALIDATION_ERROR", "message": "limit and span must be integers."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        version, updated_at = get_leaderboard_version(challenge_id)
+        user = getattr(request, "user", None)
+        viewer = None
+        if query[0] == "around" and user and getattr(user, "is_authenticated", False):
+            viewer = user.pk
+
+        def build():
+            payload, error = self._leaderboard_payload(request, challenge_id, query)
+            if error:
+                return error
+            return {
+                "challenge_id": challenge_id,
+                **payload,
+                "last_updated": updated_at.isoformat() if updated_at else None,
+            }
+
+        # Keyed only by what the read depends on, so unknown or junk parameters share entries.
+        return conditional_response(
+            request,
+            f"leaderboard:{challenge_id}:{query!r}:viewer={viewer}",
+            (version, updated_at),
+            updated_at,
+            build,
+            vary_on_auth=True,
+        )
 
 
-class DailyLeaderboardView(APIView):
+class DailyLeaderboardView(APIView, LeaderboardQueryMixin):
     """
     Return today's daily leaderboard (top scores) (FR-15).
     """
+    authentication_classes = [FirebaseOptionalAuthentication]
 
     def get(self, request):
         today = date.today()
         try:
-            challenge_id, entries = get_daily_leaderboard(today)
+            daily = get_or_create_daily_challenge(today)
         except ValueError as exc:
             return Response(
                 {"error_code": "NO_ACTIVE_CHALLENGES", "message": str(exc)},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        return Response(
-            {
-                "challenge_id": challenge_id,
-                "entries": entries,
-                "last_updated": timezone.now().isoformat(),
-            },
-            status=status.HTTP_200_OK,
-        )
+        return self._leaderboard_response(request, daily.challenge_id)
 
 
-class ChallengeLeaderboardView(APIView):
+class ChallengeLeaderboardView(APIView, LeaderboardQueryMixin):
     """
     Return leaderboard for a specific challenge (FR-15).
     """
+    authentication_classes = [FirebaseOptionalAuthentication]
 
     def get(self, request, challenge_id):
-        entries = get_challenge_leaderboard(challenge_id)
-        return Response(
-            {
-                "challenge_id": challenge_id,
-                "entries": entries,
-                "last_updated": timezone.now().isoformat(),
-            },
-            status=status.HTTP_200_OK,
-        )
+        return self._leaderboard_response(request, challenge_id)
 
 
 class SessionRankView(APIView):
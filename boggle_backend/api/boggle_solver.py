@@ -1,14 +1,67 @@
 import re
 import sys
 import json
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from game.dawg import Dawg
+from game.solver import solve
 from .randomGen import *
 from .readJSONFile import *
 
+class PrefixIndex(Mapping):
+    """
+    Read-only prefix/word index from create_hash_map, plus the DAWG Boggle solves
+    against, built from the index's words on first use and kept with it.
+    """
+
+    def __init__(self, entries):
+        self._entries = MappingProxyType(entries)
+        self._dawg = None
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        return self._entries[key]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def dawg(self):
+        if self._dawg is None:
+            with self._lock:
+                if self._dawg is None:
+                    self._dawg = Dawg.from_words(word for word, flag in self._entries.items() if flag == 1)
+        return self._dawg
+
+
+def create_hash_map(dictionary):
+    """
+    Build the prefix/word index used by Boggle: 1 marks a full word, 0 a strict prefix.
+    Words are uppercased here and the result is read-only, so one index can be built
+    per dictionary and shared by every solve in the process.
+    """
+    dict_map = {}
+    for word in dictionary:
+        word = word.upper()
+        dict_map[word] = 1
+        for i in range(1, len(word)):
+            prefix = word[:i]
+            if prefix not in dict_map:
+                dict_map[prefix] = 0
+    return PrefixIndex(dict_map)
+
+
 class Boggle:
-    def __init__(self, grid, dictionary):
+    def __init__(self, grid, dictionary, hash_map=None):
         self.grid = grid
         self.dictionary = []
         self.solutions = []
+        # Optional index from create_hash_map(); its full words are the dictionary.
+        self.hash_map = hash_map
 
         if isinstance(dictionary, list):
             self.dictionary = dictionary
@@ -40,67 +93,23 @@ class Boggle:
         # Convert input data into the same case
 
         self.grid = [[x.upper() for x in a] for a in self.grid]
-        self.dictionary = [x.upper() for x in self.dictionary]
 
         # Check if grid is valid
         if not self.is_grid_valid():
             return self.solutions
 
-        # Setup all data structures
-        self.solution_set = set()
-        self.hash_map = self.create_hash_map()
-
-        # Iterate over the NxN grid - find all words that begin with grid[y][x]
-        for y in range(N):
-            for x in range(N):
-                word = ""
-                visited = [[False for _ in range(N)] for _ in range(N)]
-                self.find_words(word, y, x, self.grid, visited, self.hash_map, self.solution_set)
-
-        self.solutions = list(self.solution_set)
+        # Search with the shared engine: a shared index brings its own DAWG, built once.
+        if isinstance(self.hash_map, PrefixIndex):
+            dawg = self.hash_map.dawg
+        elif self.hash_map is not None:
+            dawg = Dawg.from_words(word for word, flag in self.hash_map.items() if flag == 1)
+        else:
+            dawg = Dawg.from_words(word.upper() for word in self.dictionary)
+        self.solutions = solve(self.grid, dawg=dawg)
         return self.solutions
 
-    def find_words(self, word, y, x, grid, visited, hash_map, solution_set):
-        adj_matrix = [[-1, -1], [-1, 0], [-1, 1], [0, 1], [1, 1], [1, 0], [1, -1], [0, -1]]
-
-        # Base Case: y and x are out of bounds or already visited
-        if y < 0 or x < 0 or y >= len(grid) or x >= len(grid) or visited[y][x]:
-            return
-
-        # Append grid[y][x] to the word
-        word += grid[y][x]
-
-        # Check if the new word is a prefix for any word in the hash_map
-        if self.is_prefix_or_word(word, hash_map): # Mark as visited
-            visited[y][x] = True
-
-            # Check if it's an actual word in the dictionary
-            if self.is_word(word, hash_map):
-                if len(word) >= 3:
-                    self.solution_set.add(word)
-
-            # Continue searching using the adjacent tiles
-            for i in range(8):
-                self.find_words(word, y + adj_matrix[i][0], x + adj_matrix[i][1], grid, visited, hash_map, solution_set)
-
-        # Unmark location y, x as visited
-        visited[y][x] = False
-
-    def is_prefix_or_word(self, word, hash_map):
-        return word in hash_map
-
-    def is_word(self, word, hash_map):
-        return self.hash_map.get(word) == 1
-
     def create_hash_map(self):
-        dict_map = {}
-        for word in self.dictionary:
-            dict_map[word] = 1
-            for i in range(1, len(word)):
-                prefix = word[:i]
-                if prefix not in dict_map:
-                    dict_map[prefix] = 0
-        return dict_map
+        return create_hash_map(self.dictionary)
 
 def main():
     grid = [["T", "W", "Y", "R"], ["E", "N", "P", "H"],["G", "Z", "Qu", "R"],["O", "N", "T", "A"]]
@@ -1,26 +1,22 @@
-from functools import lru_cache
-from typing import List
+from typing import List, Sequence
 
-from django.contrib.staticfiles import finders
-
-from .boggle_solver import Boggle
-from .readJSONFile import read_json_to_list
+from game.dictionaries import get_wordlist_path, load_words
+from game.solve_cache import cached_solve
 
 
 class DictionaryNotFound(Exception):
     """Raised when the bundled dictionary cannot be located."""
 
 
-@lru_cache(maxsize=1)
-def load_full_dictionary() -> List[str]:
+def load_full_dictionary(language: str = "en") -> Sequence[str]:
     """
     Load the bundled dictionary once and cache it for subsequent requests.
-    This keeps dictionary lookups fast to satisfy performance expectations.
+    Served from the memory-mapped compiled artifact when one is available.
     """
-    file_path = finders.find("data/full-wordlist.json")
-    if not file_path:
-        raise DictionaryNotFound("Dictionary file data/full-wordlist.json is missing.")
-    return read_json_to_list(file_path)
+    words = load_words(language)
+    if not words:
+        raise DictionaryNotFound(f"Dictionary file {get_wordlist_path(language)} is missing.")
+    return words
 
 
 def normalize_grid(grid: List[List[str]]) -> List[List[str]]:
@@ -35,12 +31,11 @@ def normalize_grid(grid: List[List[str]]) -> List[List[str]]:
     return normalized
 
 
-def generate_valid_words(grid: List[List[str]]) -> List[str]:
+def generate_valid_words(grid: List[List[str]], language: str = "en") -> List[str]:
     """
-    Generate all valid words for a grid using the shared dictionary.
-    Returns a sorted list to keep responses stable for clients.
+    Generate all valid words for a grid with the shared solver engine.
+    Returns a sorted list to keep responses stable for clients. Repeated boards (and
+    their rotations/reflections) are served from the solve cache.
     """
-    dictionary = load_full_dictionary()
-    game = Boggle(grid, dictionary)
-    solutions = game.getSolution()
-    return sorted(solutions)
+    load_full_dictionary(language)  # surface a missing word list as DictionaryNotFound
+    return cached_solve(grid, language)
@@ -2,8 +2,13 @@ from unittest import mock
 
 from django.urls import reverse
 from rest_framework import status
+from django.test import SimpleTestCase
 from rest_framework.test import APITestCase
 
+from game.dawg import Dawg
+
+from .boggle_solver import Boggle, create_hash_map
+
 
 class ChallengeApiTests(APITestCase):
     def test_generate_dictionary_endpoint_validates_and_returns_words(self):
@@ -50,3 +55,31 @@ class ChallengeApiTests(APITestCase):
         self.assertEqual(response.data["difficulty"], "easy")
         self.assertEqual(response.data["valid_words"], [])
         self.assertEqual(response.data["title"], "Practice board")
+
+
+class PrefixIndexTests(SimpleTestCase):
+    grid = [["T", "W", "Y", "R"], ["E", "N", "P", "H"], ["G", "Z", "Qu", "R"], ["O", "N", "T", "A"]]
+    dictionary = ["art", "ego", "gent", "get", "net", "new", "newt", "prat", "pry", "qua", "quart", "quartz", "rat", "tar", "tarp", "ten", "went", "wet", "arty", "rhr", "not", "quar"]
+
+    def test_prebuilt_index_matches_per_solve_index(self):
+        expected = sorted(Boggle(self.grid, list(self.dictionary)).getSolution())
+        index = create_hash_map(self.dictionary)
+        self.assertEqual(sorted(Boggle(self.grid, [], hash_map=index).getSolution()), expected)
+        # The shared index is reusable across boards.
+        self.assertEqual(sorted(Boggle(self.grid, [], hash_map=index).getSolution()), expected)
+
+    def test_shared_index_builds_its_dawg_once(self):
+        index = create_hash_map(self.dictionary)
+        with mock.patch("api.boggle_solver.Dawg.from_words", wraps=Dawg.from_words) as build:
+            first = Boggle(self.grid, [], hash_map=index).getSolution()
+            second = Boggle([row[::-1] for row in self.grid], [], hash_map=index).getSolution()
+        self.assertEqual(build.call_count, 1)
+        self.assertIn("QUARTZ", first)
+        self.assertEqual(second, Boggle([row[::-1] for row in self.grid], list(self.dictionary)).getSolution())
+
+    def test_index_is_read_only(self):
+        index = create_hash_map(["cat"])
+        self.assertEqual(index["CAT"], 1)
+        self.assertEqual(index["CA"], 0)
+        with self.assertRaises(TypeError):
+            index["DOG"] = 1
@@ -93,12 +93,10 @@ def create_game(request, size):
     now = datetime.now()
     name = f'Rand{size}Grid:{now.strftime("%Y-%m-%d %H:%M:%S")}'
 
-    # Find the absolute path of the static JSON file
-    file_path = finders.find("data/full-wordlist.json")
-
-    dictionary = read_json_to_list(file_path)
-    mygame = Boggle(g, dictionary)
-    fwords = mygame.getSolution()
+    try:
+        fwords = generate_valid_words(g)
+    except DictionaryNotFound as exc:
+        return Response({"detail": str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     serializer = GamesSerializer(data={"name": name,"size": size, "grid": str(g), "foundwords": str(fwords)})
     if serializer.is_valid():
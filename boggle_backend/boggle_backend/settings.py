@@ -152,6 +152,51 @@ STATICFILES_DIRS = [
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# Compiled dictionary artifacts (python manage.py compile_dictionaries); memory-mapped by workers.
+DICTIONARY_ARTIFACT_DIR = os.environ.get('DICTIONARY_ARTIFACT_DIR', BASE_DIR / 'compiled_dictionaries')
+
+# Solver processes `manage.py refill_board_pool` fans candidate boards out to (1 = serial).
+# Requests always generate serially; a per-request pool costs more in IPC than it saves.
+GRID_GENERATOR_WORKERS = int(os.environ.get('GRID_GENERATOR_WORKERS', 1))
+
+# Pre-solved boards kept per (size, difficulty, language) bucket by `manage.py refill_board_pool`
+# (the `pool` process in Procfile).
+BOARD_POOL_DEPTH = int(os.environ.get('BOARD_POOL_DEPTH', 10))
+
+# Solve results cached per canonical board (see game/solve_cache.py); the DB tier is shared across workers.
+SOLVE_CACHE_SIZE = int(os.environ.get('SOLVE_CACHE_SIZE', 1024))
+SOLVE_CACHE_DB = os.environ.get('SOLVE_CACHE_DB', 'False').lower() == 'true'
+
+# Live gameplay state (see game/live_sessions.py): 'database' writes through on every word,
+# 'memory' buffers in-process (single worker only), 'cache' buffers in CACHES[LIVE_SESSION_CACHE],
+# which must be a backend shared by all workers and the reaper (e.g. Redis), not the per-process
+# LocMem default. The reap_sessions command does not finalize sessions of a process-local store.
+# The default is 'database' because no shared cache is configured here; gameplay only stops
+# writing to the DB per word once LIVE_SESSION_STORE='cache' points at such a cache.
+LIVE_SESSION_STORE = os.environ.get('LIVE_SESSION_STORE', 'database')
+LIVE_SESSION_CACHE = os.environ.get('LIVE_SESSION_CACHE', 'default')
+LIVE_SESSION_CHECKPOINT_SECONDS = int(os.environ.get('LIVE_SESSION_CHECKPOINT_SECONDS', 30))
+
+# Store new challenges' valid words as packed dictionary ids (needs compiled dictionaries; see game/packed_words.py).
+COMPACT_VALID_WORDS = os.environ.get('COMPACT_VALID_WORDS', 'False').lower() == 'true'
+
+# Challenges whose valid-word sets are kept decoded per worker (see game/boggle_engine.py).
+VALID_WORD_CACHE_SIZE = int(os.environ.get('VALID_WORD_CACHE_SIZE', 1024))
+
+# Challenges whose session ranks are memoized per worker (see accounts/leaderboards.py).
+SESSION_RANK_CACHE_SIZE = int(os.environ.get('SESSION_RANK_CACHE_SIZE', 1024))
+
+# Ephemeral practice games ({"mode": "practice", "ephemeral": true}) live only in this cache, for
+# their duration plus the grace period. They are refused unless it is a shared (e.g. Redis)
+# cache: with the per-process LocMem default a token would 404 on another gunicorn worker.
+PRACTICE_CACHE = os.environ.get('PRACTICE_CACHE', 'default')
+PRACTICE_TTL_GRACE_SECONDS = int(os.environ.get('PRACTICE_TTL_GRACE_SECONDS', 600))
+
+# Polled reads (daily challenge, leaderboards) send ETag/Last-Modified, answer conditional GETs
+# with 304, and share a built payload for this many seconds via CACHES[POLL_CACHE] (0 disables).
+POLL_CACHE = os.environ.get('POLL_CACHE', 'default')
+POLL_CACHE_SECONDS = int(os.environ.get('POLL_CACHE_SECONDS', 2))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -0,0 +1,201 @@
+"""
+Solver benchmarks on reproducible boards. Runs without the HTTP stack:
+    python manage.py bench_solver [--output results.json] [--baseline game/benchmark_baseline.json]
+
+run_suite() covers dictionary load, DAWG build time/size, solve latency percentiles,
+is_on_board throughput and grid-generation attempts/sec; find_regressions() compares a
+run against a stored baseline.
+"""
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from .dawg import Dawg
+from .dictionaries import DictionaryArtifact, get_artifact_path, load_wordlist_json
+from .solver import _get_dawg, is_on_board, solve
+from .word_solver import _VOWEL_RATIOS, _random_grid, solve_boggle_reference
+
+BOARD_SIZES = (4, 5, 6)
+
+# Same vowel/consonant mix as generate_solvable_grid's "medium" setting.
+_VOWELS = "AEIOUA"
+_CONSONANTS = "BCDFGHJKLMNPQRSTVWXYZ"
+
+
+def seeded_boards(size: int, count: int, seed: int = 0) -> List[List[List[str]]]:
+    """Deterministic random boards so runs are comparable across machines and commits."""
+    rng = random.Random(f"{seed}:{size}")
+    boards = []
+    for _ in range(count):
+        grid = []
+        for _ in range(size):
+            row = []
+            for _ in range(size):
+                letter = rng.choice(_VOWELS) if rng.random() < 0.38 else rng.choice(_CONSONANTS)
+                row.append("QU" if letter == "Q" else letter)
+            grid.append(row)
+        boards.append(grid)
+    return boards
+
+
+def time_calls(fn: Callable, args_list: List[tuple], repeat: int = 1) -> List[float]:
+    """Wall time in milliseconds of fn(*args) for each entry (best of `repeat` runs)."""
+    timings = []
+    for args in args_list:
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn(*args)
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        timings.append(best)
+    return timings
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+    }
+
+
+def compare_solvers(boards_per_size: int = 20, seed: int = 0, language: str = "en") -> Dict[int, Dict]:
+    """Time solve against solve_boggle_reference on the same seeded boards."""
+    solve([["A"]], language)  # load the dictionary outside the timed region
+    results = {}
+    for size in BOARD_SIZES:
+        args = [(board, language) for board in seeded_boards(size, boards_per_size, seed)]
+        reference = summarize(time_calls(solve_boggle_reference, args))
+        bitmask = summarize(time_calls(solve, args))
+        results[size] = {
+            "reference": reference,
+            "bitmask": bitmask,
+            "speedup": round(reference["mean_ms"] / bitmask["mean_ms"], 2) if bitmask["mean_ms"] else None,
+        }
+    return results
+
+
+def bench_dictionary_load(language: str = "en") -> Dict[str, Optional[float]]:
+    """Cold load of the JSON word list and of the compiled artifact (when one exists)."""
+    started = time.perf_counter()
+    words = load_wordlist_json(language)
+    json_ms = (time.perf_counter() - started) * 1000
+
+    artifact_ms = None
+    path = get_artifact_path(language)
+    if os.path.exists(path):
+        started = time.perf_counter()
+        artifact = DictionaryArtifact.open(path)
+        len(artifact.words)
+        artifact_ms = round((time.perf_counter() - started) * 1000, 3)
+    return {"words": len(words), "json_ms": round(json_ms, 3), "artifact_ms": artifact_ms}
+
+
+def bench_dawg_build(language: str = "en") -> Dict[str, float]:
+    """Build time of the DAWG from the word list, then (in a second, traced build) peak allocation."""
+    words = load_wordlist_json(language)
+    started = time.perf_counter()
+    dawg = Dawg.from_words(words)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    tracemalloc.start()
+    Dawg.from_words(words)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "build_ms": round(build_ms, 3),
+        "peak_alloc_bytes": peak,
+        "dawg_bytes": dawg.nbytes,
+        "nodes": dawg.node_count,
+    }
+
+
+def bench_solve(boards_per_size: int = 20, seed: int = 0, language: str = "en", repeat: int = 5) -> Dict[str, Dict]:
+    """solve() latency percentiles per board size (best of `repeat` runs per board)."""
+    _get_dawg(language)
+    return {
+        str(size): summarize(time_calls(
+            solve, [(board, language) for board in seeded_boards(size, boards_per_size, seed)], repeat=repeat
+        ))
+        for size in BOARD_SIZES
+    }
+
+
+def bench_is_on_board(boards: int = 10, seed: int = 0, language: str = "en") -> Dict[str, float]:
+    """Lookups/sec for is_on_board over every solution of seeded 5x5 boards, plus as many misses."""
+    checks = []
+    for board in seeded_boards(5, boards, seed):
+        words = solve(board, language)
+        checks.extend((board, word) for word in words)
+        checks.extend((board, word[::-1] + "Z") for word in words)
+    started = time.perf_counter()
+    for board, word in checks:
+        is_on_board(board, word)
+    elapsed = time.perf_counter() - started
+    return {"checks": len(checks), "checks_per_sec": round(len(checks) / elapsed, 1) if elapsed else None}
+
+
+def bench_grid_generation(attempts: int = 50, seed: int = 0, language: str = "en") -> Dict[str, float]:
+    """Serial candidate attempts/sec of the generate_solvable_grid loop (draw + solve)."""
+    _get_dawg(language)
+    random.seed(seed)
+    started = time.perf_counter()
+    for _ in range(attempts):
+        solve(_random_grid(4, _VOWEL_RATIOS["medium"]), language)
+    elapsed = time.perf_counter() - started
+    return {"attempts": attempts, "attempts_per_sec": round(attempts / elapsed, 1) if elapsed else None}
+
+
+def run_suite(boards_per_size: int = 20, seed: int = 0, language: str = "en") -> Dict[str, Dict]:
+    return {
+        "dictionary_load": bench_dictionary_load(language),
+        "dawg_build": bench_dawg_build(language),
+        "solve": bench_solve(boards_per_size, seed, language),
+        "is_on_board": bench_is_on_board(max(1, boards_per_size // 2), seed, language),
+        "grid_generation": bench_grid_generation(boards_per_size * 2, seed, language),
+    }
+
+
+def _flatten(results: Dict, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def _higher_is_better(metric: str) -> bool:
+    return metric.endswith("_per_sec")
+
+
+def _is_tracked(metric: str) -> bool:
+    return metric.endswith(("_ms", "_bytes", "_per_sec"))
+
+
+def find_regressions(results: Dict, baseline: Dict, tolerance: float = 0.5) -> List[Dict]:
+    """
+    Metrics that got worse than the baseline by more than `tolerance` (a fraction).
+    Times and sizes must not grow; *_per_sec rates must not drop.
+    """
+    current = _flatten(results)
+    regressions = []
+    for metric, expected in _flatten(baseline).items():
+        actual = current.get(metric)
+        if actual is None or not expected or not _is_tracked(metric):
+            continue
+        if _higher_is_better(metric):
+            regressed = actual < expected * (1 - tolerance)
+        else:
+            regressed = actual > expected * (1 + tolerance)
+        if regressed:
+            regressions.append({"metric": metric, "baseline": expected, "current": actual})
+    return regressions
@@ -0,0 +1,104 @@
+"""
+Warm pool of pre-solved boards so session/challenge creation can skip live generation.
+
+Buckets are keyed by (size, difficulty, language). `manage.py refill_board_pool` keeps
+each bucket at settings.BOARD_POOL_DEPTH; callers take a board in O(1) and fall back
+to generate_solvable_grid only when their bucket is empty. Refilling never runs on
+the request path: the `pool` process (`refill_board_pool --loop`) tops buckets up.
+"""
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from .difficulty import GENERATOR_MIN_WORDS
+from .models import BoardPoolEntry
+from .word_solver import generate_solvable_grid
+
+logger = logging.getLogger(__name__)
+
+Bucket = Tuple[int, str, str]
+
+DEFAULT_BUCKETS: List[Bucket] = [
+    (size, difficulty, "en")
+    for size in (4, 5, 6)
+    for difficulty in ("easy", "medium", "hard")
+]
+
+
+def get_pool_depth() -> int:
+    return getattr(settings, "BOARD_POOL_DEPTH", 10)
+
+
+def take_board(size: int, difficulty: str, language: str = "en", min_words: int = 0) -> Optional[Tuple[list, list]]:
+    """
+    Pop the oldest pooled board for a bucket (with at least `min_words` words).
+    Returns (grid, valid_words), or None when the bucket is empty.
+    """
+    for _ in range(3):
+        with transaction.atomic():
+            entry = (
+                BoardPoolEntry.objects.select_for_update(skip_locked=True)
+                .filter(size=size, difficulty=difficulty, language=language, word_count__gte=min_words)
+                .order_by("id")
+                .first()
+            )
+            if entry is None:
+                return None
+            # Guard against a concurrent taker on backends without row locks (SQLite).
+            deleted, _ = BoardPoolEntry.objects.filter(pk=entry.pk).delete()
+            if deleted:
+                return entry.grid, entry.valid_words
+    return None
+
+
+def take_or_generate_board(size: int, difficulty: str, language: str = "en",
+                           min_words: Optional[int] = None) -> Tuple[list, list]:
+    """Take a pooled board, generating one live only when the bucket is empty."""
+    if min_words is None:
+        min_words = GENERATOR_MIN_WORDS.get(difficulty, 10)
+    pooled = take_board(size, difficulty, language, min_words=min_words)
+    if pooled is not None:
+        return pooled
+    logger.info("Board pool empty for %sx%s %s/%s; generating live.", size, size, difficulty, language)
+    return generate_solvable_grid(size=size, difficulty=difficulty, language=language, min_words=min_words)
+
+
+def refill_bucket(size: int, difficulty: str, language: str = "en", depth: Optional[int] = None,
+                  workers: int = 1) -> int:
+    """
+    Top a bucket up to `depth` boards with at least the difficulty's minimum word count.
+    Returns how many boards were added; a generation run that misses the minimum adds
+    nothing, and the next refill tries again. `workers` > 1 solves candidates on the
+    solver process pool.
+    """
+    depth = get_pool_depth() if depth is None else depth
+    min_words = GENERATOR_MIN_WORDS.get(difficulty, 10)
+    missing = depth - BoardPoolEntry.objects.filter(
+        size=size, difficulty=difficulty, language=language, word_count__gte=min_words,
+    ).count()
+    if missing <= 0:
+        return 0
+    entries = []
+    for _ in range(missing):
+        grid, valid_words = generate_solvable_grid(
+            size=size, difficulty=difficulty, language=language, min_words=min_words, workers=workers,
+        )
+        if len(valid_words) < min_words:
+            continue
+        entries.append(BoardPoolEntry(
+            size=size,
+            difficulty=difficulty,
+            language=language,
+            grid=grid,
+            valid_words=valid_words,
+            word_count=len(valid_words),
+        ))
+    BoardPoolEntry.objects.bulk_create(entries)
+    return len(entries)
+
+
+def refill_pool(buckets: Iterable[Bucket] = None, depth: Optional[int] = None, workers: int = 1) -> dict:
+    """Refill every bucket; returns {bucket: boards added}."""
+    return {bucket: refill_bucket(*bucket, depth=depth, workers=workers) for bucket in (buckets or DEFAULT_BUCKETS)}
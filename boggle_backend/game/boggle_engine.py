@@ -2,74 +2,146 @@
 Lightweight Boggle helpers for word validation against a challenge grid and dictionary.
 Reuses precomputed dictionaries to avoid heavy recomputation per submission.
 """
-from functools import lru_cache
-from typing import Iterable, List, Set
+import threading
+from collections import OrderedDict
+from typing import Callable, FrozenSet, Hashable, Iterable, List, Optional, Tuple
 
+from django.conf import settings
 from django.utils import timezone
 
 from .models import Challenge
 from .difficulty import get_difficulty_config
+from .solver import is_on_board, paths
 
 
 def _normalize_word(word: str) -> str:
     return (word or "").strip().upper()
 
 
-def get_valid_words(challenge: Challenge) -> Set[str]:
+class VersionedLRU:
     """
-    Return the valid words for a challenge as an uppercase set.
-    Cached per challenge id; invalidated when the cached key changes.
+    Thread-safe LRU of key -> (version, value). A lookup with a different version is a
+    miss, so entries are never served stale after their source changes, even without
+    invalidation.
     """
-    return _get_valid_words_cached(challenge.id, tuple(challenge.valid_words or []))
 
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[object, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, version, value) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self), "maxsize": self.maxsize,
+            "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+        }
+
+
+class ValidWordCache(VersionedLRU):
+    """Challenge id -> (updated_at, valid-word frozenset)."""
+
+
+def lazy_lru(size_setting: str, cls=VersionedLRU) -> Callable[[], VersionedLRU]:
+    """
+    A getter for one process-wide `cls` instance, created on first call with
+    maxsize from `size_setting` (default 1024).
+    """
+    instance = None
+    lock = threading.Lock()
+
+    def get():
+        nonlocal instance
+        if instance is None:
+            with lock:
+                if instance is None:
+                    instance = cls(getattr(settings, size_setting, 1024))
+        return instance
+
+    return get
+
+
+get_valid_word_cache = lazy_lru("VALID_WORD_CACHE_SIZE", ValidWordCache)
+
+
+def get_valid_words(challenge: Challenge) -> FrozenSet[str]:
+    """
+    Return the valid words for a challenge as an uppercase frozenset.
+    Cached per (challenge id, updated_at); saving or deleting a challenge invalidates it.
+    """
+    if challenge.pk is None or challenge.updated_at is None:
+        return _load_valid_words(challenge)
+    cache = get_valid_word_cache()
+    words = cache.get(challenge.pk, challenge.updated_at)
+    if words is None:
+        words = _load_valid_words(challenge)
+        cache.put(challenge.pk, challenge.updated_at, words)
+    return words
+
+
+def _load_valid_words(challenge: Challenge) -> FrozenSet[str]:
+    if challenge.is_packed:
+        # Packed challenges decode (once per blob) straight into a frozenset.
+        from .packed_words import unpack_challenge_words
 
-@lru_cache(maxsize=256)
-def _get_valid_words_cached(challenge_id, words: tuple) -> Set[str]:
-    return {_normalize_word(w) for w in words if _normalize_word(w)}
+        return unpack_challenge_words(challenge).word_set
+    return frozenset(w for w in map(_normalize_word, challenge.valid_words or []) if w)
 
 
 def is_word_on_board(grid: List[List[str]], word: str) -> bool:
     """
-    Check via DFS if `word` can be formed on the board using 8-directional adjacency without reusing tiles.
-    Supports multi-letter tiles like "QU" by matching tile tokens as prefixes in the target word.
+    Check if `word` can be formed on the board using 8-directional adjacency without reusing tiles.
+    Supports multi-letter tiles like "QU"; see game.solver.is_on_board.
+    """
+    return is_on_board(grid, word)
+
+
+def get_word_path(challenge: Challenge, word: str) -> Optional[List[List[int]]]:
+    """
+    One tile path ([[row, col], ...]) spelling `word` on the challenge board, or None.
+    A lookup in the challenge's precomputed word_paths; boards saved without them
+    fall back to tracing the word.
     """
-    target = _normalize_word(word)
-    if not grid or not target:
-        return False
-
-    rows = len(grid)
-    cols = len(grid[0]) if rows else 0
-    norm_grid = [[_normalize_word(cell) for cell in row] for row in grid]
-
-    def dfs(r: int, c: int, idx: int, visited: List[List[bool]]) -> bool:
-        # Out of bounds or already used
-        if r < 0 or c < 0 or r >= rows or c >= cols or visited[r][c]:
-            return False
-
-        cell = norm_grid[r][c]
-        if not target.startswith(cell, idx):
-            return False
-
-        next_idx = idx + len(cell)
-        if next_idx == len(target):
-            return True
-
-        visited[r][c] = True
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                if dfs(r + dr, c + dc, next_idx, visited):
-                    return True
-        visited[r][c] = False
-        return False
-
-    visited = [[False for _ in range(cols)] for _ in range(rows)]
-    for y in range(rows):
-        for x in range(cols):
-            if dfs(y, x, 0, visited):
-                return True
-    return False
+    word = _normalize_word(word)
+    word_paths = challenge.word_path_map()
+    if word_paths:
+        return word_paths.get(word)
+    found = paths(challenge.grid, word, limit=1)
+    return [list(cell) for cell in found[0]] if found else None
 
 
 def score_word(word: str) -> int:
@@ -0,0 +1,241 @@
+"""
+Compact DAWG (directed acyclic word graph) for dictionary prefix/word lookup.
+
+Words are inserted in sorted order and equivalent suffix subtrees are merged as they
+are finalized (Daciuk et al. incremental minimization). The finished graph is stored
+in four flat arrays instead of one object per node:
+
+    offsets[n] .. offsets[n + 1]   edge range of node n (edges sorted by label)
+    labels[e]                      code point of edge e
+    targets[e]                     node reached through edge e
+    terminal                       bitset, bit n set when node n ends a word
+
+Node 0 is the root. The arrays can be serialized with to_bytes() and read back
+without copying through from_buffer(), e.g. from an mmap.
+"""
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+NO_NODE = -1
+
+_MAGIC = b"BGDAWG"
+_FORMAT_VERSION = 1
+# magic, format version, node count, edge count
+_HEADER = struct.Struct("<6sHII")
+
+
+class DawgFormatError(ValueError):
+    """Raised when serialized DAWG bytes are truncated or from another format."""
+
+
+class _BuildNode:
+    __slots__ = ["edges", "is_word", "uid"]
+
+    def __init__(self):
+        self.edges = {}
+        self.is_word = False
+        self.uid = None
+
+    def signature(self) -> tuple:
+        # Children are registered (and numbered) before their parent, and edges are
+        # added in sorted order because words arrive sorted.
+        return (self.is_word, tuple((ch, child.uid) for ch, child in self.edges.items()))
+
+
+class Dawg:
+    """Read-only minimized word graph over flat integer arrays."""
+
+    ROOT = 0
+
+    def __init__(self, offsets, labels, targets, terminal):
+        self.offsets = offsets
+        self.labels = labels
+        self.targets = targets
+        self.terminal = terminal
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "Dawg":
+        """Build a minimized DAWG from an iterable of (already normalized) words."""
+        root = _BuildNode()
+        register = {}
+        unchecked = []  # (parent, char, child) along the most recently inserted word
+        previous = ""
+
+        def minimize(down_to: int):
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                key = child.signature()
+                existing = register.get(key)
+                if existing is not None:
+                    parent.edges[char] = existing
+                else:
+                    child.uid = len(register)
+                    register[key] = child
+
+        for word in sorted(set(words)):
+            if not word:
+                continue
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            minimize(common)
+            node = unchecked[-1][2] if unchecked else root
+            for char in word[common:]:
+                child = _BuildNode()
+                node.edges[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.is_word = True
+            previous = word
+        minimize(0)
+        return cls._flatten(root)
+
+    @classmethod
+    def _flatten(cls, root: _BuildNode) -> "Dawg":
+        # Number nodes breadth-first so the root is 0 and siblings sit close together.
+        index = {id(root): 0}
+        order = [root]
+        i = 0
+        while i < len(order):
+            for _, child in sorted(order[i].edges.items()):
+                if id(child) not in index:
+                    index[id(child)] = len(order)
+                    order.append(child)
+            i += 1
+
+        offsets = array("I", [0])
+        labels = array("I")
+        targets = array("I")
+        terminal = bytearray((len(order) + 7) // 8)
+        for n, node in enumerate(order):
+            for char, child in sorted(node.edges.items()):
+                labels.append(ord(char))
+                targets.append(index[id(child)])
+            offsets.append(len(labels))
+            if node.is_word:
+                terminal[n >> 3] |= 1 << (n & 7)
+        return cls(offsets, labels, targets, bytes(terminal))
+
+    # -- traversal -------------------------------------------------------
+
+    def child(self, node: int, char: str) -> int:
+        """Return the node reached from `node` via `char`, or NO_NODE."""
+        lo = self.offsets[node]
+        hi = self.offsets[node + 1]
+        code = ord(char)
+        i = bisect_left(self.labels, code, lo, hi)
+        if i < hi and self.labels[i] == code:
+            return self.targets[i]
+        return NO_NODE
+
+    def walk(self, node: int, text: str) -> int:
+        """Follow every character of `text` from `node`; NO_NODE if the path breaks."""
+        for char in text:
+            node = self.child(node, char)
+            if node == NO_NODE:
+                return NO_NODE
+        return node
+
+    def is_terminal(self, node: int) -> bool:
+        return bool(self.terminal[node >> 3] >> (node & 7) & 1)
+
+    def has_children(self, node: int) -> bool:
+        return self.offsets[node + 1] > self.offsets[node]
+
+    def search(self, word: str) -> bool:
+        node = self.walk(self.ROOT, word.upper())
+        return node != NO_NODE and self.is_terminal(node)
+
+    def starts_with(self, prefix: str) -> bool:
+        return self.walk(self.ROOT, prefix.upper()) != NO_NODE
+
+    def __contains__(self, word: str) -> bool:
+        return self.search(word)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield every word in sorted order."""
+        stack = [(self.ROOT, "")]
+        while stack:
+            node, prefix = stack.pop()
+            if self.is_terminal(node):
+                yield prefix
+            lo = self.offsets[node]
+            for e in range(self.offsets[node + 1] - 1, lo - 1, -1):
+                stack.append((self.targets[e], prefix + chr(self.labels[e])))
+
+    @property
+    def node_count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.labels)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the backing arrays in bytes."""
+        return 4 * (len(self.offsets) + len(self.labels) + len(self.targets)) + len(self.terminal)
+
+    # -- serialization ---------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a little-endian blob readable by from_buffer()."""
+        parts = [_HEADER.pack(_MAGIC, _FORMAT_VERSION, self.node_count, self.edge_count)]
+        for arr in (self.offsets, self.labels, self.targets):
+            data = array("I", arr)
+            if sys.byteorder != "little":
+                data.byteswap()
+            parts.append(data.tobytes())
+        parts.append(bytes(self.terminal))
+        return b"".join(parts)
+
+    @classmethod
+    def from_buffer(cls, buffer, offset: int = 0) -> "Dawg":
+        """
+        Load a DAWG from bytes/mmap without copying when the host is little-endian.
+        `buffer` must stay open for as long as the returned Dawg is used.
+        """
+        view = memoryview(buffer)
+        if len(view) < offset + _HEADER.size:
+            raise DawgFormatError("DAWG data is truncated.")
+        magic, version, nodes, edges = _HEADER.unpack_from(view, offset)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise DawgFormatError("Unsupported DAWG format.")
+        pos = offset + _HEADER.size
+        sizes = (nodes + 1, edges, edges)
+        end = pos + 4 * sum(sizes) + (nodes + 7) // 8
+        if len(view) < end:
+            raise DawgFormatError("DAWG data is truncated.")
+
+        arrays = []
+        for count in sizes:
+            chunk = view[pos:pos + 4 * count]
+            if sys.byteorder == "little":
+                arrays.append(chunk.cast("I"))
+            else:
+                data = array("I", chunk.tobytes())
+                data.byteswap()
+                arrays.append(data)
+            pos += 4 * count
+        terminal = view[pos:end]
+        return cls(arrays[0], arrays[1], arrays[2], terminal)
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Dawg":
+        with open(path, "rb") as f:
+            return cls.from_buffer(f.read())
+
+    @classmethod
+    def serialized_size(cls, buffer, offset: int = 0) -> int:
+        """Number of bytes the DAWG at `offset` occupies, read from its header."""
+        _, _, nodes, edges = _HEADER.unpack_from(buffer, offset)
+        return _HEADER.size + 4 * (nodes + 1 + 2 * edges) + (nodes + 7) // 8
@@ -0,0 +1,279 @@
+"""
+Shared dictionary loading for the solvers.
+
+Word lists ship as JSON under static/data. `python manage.py compile_dictionaries`
+turns each one into a versioned binary artifact (sorted word table + serialized DAWG)
+that workers memory-map, so startup skips JSON parsing and DAWG construction and all
+gunicorn workers share the same physical pages. Without an artifact everything falls
+back to parsing the JSON list.
+
+Artifact layout (little-endian):
+    header     magic, format version, language, source digest, word count, blob size
+    offsets    uint32[word_count + 1] byte offsets into the word blob
+    blob       UTF-8 words, sorted, uppercase, no separators (padded to 4 bytes)
+    dawg       Dawg.to_bytes()
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import List, Optional
+
+from django.conf import settings
+
+from .dawg import Dawg
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES = ("en", "es", "fr")
+
+WORDLIST_FILES = {
+    "en": "full-wordlist.json",
+    "es": "spanish-wordlist.json",
+    "fr": "french-wordlist.json",
+}
+
+MIN_WORD_LENGTH = 3
+
+ARTIFACT_MAGIC = b"BGDICT"
+ARTIFACT_FORMAT_VERSION = 1
+# magic, format version, language, source digest, word count, blob size
+_HEADER = struct.Struct("<6sH4s16sII")
+
+
+class ArtifactError(ValueError):
+    """Raised when a compiled dictionary artifact is unreadable."""
+
+
+def normalize_language(language: str) -> str:
+    return language if language in WORDLIST_FILES else "en"
+
+
+def get_wordlist_path(language: str = "en") -> str:
+    """Get the path to the JSON word list for a given language."""
+    base_path = os.path.join(settings.BASE_DIR, "boggle_backend", "static", "data")
+    return os.path.join(base_path, WORDLIST_FILES[normalize_language(language)])
+
+
+def get_artifact_path(language: str = "en") -> str:
+    return os.path.join(str(settings.DICTIONARY_ARTIFACT_DIR), f"{normalize_language(language)}.dict")
+
+
+def source_digest(language: str = "en") -> Optional[bytes]:
+    """First 16 bytes of the SHA-256 of the JSON word list; None if it is missing."""
+    try:
+        with open(get_wordlist_path(language), "rb") as f:
+            return hashlib.sha256(f.read()).digest()[:16]
+    except FileNotFoundError:
+        return None
+
+
+def load_wordlist_json(language: str = "en") -> List[str]:
+    """Parse the JSON word list into sorted, unique, uppercase words of playable length."""
+    path = get_wordlist_path(language)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        # Fall back to English
+        if normalize_language(language) != "en":
+            return load_wordlist_json("en")
+        return []
+
+    # Handle different JSON formats
+    if isinstance(data, dict) and "words" in data:
+        words = data["words"]
+    elif isinstance(data, list):
+        words = data
+    else:
+        words = list(data.values()) if isinstance(data, dict) else []
+    return sorted({w.strip().upper() for w in words if isinstance(w, str) and len(w.strip()) >= MIN_WORD_LENGTH})
+
+
+class WordTable(Sequence):
+    """Sorted word list backed by an offsets array and a UTF-8 blob (no per-word objects)."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def index(self, word: str, start: int = 0, stop: Optional[int] = None) -> int:
+        """Binary search for `word`; raises ValueError when absent."""
+        lo, hi = start, len(self) if stop is None else stop
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self[mid] < word:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self[lo] == word:
+            return lo
+        raise ValueError(f"{word!r} is not in the dictionary")
+
+    def __contains__(self, word) -> bool:
+        try:
+            self.index(word)
+        except (ValueError, TypeError):
+            return False
+        return True
+
+
+class DictionaryArtifact:
+    """A compiled dictionary, usually backed by a read-only mmap."""
+
+    def __init__(self, buffer, language: str, digest: bytes, words: WordTable, dawg: Dawg):
+        self._buffer = buffer  # keep the mapping alive for the views below
+        self.language = language
+        self.digest = digest
+        self.words = words
+        self.dawg = dawg
+
+    @property
+    def version(self) -> str:
+        """Dictionary version: hex digest of the source word list."""
+        return self.digest.hex()
+
+    @classmethod
+    def from_buffer(cls, buffer) -> "DictionaryArtifact":
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ArtifactError("Dictionary artifact is truncated.")
+        magic, fmt, language, digest, count, blob_size = _HEADER.unpack_from(view, 0)
+        if magic != ARTIFACT_MAGIC or fmt != ARTIFACT_FORMAT_VERSION:
+            raise ArtifactError("Unsupported dictionary artifact format.")
+
+        pos = _HEADER.size
+        offsets_end = pos + 4 * (count + 1)
+        blob_end = offsets_end + blob_size
+        if len(view) < blob_end:
+            raise ArtifactError("Dictionary artifact is truncated.")
+        if sys.byteorder == "little":
+            offsets = view[pos:offsets_end].cast("I")
+        else:
+            offsets = array("I", view[pos:offsets_end].tobytes())
+            offsets.byteswap()
+        words = WordTable(offsets, view[offsets_end:blob_end])
+        dawg = Dawg.from_buffer(view, _aligned(blob_end))
+        return cls(buffer, language.rstrip(b"\0").decode("ascii"), digest, words, dawg)
+
+    @classmethod
+    def open(cls, path: str) -> "DictionaryArtifact":
+        """Memory-map an artifact file read-only."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(mapped)
+
+
+def _aligned(pos: int) -> int:
+    return (pos + 3) & ~3
+
+
+def compile_artifact(words: List[str], language: str, digest: bytes) -> bytes:
+    """Serialize a word list (and its DAWG) into artifact bytes."""
+    words = sorted(set(words))
+    encoded = [w.encode("utf-8") for w in words]
+    offsets = array("I", [0])
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    blob = b"".join(encoded)
+
+    header = _HEADER.pack(
+        ARTIFACT_MAGIC,
+        ARTIFACT_FORMAT_VERSION,
+        language.encode("ascii"),
+        digest,
+        len(words),
+        len(blob),
+    )
+    body = header + offsets.tobytes() + blob
+    body += b"\0" * (_aligned(len(body)) - len(body))
+    return body + Dawg.from_words(words).to_bytes()
+
+
+def write_artifact(language: str, output_dir: Optional[str] = None) -> str:
+    """Compile the JSON word list for `language` and write it atomically. Returns the path."""
+    language = normalize_language(language)
+    output_dir = output_dir or str(settings.DICTIONARY_ARTIFACT_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{language}.dict")
+    data = compile_artifact(load_wordlist_json(language), language, source_digest(language) or b"\0" * 16)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_dictionary_artifact(language: str = "en") -> Optional[DictionaryArtifact]:
+    """
+    Map the compiled artifact for a language once per process.
+    Returns None when it is missing, unreadable, or older than the JSON source.
+    """
+    return _load_dictionary_artifact(normalize_language(language))
+
+
+@lru_cache(maxsize=4)
+def _load_dictionary_artifact(language: str) -> Optional[DictionaryArtifact]:
+    path = get_artifact_path(language)
+    if not os.path.exists(path):
+        return None
+    try:
+        artifact = DictionaryArtifact.open(path)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring dictionary artifact %s: %s", path, exc)
+        return None
+    expected = source_digest(language)
+    if expected is not None and artifact.digest != expected:
+        logger.warning("Dictionary artifact %s is stale; run compile_dictionaries.", path)
+        return None
+    return artifact
+
+
+def dictionary_version(language: str = "en") -> str:
+    """
+    Hex digest of the word list solves for `language` run against (the compiled
+    artifact's version when there is one); "" if the word list is missing.
+    """
+    return _dictionary_version(normalize_language(language))
+
+
+@lru_cache(maxsize=4)
+def _dictionary_version(language: str) -> str:
+    artifact = _load_dictionary_artifact(language)
+    if artifact is not None:
+        return artifact.version
+    digest = source_digest(language)
+    return digest.hex() if digest else ""
+
+
+def load_words(language: str = "en") -> Sequence:
+    """Sorted uppercase words for a language, from the artifact when compiled."""
+    return _load_words(normalize_language(language))
+
+
+@lru_cache(maxsize=4)
+def _load_words(language: str) -> Sequence:
+    artifact = _load_dictionary_artifact(language)
+    if artifact is not None:
+        return artifact.words
+    return load_wordlist_json(language)
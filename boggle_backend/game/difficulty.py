@@ -34,3 +34,11 @@ def difficulty_to_size(difficulty: str) -> int:
     if not cfg:
         return DIFFICULTY_CONFIG["easy"]["grid_size"]
     return cfg["grid_size"]
+
+
+# Minimum solutions a generated board needs before it is handed out.
+GENERATOR_MIN_WORDS = {
+    "easy": 15,
+    "medium": 10,
+    "hard": 8,
+}
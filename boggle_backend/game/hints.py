@@ -1,14 +1,62 @@
-import random
-from typing import List, Optional, Tuple
+from typing import Dict, Optional, Sequence, Set, Tuple
 
+from .boggle_engine import get_valid_words, lazy_lru
 
-def choose_hint(unfound: List[str]) -> Optional[dict]:
+
+class HintIndex:
     """
-    Pick a simple hint from unfound words: first letter and length.
-    Deterministic if possible to keep outputs predictable.
+    A challenge's valid words in hint order (shortest, then alphabetical) with their
+    tile paths. Sessions keep a cursor into `order`: every word before it has been
+    found, so the next hint only scans past words found since.
     """
-    if not unfound:
-        return None
-    # Choose shortest, then lexicographically for determinism
-    target = sorted(unfound, key=lambda w: (len(w), w))[0]
-    return {"first_letter": target[0], "length": len(target), "word": target}
+
+    def __init__(self, words, word_paths: Dict[str, Sequence[Sequence[int]]]):
+        self.order: Tuple[str, ...] = tuple(sorted(words, key=lambda w: (len(w), w)))
+        self.paths = word_paths
+
+    def next_unfound(self, found: Set[str], cursor: int = 0) -> Tuple[Optional[str], int]:
+        """Return (first unfound word at or after cursor, its index)."""
+        for index in range(cursor, len(self.order)):
+            if self.order[index] not in found:
+                return self.order[index], index
+        return None, len(self.order)
+
+    def hint(self, word: str, tier: int) -> dict:
+        """
+        Hint for `word`, more revealing with each tier:
+            1  first letter and length
+            2  + starting tile [row, col]
+            3  + the first half of its path (at least two tiles)
+        """
+        hint = {"first_letter": word[0], "length": len(word), "word": word, "tier": tier}
+        path = self.paths.get(word)
+        if tier >= 2 and path:
+            hint["start"] = list(path[0])
+        if tier >= 3 and path:
+            hint["path_prefix"] = [list(cell) for cell in path[:max(2, len(path) // 2)]]
+        return hint
+
+
+# Challenge id -> (updated_at, HintIndex).
+get_hint_index_cache = lazy_lru("VALID_WORD_CACHE_SIZE")
+
+
+def get_hint_index(challenge) -> HintIndex:
+    """The challenge's HintIndex, built once per (challenge id, updated_at)."""
+    if challenge.pk is None or challenge.updated_at is None:
+        return HintIndex(get_valid_words(challenge), challenge.word_path_map())
+    cache = get_hint_index_cache()
+    index = cache.get(challenge.pk, challenge.updated_at)
+    if index is None:
+        index = HintIndex(get_valid_words(challenge), challenge.word_path_map())
+        cache.put(challenge.pk, challenge.updated_at, index)
+    return index
+
+
+def next_hint(challenge, found: Set[str], cursor: int, tier: int) -> Tuple[Optional[dict], int]:
+    """Hint for the first unfound word at or after `cursor`; returns (hint or None, new cursor)."""
+    index = get_hint_index(challenge)
+    word, cursor = index.next_unfound(found, cursor)
+    if word is None:
+        return None, cursor
+    return index.hint(word, tier), cursor
@@ -0,0 +1,470 @@
+"""
+Live gameplay state for active sessions: score, found words and hint/shuffle counters.
+
+Views read and write a session's in-game state through the store returned by
+get_live_session_store(session), chosen by settings.LIVE_SESSION_STORE (ephemeral
+practice games always use game.practice.EphemeralPracticeStore):
+
+    "database"  write-through; every submission, hint and shuffle hits GameSession
+                and SessionSubmission directly (safe with any number of workers).
+                This is the default, so out of the box every word is a DB write.
+    "memory"    write-behind, held in this process (single-worker deployments)
+    "cache"     write-behind, held in the Django cache settings.LIVE_SESSION_CACHE
+                (use a Redis cache to share live sessions across workers)
+
+Write-behind stores keep submissions in memory and flush them, together with the
+counters, to the database on a checkpoint (every LIVE_SESSION_CHECKPOINT_SECONDS),
+when the session ends or expires (close()), so steady-state gameplay does no DB
+writes per word. With several workers that needs "cache" backed by a shared cache
+such as Redis; "memory" only holds for a single worker process.
+"""
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import GameSession, SessionSubmission
+
+logger = logging.getLogger(__name__)
+
+# (uppercase word, is_valid, score_delta, timestamp or None)
+Entry = Tuple[str, bool, int, Optional[object]]
+
+
+class LiveSessionStore(ABC):
+    """Interface shared by the write-through and write-behind stores."""
+
+    # Whether other processes (other workers, the reaper) see the same live state.
+    shared = True
+
+    @abstractmethod
+    def record(self, session: GameSession, entries: Iterable[Entry]) -> Tuple[List[bool], int]:
+        """
+        Append submissions in order. A word already found (before or earlier in the
+        batch) is not recorded. Returns ([recorded per entry], score afterwards).
+        """
+
+    @abstractmethod
+    def consume(self, session: GameSession, counter: str, limit: int) -> Optional[int]:
+        """Increment a counter ("hint_uses"/"shuffle_uses") below `limit`; None when exhausted."""
+
+    @abstractmethod
+    def found_words(self, session: GameSession) -> Set[str]:
+        """Words the session has found so far."""
+
+    @abstractmethod
+    def hint_cursor(self, session: GameSession) -> int:
+        """Position of the next hint in the challenge's hint order."""
+
+    @abstractmethod
+    def set_hint_cursor(self, session: GameSession, cursor: int) -> None:
+        """Move the session's hint cursor forward (never back)."""
+
+    @abstractmethod
+    def score(self, session: GameSession) -> int:
+        """The session's current score."""
+
+    def flush(self, session: GameSession) -> None:
+        """Persist buffered state for the session."""
+
+    def close(self, session: GameSession) -> None:
+        """Persist buffered state and forget the session (on end or expiry)."""
+
+    def clear(self) -> None:
+        """Drop all buffered state without persisting it."""
+
+
+class DatabaseSessionStore(LiveSessionStore):
+    """Writes every change straight to the database with atomic updates."""
+
+    def record(self, session, entries):
+        entries = list(entries)
+        for attempt in range(2):
+            found = session.found_words()
+            recorded, rows, total_delta = _apply(found, entries)
+            for row in rows:
+                row.session = session
+            try:
+                with transaction.atomic():
+                    SessionSubmission.objects.bulk_create(rows)
+                    if total_delta:
+                        GameSession.objects.filter(pk=session.pk).update(score=F('score') + total_delta)
+                break
+            except IntegrityError:
+                # A concurrent submit recorded one of these words first; re-check against it.
+                if attempt:
+                    raise
+        session.refresh_from_db(fields=['score'])
+        return recorded, session.score
+
+    def consume(self, session, counter, limit):
+        consumed = GameSession.objects.filter(pk=session.pk, **{f'{counter}__lt': limit}).update(
+            **{counter: F(counter) + 1}
+        )
+        if not consumed:
+            return None
+        session.refresh_from_db(fields=[counter])
+        return getattr(session, counter)
+
+    def found_words(self, session):
+        return session.found_words()
+
+    def hint_cursor(self, session):
+        return session.hint_cursor
+
+    def set_hint_cursor(self, session, cursor):
+        if cursor > session.hint_cursor:
+            GameSession.objects.filter(pk=session.pk, hint_cursor__lt=cursor).update(hint_cursor=cursor)
+            session.hint_cursor = cursor
+
+    def score(self, session):
+        return session.score
+
+
+def _apply(found: Set[str], entries: List[Entry]) -> Tuple[List[bool], List[SessionSubmission], int]:
+    """Apply entries to a found-word set; returns (recorded flags, new rows, score gained)."""
+    recorded, rows, total_delta = [], [], 0
+    for word, is_valid, score_delta, timestamp in entries:
+        if word in found:
+            recorded.append(False)
+            continue
+        if is_valid:
+            found.add(word)
+            total_delta += score_delta
+        else:
+            score_delta = 0
+        rows.append(SessionSubmission(
+            word=word, is_valid=is_valid, score_delta=score_delta, timestamp=timestamp or timezone.now(),
+        ))
+        recorded.append(True)
+    return recorded, rows, total_delta
+
+
+@contextmanager
+def cache_lock(cache, key: str, timeout: int = 5, wait: float = 5.0):
+    """
+    Mutex held in a Django cache for at most `timeout` seconds. cache.add is atomic
+    (SET NX on Redis); the token guards against releasing a lock that already timed
+    out and was taken by someone else. Raises TimeoutError after `wait` seconds.
+    """
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + wait
+    while not cache.add(key, token, timeout):
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"{key} is locked.")
+        time.sleep(0.005)
+    try:
+        yield
+    finally:
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+class _WriteBehindStore(LiveSessionStore):
+    """
+    Buffers per-session state as a plain dict:
+        {"score", "hint_uses", "shuffle_uses", "hint_cursor", "found": [...], "pending": [row dicts],
+         "checkpoint_at": epoch seconds, "expires_at": epoch seconds or None}
+    Subclasses provide storage and a per-session lock.
+    """
+
+    def __init__(self, checkpoint_seconds: int = 30):
+        self.checkpoint_seconds = checkpoint_seconds
+
+    def _key_of(self, session: GameSession):
+        """The id a session's state is stored and locked under."""
+        return session.pk
+
+    # storage hooks
+    @abstractmethod
+    def _get(self, session_id: int) -> Optional[dict]:
+        """The buffered state, or None if the session is not held."""
+
+    @abstractmethod
+    def _set(self, session_id: int, state: dict) -> None:
+        """Store the buffered state."""
+
+    @abstractmethod
+    def _delete(self, session_id: int) -> None:
+        """Forget the buffered state."""
+
+    @abstractmethod
+    def _lock(self, session_id: int):
+        """Context manager held while reading and writing one session's state."""
+
+    def _load(self, session: GameSession) -> dict:
+        state = self._get(self._key_of(session))
+        if state is None:
+            expires_at = None
+            if session.duration_seconds is not None:
+                expires_at = (session.start_time + timezone.timedelta(seconds=session.duration_seconds)).timestamp()
+            state = {
+                "score": session.score or 0,
+                "hint_uses": session.hint_uses,
+                "shuffle_uses": session.shuffle_uses,
+                "hint_cursor": session.hint_cursor,
+                "found": sorted(session.found_words()),
+                "pending": [],
+                "checkpoint_at": time.time(),
+                "expires_at": expires_at,
+            }
+        return state
+
+    def _store(self, session: GameSession, state: dict) -> None:
+        key = self._key_of(session)
+        if time.time() - state["checkpoint_at"] >= self.checkpoint_seconds:
+            self._persist(key, state)
+        self._set(key, state)
+
+    def _persist(self, session_id: int, state: dict) -> None:
+        rows = [SessionSubmission.from_dict(entry) for entry in state["pending"]]
+        for row in rows:
+            row.session_id = session_id
+        with transaction.atomic():
+            SessionSubmission.objects.bulk_create(rows)
+            GameSession.objects.filter(pk=session_id).update(
+                score=state["score"], hint_uses=state["hint_uses"], shuffle_uses=state["shuffle_uses"],
+                hint_cursor=state["hint_cursor"],
+            )
+        state["pending"] = []
+        state["checkpoint_at"] = time.time()
+
+    def _sync(self, session: GameSession, state: dict) -> None:
+        # Keep the caller's instance consistent with the live state.
+        session.score = state["score"]
+        session.hint_uses = state["hint_uses"]
+        session.shuffle_uses = state["shuffle_uses"]
+        session.hint_cursor = state["hint_cursor"]
+
+    def record(self, session, entries):
+        with self._lock(self._key_of(session)):
+            state = self._load(session)
+            found = set(state["found"])
+            recorded, rows, total_delta = _apply(found, list(entries))
+            state["found"] = sorted(found)
+            state["pending"].extend(row.as_dict() for row in rows)
+            state["score"] += total_delta
+            self._store(session, state)
+        self._sync(session, state)
+        return recorded, state["score"]
+
+    def consume(self, session, counter, limit):
+        with self._lock(self._key_of(session)):
+            state = self._load(session)
+            if state[counter] >= limit:
+                self._sync(session, state)
+                return None
+            state[counter] += 1
+            self._store(session, state)
+        self._sync(session, state)
+        return state[counter]
+
+    def found_words(self, session):
+        state = self._get(self._key_of(session))
+        return set(state["found"]) if state is not None else session.found_words()
+
+    def hint_cursor(self, session):
+        state = self._get(self._key_of(session))
+        return state["hint_cursor"] if state is not None else session.hint_cursor
+
+    def set_hint_cursor(self, session, cursor):
+        with self._lock(self._key_of(session)):
+            state = self._load(session)
+            if cursor > state["hint_cursor"]:
+                state["hint_cursor"] = cursor
+                self._store(session, state)
+        self._sync(session, state)
+
+    def score(self, session):
+        state = self._get(self._key_of(session))
+        return state["score"] if state is not None else session.score
+
+    def flush(self, session):
+        key = self._key_of(session)
+        with self._lock(key):
+            state = self._get(key)
+            if state is not None:
+                self._persist(key, state)
+                self._set(key, state)
+                self._sync(session, state)
+
+    def close(self, session):
+        key = self._key_of(session)
+        with self._lock(key):
+            state = self._get(key)
+            if state is not None:
+                self._persist(key, state)
+                self._delete(key)
+                self._sync(session, state)
+
+
+class InProcessSessionStore(_WriteBehindStore):
+    """Holds live sessions in this process; expired ones are flushed on the next checkpoint sweep."""
+
+    shared = False
+
+    def __init__(self, checkpoint_seconds: int = 30):
+        super().__init__(checkpoint_seconds)
+        self._states: Dict[int, dict] = {}
+        # session id -> [lock, threads holding or waiting for it]. An entry is only
+        # evicted, under _guard, once no thread uses it and the session is gone, so
+        # everyone contending for a session always shares one lock.
+        self._locks: Dict[int, list] = {}
+        self._guard = threading.Lock()
+        self._swept_at = time.time()
+
+    def _get(self, session_id):
+        return self._states.get(session_id)
+
+    def _set(self, session_id, state):
+        self._states[session_id] = state
+        self._sweep()
+
+    def _delete(self, session_id):
+        self._states.pop(session_id, None)
+
+    def _acquire(self, session_id, blocking=True) -> bool:
+        with self._guard:
+            entry = self._locks.setdefault(session_id, [threading.Lock(), 0])
+            entry[1] += 1
+        if entry[0].acquire(blocking):
+            return True
+        self._forget_lock(session_id)
+        return False
+
+    def _release(self, session_id):
+        self._locks[session_id][0].release()
+        self._forget_lock(session_id)
+
+    def _forget_lock(self, session_id):
+        with self._guard:
+            entry = self._locks[session_id]
+            entry[1] -= 1
+            if not entry[1] and session_id not in self._states:
+                del self._locks[session_id]
+
+    @contextmanager
+    def _lock(self, session_id):
+        self._acquire(session_id)
+        try:
+            yield
+        finally:
+            self._release(session_id)
+
+    def _sweep(self):
+        now = time.time()
+        if now - self._swept_at < self.checkpoint_seconds:
+            return
+        self._swept_at = now
+        for session_id, state in list(self._states.items()):
+            if state["expires_at"] is None or state["expires_at"] > now:
+                continue
+            if not self._acquire(session_id, blocking=False):
+                continue
+            try:
+                self._persist(session_id, state)
+                # Abandoned sessions are not kept for the life of the worker; a late
+                # request reloads the persisted state from the database.
+                self._delete(session_id)
+            except Exception:
+                logger.warning("Could not flush expired live session %s.", session_id, exc_info=True)
+            finally:
+                self._release(session_id)
+
+    def __len__(self):
+        return len(self._states)
+
+    def clear(self):
+        with self._guard:
+            self._states.clear()
+            for session_id in [sid for sid, (_, users) in self._locks.items() if not users]:
+                del self._locks[session_id]
+
+
+class CacheSessionStore(_WriteBehindStore):
+    """
+    Holds live sessions in a Django cache so every worker sees the same state. Entries
+    outlive the session by `grace_seconds` to leave time for close() or a reaper.
+    """
+
+    key_prefix = "live-session"
+
+    def __init__(self, alias: str = "default", checkpoint_seconds: int = 30,
+                 grace_seconds: int = 24 * 3600, lock_timeout: int = 5, lock_wait: float = 5.0):
+        super().__init__(checkpoint_seconds)
+        self.alias = alias
+        self.grace_seconds = grace_seconds
+        self.lock_timeout = lock_timeout
+        self.lock_wait = lock_wait
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def shared(self):
+        # LocMemCache (the default when CACHES is not configured) is per process.
+        return not isinstance(self.cache, (LocMemCache, DummyCache))
+
+    def _key(self, session_id):
+        return f"{self.key_prefix}:{session_id}"
+
+    def _get(self, session_id):
+        return self.cache.get(self._key(session_id))
+
+    def _set(self, session_id, state):
+        timeout = self.grace_seconds
+        if state["expires_at"] is not None:
+            timeout += max(0, int(state["expires_at"] - time.time()))
+        self.cache.set(self._key(session_id), state, timeout)
+
+    def _delete(self, session_id):
+        self.cache.delete(self._key(session_id))
+
+    def _lock(self, session_id):
+        return cache_lock(self.cache, f"{self._key(session_id)}:lock", self.lock_timeout, self.lock_wait)
+
+    # No clear(): the alias is usually shared (PRACTICE_CACHE, POLL_CACHE), and a cache
+    # cannot delete by prefix. Entries expire on their own after grace_seconds.
+
+
+_store: Optional[LiveSessionStore] = None
+_store_config: Optional[tuple] = None
+_store_lock = threading.Lock()
+
+
+def get_live_session_store(session: Optional[GameSession] = None) -> LiveSessionStore:
+    """The configured store, or the practice cache's store for an ephemeral practice game."""
+    if session is not None and getattr(session, "practice_token", None):
+        from .practice import get_practice_store
+
+        return get_practice_store()
+    global _store, _store_config
+    backend = getattr(settings, "LIVE_SESSION_STORE", "database")
+    checkpoint = getattr(settings, "LIVE_SESSION_CHECKPOINT_SECONDS", 30)
+    alias = getattr(settings, "LIVE_SESSION_CACHE", "default")
+    config = (backend, checkpoint, alias)
+    if _store is None or _store_config != config:
+        with _store_lock:
+            if _store is None or _store_config != config:
+                if backend == "database":
+                    _store = DatabaseSessionStore()
+                elif backend == "memory":
+                    _store = InProcessSessionStore(checkpoint_seconds=checkpoint)
+                elif backend == "cache":
+                    _store = CacheSessionStore(alias, checkpoint_seconds=checkpoint)
+                else:
+                    raise ValueError(f"Unknown LIVE_SESSION_STORE {backend!r}; use 'database', 'memory' or 'cache'.")
+                _store_config = config
+    return _store
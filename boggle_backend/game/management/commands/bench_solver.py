@@ -0,0 +1,66 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.benchmarks import compare_solvers, find_regressions, run_suite
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "benchmark_baseline.json")
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the solver benchmark suite on seeded boards and print JSON results. "
+        "Fails when a metric regresses past the baseline (game/benchmark_baseline.json unless "
+        "--baseline or --no-baseline is given) by more than --tolerance."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--boards", type=int, default=20, help="Boards per size.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--language", default="en")
+        parser.add_argument("--output", help="Also write the JSON results to this file.")
+        parser.add_argument("--baseline", help=f"Baseline JSON to compare against (default: {DEFAULT_BASELINE}).")
+        parser.add_argument("--no-baseline", action="store_true", help="Only print results; skip the comparison.")
+        parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed fractional slowdown.")
+        parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline.")
+        parser.add_argument("--reference", action="store_true",
+                            help="Only compare solve() against the reference DFS and print a summary.")
+
+    def handle(self, *args, **options):
+        if options["reference"]:
+            results = compare_solvers(options["boards"], options["seed"], options["language"])
+            for size, row in results.items():
+                self.stdout.write(
+                    f"{size}x{size}: reference {row['reference']['mean_ms']:.2f} ms, "
+                    f"bitmask {row['bitmask']['mean_ms']:.2f} ms (p95 {row['bitmask']['p95_ms']:.2f} ms), "
+                    f"speedup {row['speedup']}x"
+                )
+            return
+
+        results = run_suite(options["boards"], options["seed"], options["language"])
+        payload = json.dumps(results, indent=2, sort_keys=True)
+        self.stdout.write(payload)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as fh:
+                fh.write(payload + "\n")
+
+        baseline_path = options["baseline"] or DEFAULT_BASELINE
+        if options["update_baseline"]:
+            with open(baseline_path, "w", encoding="utf-8") as fh:
+                fh.write(payload + "\n")
+            self.stderr.write(f"Baseline written to {baseline_path}")
+            return
+
+        if options["no_baseline"]:
+            return
+        if not options["baseline"] and not os.path.exists(baseline_path):
+            self.stderr.write(f"No baseline at {baseline_path}; skipping the comparison.")
+            return
+        with open(baseline_path, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = find_regressions(results, baseline, options["tolerance"])
+        if regressions:
+            lines = [f"{r['metric']}: {r['baseline']} -> {r['current']}" for r in regressions]
+            raise CommandError("Benchmark regressions past baseline:\n" + "\n".join(lines))
+        self.stderr.write("No regressions against baseline.")
@@ -0,0 +1,35 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from game.dictionaries import LANGUAGES, DictionaryArtifact, write_artifact
+
+
+class Command(BaseCommand):
+    help = "Compile the JSON word lists into memory-mappable dictionary artifacts (word table + DAWG)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language",
+            action="append",
+            choices=LANGUAGES,
+            help="Language to compile (repeatable). Defaults to all languages.",
+        )
+        parser.add_argument(
+            "--output-dir",
+            help="Directory for the artifacts. Defaults to settings.DICTIONARY_ARTIFACT_DIR.",
+        )
+
+    def handle(self, *args, **options):
+        for language in options["language"] or LANGUAGES:
+            started = time.perf_counter()
+            path = write_artifact(language, output_dir=options["output_dir"])
+            elapsed = time.perf_counter() - started
+            artifact = DictionaryArtifact.open(path)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{language}: {len(artifact.words)} words, {artifact.dawg.node_count} DAWG nodes, "
+                    f"{os.path.getsize(path)} bytes, version {artifact.version} -> {path} ({elapsed:.2f}s)"
+                )
+            )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from game.models import Challenge
+from game.packed_words import pack_challenge_words, unpack_challenge_words
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert stored challenges' valid words to packed dictionary ids (COMPACT_VALID_WORDS), "
+        "or back to JSON with --unpack (e.g. before replacing a dictionary)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--unpack", action="store_true", help="Expand packed challenges back to JSON lists.")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        if options["unpack"]:
+            queryset = Challenge.objects.filter(valid_words_packed__isnull=False)
+        else:
+            queryset = Challenge.objects.filter(valid_words_packed__isnull=True).exclude(valid_words=[])
+        fields = ["valid_words", "word_paths", "valid_words_packed", "dictionary_version"]
+
+        changed, skipped, batch = 0, 0, []
+        for challenge in queryset.iterator(chunk_size=options["batch_size"]):
+            if options["unpack"]:
+                unpacked = unpack_challenge_words(challenge)
+                challenge.valid_words = list(unpacked.words)
+                challenge.word_paths = unpacked.paths
+                challenge.valid_words_packed = None
+                challenge.dictionary_version = ""
+            elif not pack_challenge_words(challenge):
+                skipped += 1
+                continue
+            batch.append(challenge)
+            if len(batch) >= options["batch_size"]:
+                changed += Challenge.objects.bulk_update(batch, fields)
+                batch = []
+        if batch:
+            changed += Challenge.objects.bulk_update(batch, fields)
+
+        action = "unpacked" if options["unpack"] else "packed"
+        self.stdout.write(f"{changed} challenges {action}" + (f", {skipped} skipped." if skipped else "."))
@@ -0,0 +1,33 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from game.reaper import reap
+
+
+class Command(BaseCommand):
+    help = "Finalize expired sessions and garbage-collect abandoned guest practice games."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--no-gc", action="store_true", help="Only finalize sessions; keep practice rows.")
+        parser.add_argument("--grace-minutes", type=int, default=60,
+                            help="Minimum age of a session-less practice challenge before it is deleted.")
+        parser.add_argument("--loop", action="store_true", help="Keep reaping every --interval seconds.")
+        parser.add_argument("--interval", type=float, default=60.0)
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            metrics = reap(
+                batch_size=options["batch_size"],
+                gc_practice=not options["no_gc"],
+                grace=timedelta(minutes=options["grace_minutes"]),
+            )
+            elapsed_ms = (time.monotonic() - started) * 1000
+            summary = ", ".join(f"{name}={count}" for name, count in metrics.items())
+            self.stdout.write(f"Reaped in {elapsed_ms:.0f} ms: {summary}")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
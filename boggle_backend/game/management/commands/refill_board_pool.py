@@ -0,0 +1,35 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from game.board_pool import DEFAULT_BUCKETS, get_pool_depth, refill_pool
+
+
+class Command(BaseCommand):
+    help = "Top up the pre-solved board pool so each (size, difficulty, language) bucket holds --depth boards."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--depth", type=int, default=None, help="Boards per bucket (default: BOARD_POOL_DEPTH).")
+        parser.add_argument("--language", action="append", help="Only refill these languages.")
+        parser.add_argument("--loop", action="store_true", help="Keep refilling every --interval seconds.")
+        parser.add_argument("--interval", type=float, default=30.0)
+        parser.add_argument("--workers", type=int, default=None,
+                            help="Solver processes for candidate boards (default: GRID_GENERATOR_WORKERS).")
+
+    def handle(self, *args, **options):
+        depth = options["depth"] if options["depth"] is not None else get_pool_depth()
+        languages = options["language"] or ["en"]
+        workers = options["workers"] or getattr(settings, "GRID_GENERATOR_WORKERS", 1)
+        buckets = [(size, difficulty, language) for language in languages for size, difficulty, _ in DEFAULT_BUCKETS]
+
+        while True:
+            added = refill_pool(buckets, depth=depth, workers=workers)
+            total = sum(added.values())
+            for (size, difficulty, language), count in added.items():
+                if count:
+                    self.stdout.write(f"{size}x{size} {difficulty}/{language}: +{count}")
+            self.stdout.write(f"Board pool refilled ({total} boards added, depth {depth}).")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
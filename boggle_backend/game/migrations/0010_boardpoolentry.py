@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0009_challenge_language'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardPoolEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('size', models.PositiveSmallIntegerField()),
+                ('difficulty', models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], max_length=10)),
+                ('language', models.CharField(choices=[('en', 'English'), ('es', 'Spanish'), ('fr', 'French')], default='en', max_length=5)),
+                ('grid', models.JSONField()),
+                ('valid_words', models.JSONField(blank=True, default=list)),
+                ('word_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['size', 'difficulty', 'language', 'word_count'], name='game_boardp_size_326c2c_idx')],
+            },
+        ),
+    ]
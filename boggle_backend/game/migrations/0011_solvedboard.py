@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0010_boardpoolentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SolvedBoard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('grid', models.JSONField()),
+                ('language', models.CharField(choices=[('en', 'English'), ('es', 'Spanish'), ('fr', 'French')], default='en', max_length=5)),
+                ('min_length', models.PositiveSmallIntegerField(default=3)),
+                ('valid_words', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
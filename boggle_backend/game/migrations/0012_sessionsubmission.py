@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:10
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.utils.dateparse import parse_datetime
+
+
+def copy_submissions_to_rows(apps, schema_editor):
+    GameSession = apps.get_model('game', 'GameSession')
+    SessionSubmission = apps.get_model('game', 'SessionSubmission')
+    batch = []
+    for session in GameSession.objects.only('id', 'start_time', 'submissions').iterator():
+        seen = set()
+        for entry in session.submissions or []:
+            if not isinstance(entry, dict):
+                continue
+            word = (entry.get('word') or '').strip().upper()[:64]
+            is_valid = bool(entry.get('is_valid'))
+            score_delta = entry.get('score_delta') or 0
+            # Keep the first valid occurrence; later duplicates never scored.
+            if is_valid and word in seen:
+                is_valid, score_delta = False, 0
+            elif is_valid:
+                seen.add(word)
+            timestamp = entry.get('timestamp')
+            batch.append(SessionSubmission(
+                session_id=session.id,
+                word=word,
+                is_valid=is_valid,
+                score_delta=score_delta,
+                timestamp=(parse_datetime(timestamp) if isinstance(timestamp, str) else None) or session.start_time,
+            ))
+        if len(batch) >= 1000:
+            SessionSubmission.objects.bulk_create(batch)
+            batch = []
+    SessionSubmission.objects.bulk_create(batch)
+
+
+def copy_rows_to_submissions(apps, schema_editor):
+    GameSession = apps.get_model('game', 'GameSession')
+    SessionSubmission = apps.get_model('game', 'SessionSubmission')
+    by_session = {}
+    for row in SessionSubmission.objects.order_by('id').iterator():
+        by_session.setdefault(row.session_id, []).append({
+            'word': row.word,
+            'is_valid': row.is_valid,
+            'score_delta': row.score_delta,
+            'timestamp': row.timestamp.isoformat(),
+        })
+    for session_id, submissions in by_session.items():
+        GameSession.objects.filter(pk=session_id).update(submissions=submissions)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0011_solvedboard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionSubmission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=64)),
+                ('is_valid', models.BooleanField(default=False)),
+                ('score_delta', models.IntegerField(default=0)),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_rows', to='game.gamesession')),
+            ],
+            options={
+                'ordering': ['id'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('is_valid', True)), fields=('session', 'word'), name='unique_valid_word_per_session')],
+            },
+        ),
+        migrations.RunPython(copy_submissions_to_rows, copy_rows_to_submissions),
+        migrations.RemoveField(
+            model_name='gamesession',
+            name='submissions',
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:25
+
+from django.db import migrations, models
+
+
+def _first_path(grid, word):
+    # First 8-directional, non-repeating tile path spelling `word`, as [(row, col), ...].
+    tiles = [[('' if cell is None else str(cell)).strip().upper() for cell in row] for row in grid]
+    rows, cols = len(tiles), len(tiles[0]) if tiles else 0
+
+    def walk(r, c, idx, path):
+        tile = tiles[r][c]
+        if not tile or not word.startswith(tile, idx):
+            return None
+        path.append((r, c))
+        idx += len(tile)
+        if idx == len(word):
+            return list(path)
+        for nr in (r - 1, r, r + 1):
+            for nc in (c - 1, c, c + 1):
+                if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in path:
+                    found = walk(nr, nc, idx, path)
+                    if found:
+                        return found
+        path.pop()
+        return None
+
+    for r in range(rows):
+        for c in range(cols):
+            found = walk(r, c, 0, [])
+            if found:
+                return found
+    return None
+
+
+def trace_paths(grid, words):
+    traced = {}
+    for word in words:
+        word = (word or '').strip().upper()
+        if word and word not in traced:
+            path = _first_path(grid or [], word)
+            if path:
+                traced[word] = path
+    return traced
+
+
+def trace_existing_paths(apps, schema_editor):
+    Challenge = apps.get_model('game', 'Challenge')
+    batch = []
+    for challenge in Challenge.objects.exclude(valid_words=[]).only('id', 'grid', 'valid_words').iterator():
+        challenge.word_paths = trace_paths(challenge.grid, challenge.valid_words or [])
+        batch.append(challenge)
+        if len(batch) >= 500:
+            Challenge.objects.bulk_update(batch, ['word_paths'])
+            batch = []
+    Challenge.objects.bulk_update(batch, ['word_paths'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0012_sessionsubmission'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='word_paths',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(trace_existing_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0013_challenge_word_paths'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='dictionary_version',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+        migrations.AddField(
+            model_name='challenge',
+            name='valid_words_packed',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
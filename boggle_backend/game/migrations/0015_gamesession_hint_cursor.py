@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0014_challenge_valid_words_packed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamesession',
+            name='hint_cursor',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,9 +1,12 @@
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 # Dev A scan (FR-05): No session model exists yet; adding GameSession tied to Challenge.
 # Prior work: FR-02 Challenge model, FR-03 recipients/status, FR-04 soft-delete with active manager.
 from .slug_utils import generate_share_slug
+from .solver import trace_paths
 
 
 class ChallengeQuerySet(models.QuerySet):
@@ -52,6 +55,10 @@ class Challenge(models.Model):
     duration_seconds = models.PositiveIntegerField(null=True, blank=True)
     difficulty = models.CharField(max_length=10, choices=DIFFICULTY_CHOICES)
     valid_words = models.JSONField(default=list, blank=True)
+    word_paths = models.JSONField(default=dict, blank=True)  # {"WORD": [[row, col], ...]}, one path per valid word
+    # COMPACT_VALID_WORDS: words and paths packed against a dictionary version (see game/packed_words.py)
+    valid_words_packed = models.BinaryField(null=True, blank=True, editable=False)
+    dictionary_version = models.CharField(max_length=32, blank=True, default='')
     recipients = models.JSONField(default=list, blank=True)  # list of intended recipient identifiers
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_ACTIVE, db_index=True)
     language = models.CharField(max_length=5, choices=LANGUAGE_CHOICES, default=LANGUAGE_EN)
@@ -67,11 +74,44 @@ class Challenge(models.Model):
     def __str__(self):
         return f'Challenge {self.id} ({self.difficulty})'
 
+    # Written together when valid words are packed (see packed_words.pack_challenge_words).
+    PACKED_FIELDS = frozenset({'valid_words', 'word_paths', 'valid_words_packed', 'dictionary_version'})
+
     def save(self, *args, **kwargs):
         if not self.share_slug:
             self.share_slug = generate_share_slug()
+        update_fields = kwargs.get('update_fields')
+        if self.word_paths or self.valid_words:
+            if update_fields is None or 'word_paths' in update_fields:
+                # Keep stored paths that still spell their word on this grid; trace the rest.
+                self.word_paths = trace_paths(self.grid, self.valid_words or [], known=self.word_paths)
+        packs = update_fields is None or self.PACKED_FIELDS <= set(update_fields)
+        if getattr(settings, 'COMPACT_VALID_WORDS', False) and self.valid_words and packs:
+            from .packed_words import pack_challenge_words
+
+            pack_challenge_words(self)
         return super().save(*args, **kwargs)
 
+    @property
+    def is_packed(self):
+        return self.valid_words_packed is not None
+
+    def word_list(self):
+        """Valid words, whether stored as a JSON list or packed."""
+        if self.is_packed:
+            from .packed_words import unpack_challenge_words
+
+            return list(unpack_challenge_words(self).words)
+        return list(self.valid_words or [])
+
+    def word_path_map(self):
+        """{"WORD": [[row, col], ...]} for the valid words, whether stored as JSON or packed."""
+        if self.is_packed:
+            from .packed_words import unpack_challenge_words
+
+            return unpack_challenge_words(self).paths
+        return self.word_paths or {}
+
 
 class GameSession(models.Model):
     MODE_CHALLENGE = "challenge"
@@ -88,9 +128,9 @@ class GameSession(models.Model):
     end_time = models.DateTimeField(null=True, blank=True)
     duration_seconds = models.PositiveIntegerField(null=True, blank=True)  # will be set by FR-13
     score = models.IntegerField(default=0)
-    submissions = models.JSONField(default=list, blank=True)
     hint_uses = models.PositiveIntegerField(default=0)
     shuffle_uses = models.PositiveIntegerField(default=0)
+    hint_cursor = models.PositiveIntegerField(default=0)  # index into the challenge's hint order (game.hints)
 
     class Meta:
         ordering = ['-start_time']
@@ -113,3 +153,129 @@ class GameSession(models.Model):
             return False
         current_time = now or timezone.now()
         return current_time >= self.start_time + timezone.timedelta(seconds=self.duration_seconds)
+
+    @property
+    def submissions(self):
+        """
+        Submissions in order as [{"word", "is_valid", "score_delta", "timestamp"}, ...],
+        read from SessionSubmission rows. Assigning a list replaces them on the next save().
+        """
+        pending = getattr(self, '_pending_submissions', None)
+        if pending is not None:
+            return [row.as_dict() for row in pending]
+        if self.pk is None:
+            return []
+        return [row.as_dict() for row in self.submission_rows.all()]
+
+    @submissions.setter
+    def submissions(self, entries):
+        self._pending_submissions = [SessionSubmission.from_dict(entry) for entry in entries or []]
+
+    def found_words(self):
+        """Uppercase words this session has already scored."""
+        if self.pk is None:
+            return set()
+        return set(self.submission_rows.filter(is_valid=True).values_list('word', flat=True))
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        pending = getattr(self, '_pending_submissions', None)
+        if pending is not None:
+            self._pending_submissions = None
+            self.submission_rows.all().delete()
+            seen = set()
+            for row in pending:
+                row.session = self
+                if row.is_valid and row.word in seen:
+                    row.is_valid, row.score_delta = False, 0
+                elif row.is_valid:
+                    seen.add(row.word)
+            SessionSubmission.objects.bulk_create(pending)
+
+
+class SessionSubmission(models.Model):
+    """
+    One word submitted in a session. Appended with a single INSERT per word; a valid
+    word can only be recorded once per session.
+    """
+
+    session = models.ForeignKey(GameSession, on_delete=models.CASCADE, related_name='submission_rows')
+    word = models.CharField(max_length=64)
+    is_valid = models.BooleanField(default=False)
+    score_delta = models.IntegerField(default=0)
+    timestamp = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['session', 'word'],
+                condition=models.Q(is_valid=True),
+                name='unique_valid_word_per_session',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.word} in session {self.session_id}'
+
+    def as_dict(self):
+        return {
+            "word": self.word,
+            "is_valid": self.is_valid,
+            "score_delta": self.score_delta,
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+        }
+
+    @classmethod
+    def from_dict(cls, entry):
+        timestamp = entry.get("timestamp")
+        if isinstance(timestamp, str):
+            timestamp = parse_datetime(timestamp)
+        return cls(
+            word=(entry.get("word") or "").strip().upper()[:64],
+            is_valid=bool(entry.get("is_valid")),
+            score_delta=entry.get("score_delta") or 0,
+            timestamp=timestamp or timezone.now(),
+        )
+
+
+class BoardPoolEntry(models.Model):
+    """
+    A pre-solved board waiting to be handed out, bucketed by (size, difficulty, language).
+    Filled by `manage.py refill_board_pool`; consumed (deleted) by game.board_pool.take_board.
+    """
+
+    size = models.PositiveSmallIntegerField()
+    difficulty = models.CharField(max_length=10, choices=Challenge.DIFFICULTY_CHOICES)
+    language = models.CharField(max_length=5, choices=Challenge.LANGUAGE_CHOICES, default=Challenge.LANGUAGE_EN)
+    grid = models.JSONField()
+    valid_words = models.JSONField(default=list, blank=True)
+    word_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['size', 'difficulty', 'language', 'word_count']),
+        ]
+
+    def __str__(self):
+        return f'Pooled {self.size}x{self.size} {self.difficulty}/{self.language} board ({self.word_count} words)'
+
+
+class SolvedBoard(models.Model):
+    """
+    Second-tier (shared) entry of the solve cache in game.solve_cache.
+    `key` digests the canonical grid, language, min length, solver and dictionary
+    version, so all eight rotations/reflections of a board share one row and a new
+    word list starts fresh rows.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    grid = models.JSONField()
+    language = models.CharField(max_length=5, choices=Challenge.LANGUAGE_CHOICES, default=Challenge.LANGUAGE_EN)
+    min_length = models.PositiveSmallIntegerField(default=3)
+    valid_words = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'Solved {self.language} board ({len(self.valid_words)} words)'
@@ -0,0 +1,136 @@
+"""
+Compact storage for a challenge's valid words (settings.COMPACT_VALID_WORDS).
+
+Instead of a JSON list of strings, a packed challenge stores the words' indexes in
+the compiled dictionary (DictionaryArtifact.words) plus that artifact's version:
+
+    varint     word count
+    varint[n]  sorted word ids, delta-encoded (first id absolute)
+    paths      per word, in id order: one byte cell count, then flat cell indexes
+
+Unsigned varints use 7 bits per byte, low bits first. A 6x6 board's few hundred
+words pack into roughly one byte per word plus its path. Decoding needs the same
+dictionary version; results are cached per blob.
+"""
+import logging
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .dictionaries import DictionaryArtifact, load_dictionary_artifact
+
+logger = logging.getLogger(__name__)
+
+MAX_CELLS = 255
+
+
+class UnpackedWords(NamedTuple):
+    words: Tuple[str, ...]
+    word_set: frozenset
+    paths: Dict[str, List[List[int]]]
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def pack_words(words: Iterable[str], word_paths: Dict[str, Sequence[Sequence[int]]],
+               artifact: DictionaryArtifact, cols: int) -> Optional[bytes]:
+    """Pack words (and their paths) against `artifact`; None if a word is not in it or the board is too big."""
+    ids = set()
+    for word in words:
+        try:
+            ids.add(artifact.words.index((word or "").strip().upper()))
+        except ValueError:
+            return None
+
+    out = bytearray()
+    _write_varint(out, len(ids))
+    previous = 0
+    ordered = sorted(ids)
+    for word_id in ordered:
+        _write_varint(out, word_id - previous)
+        previous = word_id
+    for word_id in ordered:
+        cells = [r * cols + c for r, c in word_paths.get(artifact.words[word_id], ())]
+        if len(cells) > MAX_CELLS or any(cell > MAX_CELLS for cell in cells):
+            return None
+        out.append(len(cells))
+        out.extend(cells)
+    return bytes(out)
+
+
+def unpack_words(data: bytes, artifact: DictionaryArtifact, cols: int) -> UnpackedWords:
+    count, pos = _read_varint(data, 0)
+    ids = []
+    word_id = 0
+    for _ in range(count):
+        delta, pos = _read_varint(data, pos)
+        word_id += delta
+        ids.append(word_id)
+    words = tuple(artifact.words[word_id] for word_id in ids)
+    paths = {}
+    for word in words:
+        length = data[pos]
+        cells = data[pos + 1:pos + 1 + length]
+        pos += 1 + length
+        if length:
+            paths[word] = [list(divmod(cell, cols)) for cell in cells]
+    return UnpackedWords(words, frozenset(words), paths)
+
+
+@lru_cache(maxsize=256)
+def _unpack_cached(data: bytes, language: str, version: str, cols: int) -> Optional[UnpackedWords]:
+    artifact = load_dictionary_artifact(language)
+    if artifact is None or artifact.version != version:
+        return None
+    return unpack_words(data, artifact, cols)
+
+
+def unpack_challenge_words(challenge) -> UnpackedWords:
+    """
+    Decode a packed challenge's words and paths. If the dictionary it was packed
+    against is no longer loaded, the board is re-solved with the current one.
+    """
+    cols = len(challenge.grid[0]) if challenge.grid else 0
+    unpacked = _unpack_cached(
+        bytes(challenge.valid_words_packed), challenge.language, challenge.dictionary_version, cols,
+    )
+    if unpacked is None:
+        from .solve_cache import cached_solve
+
+        logger.warning(
+            "Challenge %s was packed against dictionary %s, which is not loaded; re-solving its board.",
+            challenge.pk, challenge.dictionary_version,
+        )
+        words = tuple(cached_solve(challenge.grid, language=challenge.language))
+        unpacked = UnpackedWords(words, frozenset(words), {})
+    return unpacked
+
+
+def pack_challenge_words(challenge) -> bool:
+    """Move a challenge's valid_words/word_paths into packed form. Returns whether it was packed."""
+    artifact = load_dictionary_artifact(challenge.language)
+    if artifact is None or not challenge.valid_words or not challenge.grid:
+        return False
+    data = pack_words(challenge.valid_words, challenge.word_paths or {}, artifact, len(challenge.grid[0]))
+    if data is None:
+        return False
+    challenge.valid_words_packed = data
+    challenge.dictionary_version = artifact.version
+    challenge.valid_words = []
+    challenge.word_paths = {}
+    return True
@@ -1,13 +1,24 @@
 import random
-from functools import lru_cache
-from typing import List
+import secrets
+import time
+from datetime import timedelta
+from typing import List, Optional, Sequence, Tuple
 
-from django.contrib.staticfiles import finders
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
-from api.boggle_solver import Boggle  # reuse existing solver
-from .difficulty import difficulty_to_size
-from .models import Challenge
-from .boggle_engine import _normalize_word
+from .board_pool import take_board
+from .difficulty import difficulty_to_size, get_difficulty_config
+from .live_sessions import CacheSessionStore
+from .models import Challenge, GameSession
+from .dictionaries import load_words
+from .solver import solve_paths, trace_paths
+from accounts.stats import record_session_stats
+
+# creator_user_id of practice challenges dealt to guests.
+GUEST_PRACTICE_CREATOR = "practice"
 
 
 def get_letter_pool(difficulty: str) -> str:
@@ -23,32 +34,30 @@ def generate_practice_grid(size: int, difficulty: str = "easy") -> List[List[str
     return [[random.choice(letters) for _ in range(size)] for _ in range(size)]
 
 
-@lru_cache(maxsize=1)
-def load_full_dictionary() -> List[str]:
-    path = finders.find("data/full-wordlist.json")
-    if not path:
-        return []
-    import json
-    with open(path, 'r') as f:
-        data = json.load(f)
-    words = []
-    for v in data.values():
-        if isinstance(v, list):
-            words.extend(v)
-    return [_normalize_word(w) for w in words]
+def load_full_dictionary() -> Sequence[str]:
+    return load_words("en")
+
+
+def _practice_board(difficulty: str) -> Tuple[List[List[str]], List[str], dict]:
+    """(grid, valid_words, word_paths) from the board pool, or generated and solved live."""
+    size = difficulty_to_size(difficulty)
+    pooled = take_board(size, difficulty or "easy", "en")
+    word_paths = {}
+    if pooled is not None:
+        grid, valid_words = pooled
+    else:
+        grid = generate_practice_grid(size, difficulty)
+        word_paths = solve_paths(grid)
+        valid_words = list(word_paths) if word_paths else list(load_full_dictionary()[:1000])
+    return grid, valid_words, word_paths
 
 
 def create_practice_challenge(difficulty: str, user_id: str | None) -> Challenge:
     """
     Create a transient Challenge record for practice mode using a generated grid and computed valid words.
     """
-    size = difficulty_to_size(difficulty)
-    grid = generate_practice_grid(size, difficulty)
-    dictionary = load_full_dictionary()
-    boggle = Boggle(grid, dictionary)
-    solutions = boggle.getSolution()
-    valid_words = list(solutions) if solutions else dictionary[:1000]
-    creator = user_id or "practice"
+    grid, valid_words, word_paths = _practice_board(difficulty)
+    creator = user_id or GUEST_PRACTICE_CREATOR
     return Challenge.objects.create(
         creator_user_id=str(creator),
         title="Practice",
@@ -56,6 +65,165 @@ def create_practice_challenge(difficulty: str, user_id: str | None) -> Challenge
         grid=grid,
         difficulty=difficulty or "easy",
         valid_words=valid_words,
+        word_paths=word_paths,
+        recipients=[],
+        status=Challenge.STATUS_ACTIVE,
+    )
+
+
+# Ephemeral practice: the board and session state live only in the cache
+# settings.PRACTICE_CACHE, under a random token, until they expire
+# (duration + PRACTICE_TTL_GRACE_SECONDS). Nothing touches the database unless a
+# registered player finishes the game and keeps it (end_ephemeral_practice).
+# The regular session views serve these games through EphemeralPracticeStore.
+
+class EphemeralPracticeStore(CacheSessionStore):
+    """
+    Live state of ephemeral practice games, keyed by token. Each state also carries
+    the game's board, player and timer (see start_ephemeral_practice). There is no
+    database row to write back to, so checkpoints and close() keep the state in the
+    cache; end_ephemeral_practice removes it.
+    """
+
+    key_prefix = "practice"
+
+    def _key_of(self, session):
+        return session.practice_token
+
+    def _load(self, session):
+        # Fall back to the snapshot the session was built from.
+        state = self._get(self._key_of(session))
+        return state if state is not None else session.practice_state
+
+    def _persist(self, session_id, state):
+        pass
+
+    def _sync(self, session, state):
+        super()._sync(session, state)
+        session.practice_state = state
+
+    def add(self, state: dict) -> None:
+        """Hold a newly dealt game."""
+        self._set(state["token"], state)
+
+    def state(self, token: str) -> Optional[dict]:
+        return self._get(token)
+
+    def close(self, session):
+        # Timed-out games stay until the player ends them (and may keep them) or the TTL lapses.
+        state = self._get(self._key_of(session))
+        if state is not None:
+            self._sync(session, state)
+
+    def pop(self, session: GameSession) -> Optional[dict]:
+        """Remove the game and return its final state, or None if it already ended or expired."""
+        key = self._key_of(session)
+        with self._lock(key):
+            state = self._get(key)
+            if state is not None:
+                self._delete(key)
+        if state is not None:
+            self._sync(session, state)
+        return state
+
+
+def get_practice_store() -> EphemeralPracticeStore:
+    return EphemeralPracticeStore(
+        getattr(settings, "PRACTICE_CACHE", "default"),
+        grace_seconds=getattr(settings, "PRACTICE_TTL_GRACE_SECONDS", 600),
+    )
+
+
+def start_ephemeral_practice(difficulty: str, user_id: str | None) -> dict:
+    """Deal a practice board into the TTL store and return its state (including the token)."""
+    difficulty = difficulty or "easy"
+    grid, valid_words, word_paths = _practice_board(difficulty)
+    cfg = get_difficulty_config(difficulty)
+    duration = cfg["duration_seconds"] if cfg else None
+    start_time = timezone.now()
+    state = {
+        "token": secrets.token_urlsafe(16),
+        "player_user_id": user_id,
+        "difficulty": difficulty,
+        "language": Challenge.LANGUAGE_EN,
+        "grid": grid,
+        "valid_words": valid_words,
+        "word_paths": word_paths or trace_paths(grid, valid_words),
+        "start_time": start_time.isoformat(),
+        "duration_seconds": duration,
+        # Live state in the _WriteBehindStore layout.
+        "score": 0,
+        "hint_uses": 0,
+        "shuffle_uses": 0,
+        "hint_cursor": 0,
+        "found": [],
+        "pending": [],
+        "checkpoint_at": time.time(),
+        "expires_at": (start_time + timedelta(seconds=duration)).timestamp() if duration is not None else None,
+    }
+    get_practice_store().add(state)
+    return state
+
+
+def ephemeral_challenge(state: dict) -> Challenge:
+    """An unsaved Challenge for the board, so the regular word checks and hints apply."""
+    return Challenge(
+        creator_user_id=str(state["player_user_id"] or GUEST_PRACTICE_CREATOR),
+        title="Practice",
+        description="Practice board",
+        grid=state["grid"],
+        difficulty=state["difficulty"],
+        language=state["language"],
+        valid_words=state["valid_words"],
+        word_paths=state["word_paths"],
         recipients=[],
         status=Challenge.STATUS_ACTIVE,
     )
+
+
+def get_ephemeral_session(token: str) -> Optional[GameSession]:
+    """An unsaved GameSession for a live ephemeral game, or None if it ended or expired."""
+    state = get_practice_store().state(token)
+    if state is None:
+        return None
+    session = GameSession(
+        challenge=ephemeral_challenge(state),
+        player_user_id=state["player_user_id"],
+        mode=GameSession.MODE_PRACTICE,
+        start_time=parse_datetime(state["start_time"]),
+        duration_seconds=state["duration_seconds"],
+        score=state["score"],
+        hint_uses=state["hint_uses"],
+        shuffle_uses=state["shuffle_uses"],
+        hint_cursor=state["hint_cursor"],
+    )
+    session.practice_token = token
+    session.practice_state = state
+    return session
+
+
+def end_ephemeral_practice(session: GameSession, keep: bool) -> Optional[dict]:
+    """
+    End an ephemeral game and return its final state (None if it already ended or
+    expired). With `keep`, it is saved as a practice Challenge and GameSession for the
+    player's stats, and `session` becomes that saved row.
+    """
+    state = get_practice_store().pop(session)
+    if state is not None and keep:
+        _persist_ephemeral_practice(session, state)
+    return state
+
+
+def _persist_ephemeral_practice(session: GameSession, state: dict) -> None:
+    end_time = timezone.now()
+    if session.duration_seconds is not None:
+        # A game ended after its timer ran out finished when the timer did.
+        end_time = min(end_time, session.start_time + timedelta(seconds=session.duration_seconds))
+    challenge = session.challenge
+    with transaction.atomic():
+        challenge.save()
+        session.challenge = challenge
+        session.end_time = end_time
+        session.submissions = state["pending"]
+        session.save()
+        record_session_stats(session)
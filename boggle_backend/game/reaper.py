@@ -0,0 +1,157 @@
+"""
+Finalize sessions whose timer ran out without anyone ending them, and clean up what
+guest practice games leave behind. Run periodically via `manage.py reap_sessions`.
+
+Expired sessions get end_time = start_time + duration_seconds with one UPDATE per
+(duration, batch). Their buffered live state is flushed first, challenge sessions are
+added to their leaderboard, players' stats rollups are updated, and any that played
+the daily challenge of the day they started get a daily result. Ended guest practice
+sessions are then deleted, followed by practice challenges no session refers to any more.
+
+Deploys run it as the `worker` process in the Procfile (`reap_sessions --loop`).
+
+Sessions are only finalized when the live session store is shared with the web
+workers; a process-local store's buffered state cannot be flushed from here.
+"""
+import logging
+from datetime import timedelta
+from typing import Dict, List
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from accounts.daily import record_daily_result
+from accounts.leaderboards import record_session_results
+from accounts.stats import record_session_stats
+from accounts.models import DailyChallenge
+
+from .live_sessions import DatabaseSessionStore, get_live_session_store
+from .models import Challenge, GameSession
+from .practice import GUEST_PRACTICE_CREATOR
+
+logger = logging.getLogger(__name__)
+
+
+def _batches(ids: List[int], size: int):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def finalize_expired_sessions(now=None, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Set end_time on expired open sessions and add them to leaderboards and player stats.
+    Returns {"finalized", "live_flushed", "daily_results", "leaderboard_entries", "stats_updated"}.
+    """
+    now = now or timezone.now()
+    metrics = {"finalized": 0, "live_flushed": 0, "daily_results": 0, "leaderboard_entries": 0, "stats_updated": 0}
+    store = get_live_session_store()
+    if not store.shared:
+        # Buffered scores live in the web workers' memory, out of this process's reach;
+        # finalizing here would record stale scores on leaderboards and stats.
+        logger.warning(
+            "Not finalizing expired sessions: the %s live session store is local to each process. "
+            "Use LIVE_SESSION_STORE='database', or 'cache' with a shared CACHES backend.",
+            type(store).__name__,
+        )
+        return metrics
+    open_sessions = GameSession.objects.filter(end_time__isnull=True, duration_seconds__isnull=False)
+    durations = open_sessions.values_list("duration_seconds", flat=True).distinct()
+    for duration in list(durations):
+        delta = timedelta(seconds=duration)
+        expired = open_sessions.filter(duration_seconds=duration, start_time__lte=now - delta)
+        ids = list(expired.order_by("pk").values_list("pk", flat=True))
+        for batch in _batches(ids, batch_size):
+            if not isinstance(store, DatabaseSessionStore):
+                # Write buffered gameplay state back before the row is finalized.
+                for session in GameSession.objects.filter(pk__in=batch):
+                    store.close(session)
+                    metrics["live_flushed"] += 1
+            with transaction.atomic():
+                # Lock the rows so a session ended by a request meanwhile is neither
+                # finalized again nor counted twice on its leaderboard.
+                batch = list(
+                    GameSession.objects.select_for_update()
+                    .filter(pk__in=batch, end_time__isnull=True)
+                    .values_list("pk", flat=True)
+                )
+                metrics["finalized"] += GameSession.objects.filter(pk__in=batch).update(
+                    end_time=F("start_time") + delta
+                )
+                metrics["leaderboard_entries"] += record_session_results(
+                    GameSession.objects.filter(pk__in=batch, mode=GameSession.MODE_CHALLENGE)
+                )
+                # Oldest first, so each player's days arrive in order.
+                for session in GameSession.objects.filter(pk__in=batch, player_user_id__isnull=False).order_by("end_time"):
+                    record_session_stats(session)
+                    metrics["stats_updated"] += 1
+            metrics["daily_results"] += _record_daily_results(batch)
+    return metrics
+
+
+def _record_daily_results(session_ids: List[int]) -> int:
+    """Daily results for sessions that played the daily challenge of the day they started."""
+    sessions = list(
+        GameSession.objects.filter(pk__in=session_ids, player_user_id__isnull=False).select_related("challenge")
+    )
+    # A session reaped after midnight still belongs to the day it was played.
+    played_on = {session.pk: timezone.localdate(session.start_time) for session in sessions}
+    dailies = dict(
+        DailyChallenge.objects.filter(date__in=set(played_on.values())).values_list("date", "challenge_id")
+    )
+    recorded = 0
+    for session in sessions:
+        day = played_on[session.pk]
+        if dailies.get(day) != session.challenge_id:
+            continue
+        record_daily_result(
+            session.challenge, None, session.score, session_obj=session,
+            player_user_id=session.player_user_id, for_date=day,
+        )
+        recorded += 1
+    return recorded
+
+
+def collect_guest_practice(now=None, batch_size: int = 500, grace: timedelta = timedelta(hours=1)) -> Dict[str, int]:
+    """
+    Delete ended guest practice sessions, then practice challenges with no sessions left
+    (older than `grace`, so a board dealt moments ago is not taken from under its session).
+    """
+    now = now or timezone.now()
+    metrics = {"guest_sessions_deleted": 0, "practice_challenges_deleted": 0}
+
+    session_ids = list(
+        GameSession.objects.filter(
+            mode=GameSession.MODE_PRACTICE, player_user_id__isnull=True, end_time__isnull=False,
+        ).order_by("pk").values_list("pk", flat=True)
+    )
+    for batch in _batches(session_ids, batch_size):
+        with transaction.atomic():
+            # Count sessions only; the cascade also removes their submission rows.
+            metrics["guest_sessions_deleted"] += GameSession.objects.filter(pk__in=batch).delete()[1].get(
+                GameSession._meta.label, 0
+            )
+
+    orphan_ids = list(
+        Challenge.objects.filter(
+            creator_user_id=GUEST_PRACTICE_CREATOR, sessions__isnull=True, daily_entries__isnull=True,
+            created_at__lt=now - grace,
+        ).order_by("pk").values_list("pk", flat=True)
+    )
+    for batch in _batches(orphan_ids, batch_size):
+        with transaction.atomic():
+            metrics["practice_challenges_deleted"] += Challenge.objects.filter(
+                pk__in=batch, sessions__isnull=True,
+            ).delete()[1].get(Challenge._meta.label, 0)
+    return metrics
+
+
+def reap(now=None, batch_size: int = 500, gc_practice: bool = True,
+         grace: timedelta = timedelta(hours=1)) -> Dict[str, int]:
+    """One reaper pass; returns how many rows each step touched."""
+    now = now or timezone.now()
+    metrics = finalize_expired_sessions(now, batch_size)
+    if gc_practice:
+        metrics.update(collect_guest_practice(now, batch_size, grace))
+    logger.info("Session reaper: %s", metrics)
+    return metrics
@@ -1,13 +1,17 @@
 from rest_framework import serializers
 
-from .models import Challenge, GameSession
+from django.db.models import Count, Q
+
+from .models import Challenge, GameSession, SessionSubmission
 from .difficulty import get_difficulty_config, validate_grid_for_difficulty
-from .word_solver import solve_boggle
+from .solver import solve_paths
 from django.utils import timezone
 # Plan for FR-06: Add a submission serializer for one-word submission.
 
 
 class ChallengeSerializer(serializers.ModelSerializer):
+    valid_words = serializers.SerializerMethodField()
+
     class Meta:
         model = Challenge
         fields = [
@@ -28,6 +32,9 @@ class ChallengeSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ('id', 'creator_user_id', 'valid_words', 'status', 'share_slug', 'created_at', 'updated_at')
 
+    def get_valid_words(self, obj):
+        return obj.word_list()
+
     def validate_recipients(self, value):
         if value is None:
             return []
@@ -126,18 +133,19 @@ class ChallengeSerializer(serializers.ModelSerializer):
         
         logger.info(f"[ChallengeSerializer] Solving boggle for grid={grid}, language={language}")
         
-        # Solve the boggle to find all valid words
+        # Solve the boggle to find all valid words, keeping the path the search traced for each
         try:
-            valid_words = solve_boggle(grid, language=language)
-            logger.info(f"[ChallengeSerializer] Found {len(valid_words)} valid words")
+            word_paths = solve_paths(grid, language=language)
+            logger.info(f"[ChallengeSerializer] Found {len(word_paths)} valid words")
         except Exception as e:
             # Log the error for debugging
-            logger.error(f"[ChallengeSerializer] solve_boggle failed: {e}")
+            logger.error(f"[ChallengeSerializer] solve_paths failed: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            valid_words = []
+            word_paths = {}
         
-        validated_data['valid_words'] = valid_words
+        validated_data['valid_words'] = list(word_paths)
+        validated_data['word_paths'] = word_paths
         
         return super().create(validated_data)
 
@@ -158,11 +166,23 @@ class ChallengeListSerializer(serializers.ModelSerializer):
         ]
 
 
+class SessionSubmissionSerializer(serializers.ModelSerializer):
+    """Read-through view of SessionSubmission rows in the original `submissions` entry shape."""
+    timestamp = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SessionSubmission
+        fields = ['word', 'is_valid', 'score_delta', 'timestamp']
+
+    def get_timestamp(self, obj):
+        return obj.timestamp.isoformat() if obj.timestamp else None
+
+
 class GameSessionSerializer(serializers.ModelSerializer):
     challenge_id = serializers.IntegerField(write_only=True)
     challenge = serializers.PrimaryKeyRelatedField(read_only=True)
     duration_seconds = serializers.IntegerField(read_only=True, allow_null=True)
-    submissions = serializers.JSONField(read_only=True)
+    submissions = SessionSubmissionSerializer(source='submission_rows', many=True, read_only=True)
     remaining_seconds = serializers.SerializerMethodField()
     challenge_title = serializers.SerializerMethodField()
     challenge_grid = serializers.SerializerMethodField()
@@ -257,8 +277,8 @@ class GameSessionSerializer(serializers.ModelSerializer):
         from accounts.models import User
 
         sessions = GameSession.objects.filter(challenge=obj.challenge).only(
-            "id", "player_user_id", "score", "end_time", "submissions", "start_time"
-        )
+            "id", "player_user_id", "score", "end_time", "start_time"
+        ).annotate(valid_word_count=Count("submission_rows", filter=Q(submission_rows__is_valid=True)))
         user_ids = {s.player_user_id for s in sessions if s.player_user_id}
 
         numeric_ids = [uid for uid in user_ids if uid and str(uid).isdigit()]
@@ -273,7 +293,7 @@ class GameSessionSerializer(serializers.ModelSerializer):
             uid_str = str(uid)
             user_obj = users_by_pk.get(uid_str) or users_by_fb.get(uid_str)
             name = self._display_name(user_obj, uid_str)
-            words = sum(1 for sub in s.submissions if sub.get("is_valid"))
+            words = s.valid_word_count
             status = "Finished" if s.end_time else "Playing"
 
             existing = players_map.get(uid_str)
@@ -332,3 +352,11 @@ class SessionSubmitWordSerializer(serializers.Serializer):
         if not value:
             raise serializers.ValidationError("Word cannot be empty.")
         return value
+
+
+class SubmittedWordSerializer(SessionSubmitWordSerializer):
+    timestamp = serializers.DateTimeField(required=False)
+
+
+class SessionSubmitWordsSerializer(serializers.Serializer):
+    words = serializers.ListField(child=SubmittedWordSerializer(), allow_empty=False, max_length=100)
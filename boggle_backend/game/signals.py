@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .boggle_engine import get_valid_word_cache
+from .hints import get_hint_index_cache
+from .models import Challenge
+
+
+@receiver(post_save, sender=Challenge)
+@receiver(post_delete, sender=Challenge)
+def invalidate_valid_words(sender, instance, **kwargs):
+    """Drop the cached valid-word set and hint index of an edited or deleted challenge."""
+    get_valid_word_cache().invalidate(instance.pk)
+    get_hint_index_cache().invalidate(instance.pk)
@@ -0,0 +1,124 @@
+"""
+Solve-result cache keyed by a board's canonical form.
+
+Rotating or reflecting a board never changes which words it contains, so results are
+stored under the lexicographically smallest of the grid's eight symmetries (plus
+language, minimum word length and solver). Lookups go to an in-process LRU first and,
+when settings.SOLVE_CACHE_DB is on, to the SolvedBoard table before running the DFS.
+Both tiers are versioned by the language's dictionary digest, so changing the word
+list (or recompiling it) never serves solutions found against the old one.
+"""
+import hashlib
+import json
+import logging
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError
+
+from .boggle_engine import VersionedLRU, lazy_lru
+from .dictionaries import dictionary_version, normalize_language
+
+logger = logging.getLogger(__name__)
+
+CanonicalGrid = Tuple[Tuple[str, ...], ...]
+CacheKey = Tuple[str, str, int, CanonicalGrid]
+
+
+def _normalize_cells(grid: Sequence[Sequence[str]]) -> CanonicalGrid:
+    return tuple(tuple(("" if cell is None else str(cell).strip().upper()) for cell in row) for row in grid)
+
+
+def grid_symmetries(grid: Sequence[Sequence[str]]) -> List[CanonicalGrid]:
+    """The four rotations of the grid and of its transpose (the dihedral group D4)."""
+    current = _normalize_cells(grid)
+    if not current:
+        return [current]
+    symmetries = []
+    for base in (current, tuple(zip(*current))):
+        for _ in range(4):
+            symmetries.append(base)
+            base = tuple(zip(*base[::-1]))  # rotate 90 degrees clockwise
+    return symmetries
+
+
+def canonical_grid(grid: Sequence[Sequence[str]]) -> CanonicalGrid:
+    return min(grid_symmetries(grid))
+
+
+class SolveCache(VersionedLRU):
+    """Canonical board key -> (dictionary version, solved words)."""
+
+
+get_solve_cache = lazy_lru("SOLVE_CACHE_SIZE", SolveCache)
+
+
+def _solver_name(solver: Callable) -> str:
+    return f"{solver.__module__}.{solver.__qualname__}"
+
+
+def make_key(grid, language: str = "en", min_length: int = 3, solver: Callable = None) -> CacheKey:
+    if solver is None:
+        from .solver import solve as solver
+    return (_solver_name(solver), normalize_language(language), min_length, canonical_grid(grid))
+
+
+def _db_key(key: CacheKey, version: str) -> str:
+    return hashlib.sha256(json.dumps([key, version], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _db_enabled() -> bool:
+    return getattr(settings, "SOLVE_CACHE_DB", False)
+
+
+def _db_get(key: CacheKey, version: str) -> Optional[List[str]]:
+    from .models import SolvedBoard
+
+    try:
+        row = SolvedBoard.objects.filter(key=_db_key(key, version)).values_list("valid_words", flat=True).first()
+    except DatabaseError:
+        logger.warning("Solve cache DB tier unavailable; solving in-process.", exc_info=True)
+        return None
+    return row
+
+
+def _db_put(key: CacheKey, version: str, words: Sequence[str]) -> None:
+    from .models import SolvedBoard
+
+    _, language, min_length, grid = key
+    try:
+        SolvedBoard.objects.get_or_create(
+            key=_db_key(key, version),
+            defaults={"grid": [list(row) for row in grid], "language": language,
+                      "min_length": min_length, "valid_words": list(words)},
+        )
+    except (IntegrityError, DatabaseError):
+        logger.warning("Could not persist solve result.", exc_info=True)
+
+
+def cached_solve(grid, language: str = "en", min_length: int = 3, solver: Callable = None) -> List[str]:
+    """
+    Return solver(grid, language, min_length), reusing any earlier result for the same
+    board or any of its rotations/reflections. Defaults to game.solver.solve.
+    """
+    if solver is None:
+        from .solver import solve as solver
+    key = make_key(grid, language, min_length, solver)
+    version = dictionary_version(language)
+    cache = get_solve_cache()
+
+    words = cache.get(key, version)
+    if words is not None:
+        return list(words)
+
+    if _db_enabled():
+        stored = _db_get(key, version)
+        if stored is not None:
+            cache.put(key, version, tuple(stored))
+            return list(stored)
+
+    result = list(solver(grid, language, min_length))
+    cache.put(key, version, tuple(result))
+    if _db_enabled():
+        _db_put(key, version, result)
+    return result
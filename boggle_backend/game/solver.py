@@ -0,0 +1,326 @@
+"""
+The Boggle solver engine. Every place that needs words from a board goes through here:
+
+    solve(grid)              -> sorted words on the board
+    solve_paths(grid)        -> {word: one tile path} for every word on the board
+    trace_paths(grid, words) -> {word: one tile path} for given words that fit the board
+    solve_many(grids)        -> solve() for a batch, optionally across processes
+    paths(grid, word)        -> tile paths [(row, col), ...] spelling a word
+    is_on_board(grid, word)  -> whether any such path exists
+
+Tiles are trimmed and uppercased; multi-letter tiles ("QU", "ST", "IE") are matched
+one character at a time; empty cells never match. Words are checked against the
+language's DAWG (memory-mapped from the compiled artifact when available) or an
+explicit `dawg` for ad-hoc dictionaries.
+"""
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .dawg import Dawg, NO_NODE
+from .dictionaries import load_dictionary_artifact, load_words
+
+logger = logging.getLogger(__name__)
+
+Path = List[Tuple[int, int]]
+
+
+@lru_cache(maxsize=4)
+def _load_dictionary(language: str = 'en') -> Sequence[str]:
+    """Load and cache the dictionary for a language (compiled artifact or JSON)."""
+    return load_words(language)
+
+
+@lru_cache(maxsize=4)
+def _get_dawg(language: str = 'en') -> Dawg:
+    """Use the memory-mapped DAWG when compiled, otherwise build and cache one."""
+    artifact = load_dictionary_artifact(language)
+    if artifact is not None:
+        return artifact.dawg
+    return Dawg.from_words(_load_dictionary(language))
+
+
+@lru_cache(maxsize=None)
+def _neighbor_table(rows: int, cols: int) -> Tuple[Tuple[int, ...], ...]:
+    """Flat-index neighbor lists for a rows x cols board (computed once per size)."""
+    table = []
+    for r in range(rows):
+        for c in range(cols):
+            table.append(tuple(
+                nr * cols + nc
+                for nr in (r - 1, r, r + 1)
+                for nc in (c - 1, c, c + 1)
+                if (nr, nc) != (r, c) and 0 <= nr < rows and 0 <= nc < cols
+            ))
+    return tuple(table)
+
+
+# Warm the common board sizes at import.
+for _size in (4, 5, 6):
+    _neighbor_table(_size, _size)
+
+
+def _tiles(grid: Sequence[Sequence[str]]) -> List[str]:
+    return [("" if cell is None else str(cell)).strip().upper() for row in grid for cell in row]
+
+
+def solve(grid: Sequence[Sequence[str]], language: str = 'en', min_length: int = 3,
+          dawg: Optional[Dawg] = None) -> List[str]:
+    """
+    Find all words on a board.
+
+    Cells are addressed by flat index with an integer bitmask for visited tiles and
+    precomputed neighbor lists, and the current word lives on one reusable character
+    stack that is only joined when a word is found.
+
+    Args:
+        grid: 2D list of tiles (e.g., [['A','B'],['QU','D']])
+        language: Language code ('en', 'es', 'fr'); ignored when `dawg` is given
+        min_length: Minimum word length in characters (default 3)
+        dawg: Dictionary to solve against instead of the language's word list
+
+    Returns:
+        Sorted list of uppercase words found on the board
+    """
+    return sorted(_search(grid, language, min_length, dawg, with_paths=False))
+
+
+def solve_paths(grid: Sequence[Sequence[str]], language: str = 'en', min_length: int = 3,
+                dawg: Optional[Dawg] = None) -> Dict[str, Path]:
+    """
+    Like solve(), but maps each word to the first tile path the search traced for it,
+    as [(row, col), ...]. Keys are in sorted order.
+    """
+    found = _search(grid, language, min_length, dawg, with_paths=True)
+    return {word: found[word] for word in sorted(found)}
+
+
+def _search(grid, language, min_length, dawg, with_paths):
+    if not grid or not grid[0]:
+        return {}
+
+    if dawg is None:
+        dawg = _get_dawg(language)
+    offsets, labels, targets, terminal = dawg.offsets, dawg.labels, dawg.targets, dawg.terminal
+    rows = len(grid)
+    cols = len(grid[0])
+    neighbors = _neighbor_table(rows, cols)
+
+    # Flatten and normalize once; each tile keeps its text and edge label codes.
+    # Empty cells get a code no edge carries, so they never match.
+    tiles = _tiles(grid)
+    codes = [tuple(ord(ch) for ch in tile) or (-1,) for tile in tiles]
+
+    found_words: Dict[str, Optional[Path]] = {}
+    stack: List[str] = []
+    cells: List[int] = []
+
+    def step(node: int, tile_codes: tuple) -> int:
+        # Multi-character tiles like "QU" traverse one edge per char
+        for code in tile_codes:
+            lo = offsets[node]
+            hi = offsets[node + 1]
+            k = bisect_left(labels, code, lo, hi)
+            if k == hi or labels[k] != code:
+                return NO_NODE
+            node = targets[k]
+        return node
+
+    def dfs(i: int, node: int, visited: int, length: int):
+        if length >= min_length and terminal[node >> 3] >> (node & 7) & 1:
+            word = ''.join(stack)
+            if word not in found_words:
+                found_words[word] = [divmod(k, cols) for k in cells] if with_paths else None
+
+        # Early termination: if no words start with this prefix, stop
+        lo = offsets[node]
+        hi = offsets[node + 1]
+        if lo == hi:
+            return
+
+        for j in neighbors[i]:
+            if visited >> j & 1:
+                continue
+            tile_codes = codes[j]
+            if len(tile_codes) == 1:
+                # Single-letter fast path: one bisect over this node's edge range
+                k = bisect_left(labels, tile_codes[0], lo, hi)
+                if k == hi or labels[k] != tile_codes[0]:
+                    continue
+                next_node = targets[k]
+            else:
+                next_node = step(node, tile_codes)
+            if next_node != NO_NODE:
+                stack.append(tiles[j])
+                cells.append(j)
+                dfs(j, next_node, visited | (1 << j), length + len(tiles[j]))
+                cells.pop()
+                stack.pop()
+
+    for i, tile in enumerate(tiles):
+        if tile:
+            start_node = step(Dawg.ROOT, codes[i])
+            if start_node != NO_NODE:
+                stack.append(tile)
+                cells.append(i)
+                dfs(i, start_node, 1 << i, len(tile))
+                cells.pop()
+                stack.pop()
+
+    return found_words
+
+
+def paths(grid: Sequence[Sequence[str]], word: str, limit: Optional[int] = None) -> List[Path]:
+    """
+    Every way `word` can be traced on the board with 8-directional adjacency and no
+    reused tile, as lists of (row, col). Stops after `limit` paths when given.
+    Dictionary membership is not checked.
+    """
+    target = (word or "").strip().upper()
+    if not grid or not grid[0] or not target:
+        return []
+
+    rows = len(grid)
+    cols = len(grid[0])
+    neighbors = _neighbor_table(rows, cols)
+    tiles = _tiles(grid)
+    found: List[Path] = []
+    stack: List[int] = []
+
+    def dfs(i: int, idx: int, visited: int) -> bool:
+        # Returns True once `limit` paths have been collected.
+        tile = tiles[i]
+        if not tile or not target.startswith(tile, idx):
+            return False
+        stack.append(i)
+        next_idx = idx + len(tile)
+        if next_idx == len(target):
+            found.append([divmod(k, cols) for k in stack])
+            done = limit is not None and len(found) >= limit
+        else:
+            done = any(
+                dfs(j, next_idx, visited | (1 << j))
+                for j in neighbors[i] if not visited >> j & 1
+            )
+        stack.pop()
+        return done
+
+    for i in range(rows * cols):
+        if dfs(i, 0, 1 << i):
+            break
+    return found
+
+
+def is_on_board(grid: Sequence[Sequence[str]], word: str) -> bool:
+    """Whether `word` can be traced on the board (dictionary membership is not checked)."""
+    return bool(paths(grid, word, limit=1))
+
+
+def _spells(tiles: List[str], rows: int, cols: int, word: str, path) -> bool:
+    """Whether `path` ([(row, col), ...]) spells `word` through adjacent, unrepeated tiles."""
+    try:
+        cells = [(int(r), int(c)) for r, c in path]
+    except (TypeError, ValueError):
+        return False
+    if not cells or len(set(cells)) != len(cells):
+        return False
+    if any(not (0 <= r < rows and 0 <= c < cols) for r, c in cells):
+        return False
+    if any(max(abs(r0 - r1), abs(c0 - c1)) != 1 for (r0, c0), (r1, c1) in zip(cells, cells[1:])):
+        return False
+    return "".join(tiles[r * cols + c] for r, c in cells) == word
+
+
+def trace_paths(grid: Sequence[Sequence[str]], words: Iterable[str],
+                known: Optional[Dict[str, Path]] = None) -> Dict[str, Path]:
+    """
+    One tile path per word for words found elsewhere (pool, cache, stored lists); misses
+    are left out. Paths in `known` that still spell their word on this grid are reused,
+    so only new words (or words moved by a grid edit) are searched.
+    """
+    known = known or {}
+    rows = len(grid) if grid else 0
+    cols = len(grid[0]) if rows else 0
+    tiles = _tiles(grid) if cols else []
+    traced = {}
+    for word in words:
+        word = (word or "").strip().upper()
+        if not word or word in traced:
+            continue
+        path = known.get(word)
+        if path is not None and _spells(tiles, rows, cols, word, path):
+            traced[word] = path
+            continue
+        found = paths(grid, word, limit=1)
+        if found:
+            traced[word] = found[0]
+    return traced
+
+
+_pool = None
+_pool_pid = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_solver_pool(workers: int, language: str) -> Optional[ProcessPoolExecutor]:
+    """
+    Lazily fork a per-process pool of `workers` solver processes, replacing one of
+    another size. The DAWG for `language` is loaded first so children inherit it (and
+    the mmapped artifact) instead of re-parsing anything. Returns None where fork is
+    unavailable. Meant for batch jobs (refill_board_pool), not the request path.
+    """
+    global _pool, _pool_pid, _pool_workers
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid() and _pool_workers != workers:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+        if _pool is None or _pool_pid != os.getpid():
+            _get_dawg(language)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+            _pool_pid = os.getpid()
+            _pool_workers = workers
+        return _pool
+
+
+def _reset_solver_pool():
+    global _pool, _pool_pid, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_pid = None
+        _pool_workers = 0
+
+
+atexit.register(_reset_solver_pool)
+
+
+def solve_many(grids: Iterable[Sequence[Sequence[str]]], language: str = 'en', min_length: int = 3,
+               workers: int = 1) -> List[List[str]]:
+    """
+    solve() each board, in order. With workers > 1 the boards are spread across the
+    forked solver pool; otherwise they are solved here against one shared DAWG.
+    """
+    grids = list(grids)
+    if workers > 1 and len(grids) > 1:
+        pool = _get_solver_pool(workers, language)
+        if pool is not None:
+            try:
+                return list(pool.map(solve, grids, repeat(language), repeat(min_length)))
+            except BrokenProcessPool:
+                logger.warning("Solver pool broke; solving serially.")
+                _reset_solver_pool()
+
+    dawg = _get_dawg(language)
+    return [solve(grid, min_length=min_length, dawg=dawg) for grid in grids]
@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from game.benchmarks import bench_is_on_board, bench_solve, find_regressions, seeded_boards, summarize
+
+BASELINE = {
+    "solve": {"4": {"p95_ms": 1.0, "mean_ms": 0.5}},
+    "is_on_board": {"checks": 100, "checks_per_sec": 1000.0},
+    "dawg_build": {"nodes": 10},
+}
+
+
+class BenchmarkSuiteTests(SimpleTestCase):
+    def test_seeded_boards_are_reproducible(self):
+        self.assertEqual(seeded_boards(4, 3, seed=1), seeded_boards(4, 3, seed=1))
+        self.assertNotEqual(seeded_boards(4, 3, seed=1), seeded_boards(4, 3, seed=2))
+
+    def test_summarize_percentiles(self):
+        stats = summarize([float(i) for i in range(1, 101)])
+        self.assertEqual(stats["p50_ms"], 51.0)
+        self.assertEqual(stats["p95_ms"], 96.0)
+        self.assertEqual(stats["p99_ms"], 100.0)
+
+    def test_small_runs_report_every_size(self):
+        solve = bench_solve(boards_per_size=2, repeat=1)
+        self.assertEqual(sorted(solve), ["4", "5", "6"])
+        self.assertGreater(bench_is_on_board(boards=1)["checks"], 0)
+
+    def test_regressions_respect_direction_and_tolerance(self):
+        results = {
+            "solve": {"4": {"p95_ms": 1.2, "mean_ms": 0.9}},
+            "is_on_board": {"checks": 5, "checks_per_sec": 400.0},
+            "dawg_build": {"nodes": 50},
+        }
+        flagged = {r["metric"] for r in find_regressions(results, BASELINE, tolerance=0.25)}
+        # Counts such as checks/nodes are informational only.
+        self.assertEqual(flagged, {"solve.4.mean_ms", "is_on_board.checks_per_sec"})
+        self.assertEqual(find_regressions(BASELINE, BASELINE), [])
+
+
+class BenchSolverCommandTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.baseline = os.path.join(self.tmp.name, "baseline.json")
+        with open(self.baseline, "w") as fh:
+            json.dump(BASELINE, fh)
+
+    @mock.patch("game.management.commands.bench_solver.run_suite", return_value=BASELINE)
+    def test_emits_json_and_passes_against_baseline(self, _suite):
+        out = StringIO()
+        output = os.path.join(self.tmp.name, "run.json")
+        call_command("bench_solver", "--baseline", self.baseline, "--output", output, stdout=out, stderr=StringIO())
+        self.assertEqual(json.loads(out.getvalue()), BASELINE)
+        with open(output) as fh:
+            self.assertEqual(json.load(fh), BASELINE)
+
+    def test_fails_on_regression(self):
+        slower = {"solve": {"4": {"p95_ms": 3.0, "mean_ms": 0.5}}}
+        with mock.patch("game.management.commands.bench_solver.run_suite", return_value=slower):
+            with self.assertRaisesMessage(CommandError, "solve.4.p95_ms"):
+                call_command("bench_solver", "--baseline", self.baseline, stdout=StringIO(), stderr=StringIO())
+
+    def test_compares_against_the_default_baseline_unless_opted_out(self):
+        slower = {"solve": {"4": {"p95_ms": 3.0, "mean_ms": 0.5}}}
+        with mock.patch("game.management.commands.bench_solver.DEFAULT_BASELINE", self.baseline), \
+                mock.patch("game.management.commands.bench_solver.run_suite", return_value=slower):
+            with self.assertRaisesMessage(CommandError, "solve.4.p95_ms"):
+                call_command("bench_solver", stdout=StringIO(), stderr=StringIO())
+            call_command("bench_solver", "--no-baseline", stdout=StringIO(), stderr=StringIO())
+
+    def test_missing_default_baseline_skips_the_comparison(self):
+        missing = os.path.join(self.tmp.name, "missing.json")
+        err = StringIO()
+        with mock.patch("game.management.commands.bench_solver.DEFAULT_BASELINE", missing), \
+                mock.patch("game.management.commands.bench_solver.run_suite", return_value=BASELINE):
+            call_command("bench_solver", stdout=StringIO(), stderr=err)
+        self.assertIn("No baseline", err.getvalue())
@@ -0,0 +1,96 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from game.board_pool import refill_bucket, take_board, take_or_generate_board
+from game.models import BoardPoolEntry
+from game.practice import create_practice_challenge
+
+GRID = [["C", "A", "T", "S"], ["D", "O", "G", "E"], ["R", "A", "T", "E"], ["B", "I", "R", "D"]]
+WORDS = ["CAT", "CATS", "DOG", "RAT", "RATE"]
+# Enough words for every difficulty's GENERATOR_MIN_WORDS.
+MANY = [f"W{i:02d}" for i in range(15)]
+
+
+def _pool(size=4, difficulty="medium", language="en", words=WORDS, grid=GRID):
+    return BoardPoolEntry.objects.create(
+        size=size, difficulty=difficulty, language=language,
+        grid=grid, valid_words=words, word_count=len(words),
+    )
+
+
+class BoardPoolTests(TestCase):
+    def test_take_board_pops_oldest_in_bucket(self):
+        first = _pool()
+        _pool(words=WORDS[:3])
+        _pool(size=5)
+
+        grid, words = take_board(4, "medium", "en")
+        self.assertEqual((grid, words), (GRID, WORDS))
+        self.assertFalse(BoardPoolEntry.objects.filter(pk=first.pk).exists())
+        self.assertEqual(BoardPoolEntry.objects.filter(size=4).count(), 1)
+
+    def test_take_board_respects_min_words_and_empty_bucket(self):
+        _pool(words=WORDS[:3])
+        self.assertIsNone(take_board(4, "medium", "en", min_words=4))
+        self.assertIsNone(take_board(4, "hard", "en"))
+        self.assertIsNotNone(take_board(4, "medium", "en", min_words=3))
+
+    @mock.patch("game.board_pool.generate_solvable_grid", return_value=(GRID, WORDS))
+    def test_falls_back_to_live_generation_when_empty(self, mock_generate):
+        self.assertEqual(take_or_generate_board(4, "easy", "en"), (GRID, WORDS))
+        mock_generate.assert_called_once_with(size=4, difficulty="easy", language="en", min_words=15)
+
+    @mock.patch("game.board_pool.generate_solvable_grid", return_value=(GRID, MANY))
+    def test_refill_tops_bucket_up_to_depth(self, mock_generate):
+        _pool(difficulty="hard", words=MANY)
+        self.assertEqual(refill_bucket(4, "hard", "en", depth=3), 2)
+        self.assertEqual(refill_bucket(4, "hard", "en", depth=3), 0)
+        self.assertEqual(mock_generate.call_count, 2)
+        entry = BoardPoolEntry.objects.filter(difficulty="hard").last()
+        self.assertEqual(entry.word_count, len(MANY))
+
+    @mock.patch("game.board_pool.generate_solvable_grid", return_value=(GRID, MANY))
+    def test_refill_command(self, _generate):
+        out = StringIO()
+        call_command("refill_board_pool", "--depth", "1", stdout=out)
+        self.assertEqual(BoardPoolEntry.objects.count(), 9)
+        self.assertIn("9 boards added", out.getvalue())
+
+    @mock.patch("game.board_pool.generate_solvable_grid", return_value=(GRID, MANY))
+    def test_refill_command_workers(self, mock_generate):
+        with override_settings(GRID_GENERATOR_WORKERS=3):
+            call_command("refill_board_pool", "--depth", "1", stdout=StringIO())
+        self.assertEqual(mock_generate.call_args.kwargs["workers"], 3)
+        BoardPoolEntry.objects.all().delete()
+        call_command("refill_board_pool", "--depth", "1", "--workers", "2", stdout=StringIO())
+        self.assertEqual(mock_generate.call_args.kwargs["workers"], 2)
+
+    def test_refill_skips_boards_below_min_words(self):
+        # Boards the takers' min_words filter would never serve don't count toward depth.
+        _pool(difficulty="hard", words=WORDS[:2])
+        short = (GRID, WORDS[:2])
+        with mock.patch("game.board_pool.generate_solvable_grid", return_value=short):
+            self.assertEqual(refill_bucket(4, "hard", "en", depth=2), 0)
+        with mock.patch("game.board_pool.generate_solvable_grid", return_value=(GRID, MANY)) as mock_generate:
+            self.assertEqual(refill_bucket(4, "hard", "en", depth=2), 2)
+        self.assertEqual(mock_generate.call_count, 2)
+
+    @mock.patch("game.board_pool.generate_solvable_grid")
+    def test_take_does_not_refill(self, mock_generate):
+        _pool()
+        with self.captureOnCommitCallbacks() as callbacks:
+            take_board(4, "medium", "en")
+        self.assertEqual(callbacks, [])
+        mock_generate.assert_not_called()
+
+    @mock.patch("game.practice.solve_paths")
+    def test_practice_challenge_uses_pool(self, mock_solve):
+        _pool(size=4, difficulty="easy")
+        challenge = create_practice_challenge("easy", "user-1")
+        self.assertEqual(challenge.grid, GRID)
+        self.assertEqual(challenge.valid_words, WORDS)
+        mock_solve.assert_not_called()
+        self.assertFalse(BoardPoolEntry.objects.exists())
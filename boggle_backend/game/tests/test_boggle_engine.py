@@ -1,6 +1,21 @@
-from django.test import SimpleTestCase
+import importlib
+from unittest import mock
 
-from game.boggle_engine import is_word_on_board, score_word
+from django.apps import apps
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from game.boggle_engine import (
+    ValidWordCache,
+    VersionedLRU,
+    get_valid_word_cache,
+    get_valid_words,
+    get_word_path,
+    is_word_on_board,
+    lazy_lru,
+    score_word,
+)
+from game.models import Challenge
+from game.solver import trace_paths
 
 
 class BoggleEngineTests(SimpleTestCase):
@@ -23,3 +38,106 @@ class BoggleEngineTests(SimpleTestCase):
         self.assertEqual(score_word("at"), 0)
         self.assertEqual(score_word("cat"), 3)
         self.assertEqual(score_word("CATER"), 5)
+
+
+class WordPathTests(TestCase):
+    def test_paths_are_stored_on_save_and_looked_up(self):
+        challenge = Challenge.objects.create(
+            creator_user_id="1", title="C", description="", difficulty="easy",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], valid_words=["CAT", "DOG", "FISH"],
+        )
+        challenge.refresh_from_db()
+        self.assertEqual(challenge.word_paths, {"CAT": [[0, 0], [0, 1], [0, 2]], "DOG": [[1, 0], [1, 1], [1, 2]]})
+        self.assertEqual(get_word_path(challenge, "cat"), [[0, 0], [0, 1], [0, 2]])
+        self.assertIsNone(get_word_path(challenge, "FISH"))
+
+    def test_editing_words_or_grid_retraces(self):
+        challenge = Challenge.objects.create(
+            creator_user_id="1", title="C", description="", difficulty="easy",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], valid_words=["CAT"],
+        )
+        challenge.valid_words = ["CAT", "DOG"]
+        challenge.save()
+        challenge.refresh_from_db()
+        self.assertEqual(get_word_path(challenge, "DOG"), [[1, 0], [1, 1], [1, 2]])
+
+        challenge.grid = [["D", "O", "G"], ["C", "A", "T"], ["X", "Y", "Z"]]
+        challenge.valid_words = ["DOG"]
+        challenge.save()
+        challenge.refresh_from_db()
+        self.assertEqual(challenge.word_paths, {"DOG": [[0, 0], [0, 1], [0, 2]]})
+
+    def test_partial_save_does_not_trace(self):
+        challenge = Challenge.objects.create(
+            creator_user_id="1", title="C", description="", difficulty="easy",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], valid_words=["CAT"], word_paths={"X": []},
+        )
+        challenge.word_paths = {}
+        challenge.status = "archived"
+        with mock.patch("game.models.trace_paths") as mock_trace:
+            challenge.save(update_fields=["status", "updated_at"])
+        mock_trace.assert_not_called()
+
+    def test_migration_traces_like_the_solver(self):
+        grid = [["C", "A", "T"], ["QU", "O", "G"], ["I", "T", "S"]]
+        words = ["CAT", "cats", "QUIT", "QUOTA", "DOG", "", "TOGS"]
+        migration = importlib.import_module("game.migrations.0013_challenge_word_paths")
+        expected = {word: [list(cell) for cell in path] for word, path in trace_paths(grid, words).items()}
+        traced = {word: [list(cell) for cell in path] for word, path in migration.trace_paths(grid, words).items()}
+        self.assertEqual(traced, expected)
+        self.assertIn("QUIT", traced)
+
+        challenge = Challenge.objects.create(
+            creator_user_id="1", title="C", description="", difficulty="easy", grid=grid, valid_words=["QUIT"],
+        )
+        Challenge.objects.filter(pk=challenge.pk).update(word_paths={})
+        migration.trace_existing_paths(apps, None)
+        challenge.refresh_from_db()
+        self.assertEqual(challenge.word_paths, {"QUIT": expected["QUIT"]})
+
+    def test_falls_back_to_tracing_without_stored_paths(self):
+        challenge = Challenge(grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], valid_words=["CAT"])
+        self.assertEqual(get_word_path(challenge, "CAT"), [[0, 0], [0, 1], [0, 2]])
+        self.assertIsNone(get_word_path(challenge, "CATS"))
+
+
+class ValidWordCacheTests(TestCase):
+    def setUp(self):
+        get_valid_word_cache().clear()
+        self.challenge = Challenge.objects.create(
+            creator_user_id="1", title="C", description="", difficulty="easy",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], valid_words=["cat", "DOG"],
+        )
+
+    def test_hits_for_the_same_version(self):
+        cache = get_valid_word_cache()
+        self.assertEqual(get_valid_words(self.challenge), frozenset({"CAT", "DOG"}))
+        self.assertEqual(get_valid_words(Challenge.objects.get(pk=self.challenge.pk)), frozenset({"CAT", "DOG"}))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_save_and_delete_invalidate(self):
+        get_valid_words(self.challenge)
+        self.challenge.valid_words = ["COD"]
+        self.challenge.save()
+        self.assertEqual(len(get_valid_word_cache()), 0)
+        self.assertEqual(get_valid_words(self.challenge), frozenset({"COD"}))
+        self.challenge.delete()
+        self.assertEqual(len(get_valid_word_cache()), 0)
+
+    def test_bounded_with_eviction_count(self):
+        cache = ValidWordCache(maxsize=2)
+        for challenge_id in (1, 2, 3):
+            cache.put(challenge_id, "v1", frozenset())
+        self.assertIsNone(cache.get(1, "v1"))
+        self.assertIsNotNone(cache.get(3, "v1"))
+        self.assertIsNone(cache.get(3, "v2"))
+        self.assertEqual(cache.stats(), {"size": 2, "maxsize": 2, "hits": 1, "misses": 2, "evictions": 1})
+
+    @override_settings(TEST_LRU_SIZE=3)
+    def test_lazy_lru_builds_one_instance_from_its_setting(self):
+        get_cache = lazy_lru("TEST_LRU_SIZE")
+        cache = get_cache()
+        self.assertIsInstance(cache, VersionedLRU)
+        self.assertIs(get_cache(), cache)
+        self.assertEqual(cache.maxsize, 3)
+        self.assertIsInstance(get_valid_word_cache(), ValidWordCache)
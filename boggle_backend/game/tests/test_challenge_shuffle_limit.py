@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
@@ -39,3 +41,11 @@ class ChallengeShuffleLimitTests(APITestCase):
         resp3 = self.client.post(self.url, payload, format='json')
         self.assertEqual(resp3.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
         self.assertEqual(resp3.data.get("error_code"), "SHUFFLE_LIMIT_REACHED")
+
+    def test_shuffle_returns_grid_without_solving(self):
+        self.client.force_authenticate(user=self.user)
+        with mock.patch("game.solver.solve") as solve:
+            resp = self.client.post(self.url, {"session_id": self.session.id}, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(resp.data), {"grid"})
+        solve.assert_not_called()
@@ -1,8 +1,12 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from game.models import Challenge
+
 # Dev A tests for FR-02 (Create Challenges): ensure grid validation and server-bound creator_user_id.
 
 
@@ -38,6 +42,20 @@ class ChallengeCreateTests(APITestCase):
         self.assertEqual(response.data["status"], "active")
         self.assertIn("created_at", response.data)
 
+    def test_words_and_paths_come_from_one_search(self):
+        payload = {
+            "title": "Paths", "difficulty": "easy",
+            "grid": [["t", "e", "s", "t"], ["w", "o", "r", "d"], ["p", "l", "a", "y"], ["g", "a", "m", "e"]],
+        }
+        self.client.force_authenticate(user=self.user)
+        with mock.patch("game.solver.paths") as retrace:
+            response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        retrace.assert_not_called()
+        challenge = Challenge.objects.get(pk=response.data["id"])
+        self.assertTrue(challenge.valid_words)
+        self.assertEqual(sorted(challenge.word_paths), sorted(challenge.valid_words))
+
     def test_reject_non_square_grid(self):
         payload = {
             "title": "Bad Grid",
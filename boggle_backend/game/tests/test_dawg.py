@@ -0,0 +1,56 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from game.dawg import Dawg, DawgFormatError, NO_NODE
+from game.solver import _get_dawg
+from game.word_solver import solve_boggle
+
+
+class DawgTests(SimpleTestCase):
+    words = ["CAT", "CATS", "BAT", "BATS", "QUART", "QUARTZ", "TEST"]
+
+    def test_search_and_prefix(self):
+        dawg = Dawg.from_words(self.words)
+        self.assertTrue(dawg.search("cat"))
+        self.assertTrue(dawg.search("QUARTZ"))
+        self.assertFalse(dawg.search("CA"))
+        self.assertTrue(dawg.starts_with("QUA"))
+        self.assertFalse(dawg.starts_with("DOG"))
+        self.assertEqual(dawg.walk(Dawg.ROOT, "XYZ"), NO_NODE)
+
+    def test_iterates_words_in_sorted_order(self):
+        dawg = Dawg.from_words(self.words + ["CAT"])
+        self.assertEqual(list(dawg), sorted(set(self.words)))
+
+    def test_shared_suffixes_are_merged(self):
+        # CAT/BAT share the "AT(S)" suffix subtree: root + C + B + A + T + S.
+        dawg = Dawg.from_words(["CAT", "CATS", "BAT", "BATS"])
+        self.assertEqual(dawg.node_count, 5)
+
+    def test_round_trip_bytes(self):
+        dawg = Dawg.from_words(self.words)
+        loaded = Dawg.from_buffer(dawg.to_bytes())
+        self.assertEqual(list(loaded), list(dawg))
+        self.assertEqual(Dawg.serialized_size(dawg.to_bytes()), len(dawg.to_bytes()))
+
+    def test_rejects_foreign_data(self):
+        with self.assertRaises(DawgFormatError):
+            Dawg.from_buffer(b"not a dawg at all")
+
+
+class SolveBoggleDawgTests(SimpleTestCase):
+    def tearDown(self):
+        _get_dawg.cache_clear()
+
+    @mock.patch("game.solver._load_dictionary")
+    def test_solve_with_multi_letter_tiles(self, mock_dict):
+        mock_dict.return_value = ["ART", "QUART", "QUARTZ", "QUA", "TAR", "RAT", "ZZZ"]
+        _get_dawg.cache_clear()
+        grid = [
+            ["QU", "A", "Z"],
+            ["T", "R", "T"],
+            ["X", "X", "X"],
+        ]
+        self.assertEqual(solve_boggle(grid), ["ART", "QUA", "QUART", "QUARTZ", "RAT", "TAR"])
+        self.assertEqual(solve_boggle(grid, min_length=5), ["QUART", "QUARTZ"])
@@ -0,0 +1,65 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from game.dictionaries import (
+    ArtifactError,
+    DictionaryArtifact,
+    compile_artifact,
+    load_dictionary_artifact,
+    _load_dictionary_artifact,
+)
+
+
+class DictionaryArtifactTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        _load_dictionary_artifact.cache_clear()
+        self.addCleanup(_load_dictionary_artifact.cache_clear)
+
+    def test_round_trip(self):
+        data = compile_artifact(["TEST", "CAT", "QUART", "CAT"], "en", b"\x01" * 16)
+        artifact = DictionaryArtifact.from_buffer(data)
+        self.assertEqual(artifact.language, "en")
+        self.assertEqual(artifact.version, "01" * 16)
+        self.assertEqual(list(artifact.words), ["CAT", "QUART", "TEST"])
+        self.assertEqual(artifact.words.index("QUART"), 1)
+        self.assertNotIn("DOG", artifact.words)
+        self.assertTrue(artifact.dawg.search("quart"))
+        self.assertFalse(artifact.dawg.search("qua"))
+
+    def test_non_ascii_words(self):
+        data = compile_artifact(["ÁRBOL", "NIÑO"], "es", b"\0" * 16)
+        artifact = DictionaryArtifact.from_buffer(data)
+        self.assertEqual(list(artifact.words), ["NIÑO", "ÁRBOL"])
+        self.assertTrue(artifact.dawg.search("niño"))
+
+    def test_rejects_foreign_data(self):
+        with self.assertRaises(ArtifactError):
+            DictionaryArtifact.from_buffer(b"definitely not an artifact, nope")
+
+    @mock.patch("game.dictionaries.load_wordlist_json", return_value=["CAT", "TEST"])
+    @mock.patch("game.dictionaries.source_digest", return_value=b"\x02" * 16)
+    def test_command_writes_mappable_artifact(self, _digest, _words):
+        with override_settings(DICTIONARY_ARTIFACT_DIR=self.tmp.name):
+            out = StringIO()
+            call_command("compile_dictionaries", "--language", "en", stdout=out)
+            self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "en.dict")))
+            self.assertIn("en: 2 words", out.getvalue())
+
+            artifact = load_dictionary_artifact("en")
+            self.assertIsNotNone(artifact)
+            self.assertEqual(list(artifact.words), ["CAT", "TEST"])
+
+    @mock.patch("game.dictionaries.load_wordlist_json", return_value=["CAT"])
+    def test_stale_artifact_is_ignored(self, _words):
+        with override_settings(DICTIONARY_ARTIFACT_DIR=self.tmp.name):
+            with mock.patch("game.dictionaries.source_digest", return_value=b"\x03" * 16):
+                call_command("compile_dictionaries", "--language", "en", stdout=StringIO())
+            with mock.patch("game.dictionaries.source_digest", return_value=b"\x04" * 16):
+                self.assertIsNone(load_dictionary_artifact("en"))
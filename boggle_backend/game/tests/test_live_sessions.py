@@ -0,0 +1,182 @@
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from game.live_sessions import (
+    CacheSessionStore,
+    DatabaseSessionStore,
+    InProcessSessionStore,
+    LiveSessionStore,
+    get_live_session_store,
+)
+from game.models import Challenge, GameSession, SessionSubmission
+
+GRID = [["T", "E", "S", "T"], ["A", "B", "C", "D"], ["E", "F", "G", "H"], ["I", "J", "K", "L"]]
+
+
+def _writes(queries):
+    return [q["sql"] for q in queries if q["sql"].split()[0] in ("INSERT", "UPDATE", "DELETE")]
+
+
+class WriteBehindMixin:
+    backend = None
+
+    def setUp(self):
+        self.settings_override = override_settings(LIVE_SESSION_STORE=self.backend, LIVE_SESSION_CHECKPOINT_SECONDS=3600)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        self.store = get_live_session_store()
+        self.store.clear()
+
+        self.user = get_user_model().objects.create_user(username=f"live-{self.backend}", password="pw123456")
+        self.challenge = Challenge.objects.create(
+            creator_user_id=str(self.user.id), title="C", description="", grid=GRID,
+            difficulty="easy", valid_words=["TEST", "SET", "BET"],
+        )
+        self.session = GameSession.objects.create(
+            challenge=self.challenge, player_user_id=str(self.user.id), duration_seconds=300,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _submit(self, word):
+        return self.client.post(reverse("game_sessions_submit_word", args=[self.session.id]), {"word": word}, format="json")
+
+    def test_gameplay_does_no_db_writes_until_end(self):
+        self._submit("test")
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self._submit("set").data["score"], 7)
+            self.assertTrue(self._submit("TEST").data["already_found"])
+            self._submit("zzz")
+            self.client.get(reverse("game_sessions_hint", args=[self.session.id]))
+            self.client.post(reverse("game_challenges_shuffle", args=[self.challenge.id]),
+                             {"session_id": self.session.id}, format="json")
+        self.assertEqual(_writes(ctx.captured_queries), [])
+        self.assertFalse(SessionSubmission.objects.filter(session=self.session).exists())
+
+        resp = self.client.post(reverse("game_sessions_end", args=[self.session.id]))
+        self.assertEqual(resp.data["results"]["score"], 7)
+        self.assertEqual(resp.data["results"]["found_words"], ["SET", "TEST"])
+
+        self.session.refresh_from_db()
+        self.assertEqual((self.session.score, self.session.hint_uses, self.session.shuffle_uses), (7, 1, 1))
+        self.assertEqual(
+            list(SessionSubmission.objects.filter(session=self.session).values_list("word", "is_valid")),
+            [("TEST", True), ("SET", True), ("ZZZ", False)],
+        )
+
+    def test_limits_are_enforced_in_the_store(self):
+        url = reverse("game_sessions_hint", args=[self.session.id])
+        self.assertEqual([self.client.get(url).status_code for _ in range(4)], [200, 200, 200, 429])
+        self.assertEqual(GameSession.objects.get(pk=self.session.pk).hint_uses, 0)
+
+    def test_checkpoint_flushes_buffered_state(self):
+        with self.settings(LIVE_SESSION_CHECKPOINT_SECONDS=0):
+            self._submit("bet")
+            self.session.refresh_from_db()
+            self.assertEqual(self.session.score, 3)
+            self.assertTrue(SessionSubmission.objects.filter(session=self.session, word="BET").exists())
+            self._submit("bet")
+        self.assertEqual(SessionSubmission.objects.filter(session=self.session).count(), 1)
+
+    def test_batch_submit_goes_through_store(self):
+        resp = self.client.post(reverse("game_sessions_submit_words", args=[self.session.id]),
+                                {"words": [{"word": "set"}, {"word": "SET"}, {"word": "bet"}]}, format="json")
+        self.assertEqual([r["already_found"] for r in resp.data["results"]], [False, True, False])
+        self.assertEqual(resp.data["score"], 6)
+        self.assertEqual(self.store.found_words(self.session), {"SET", "BET"})
+        self.assertFalse(SessionSubmission.objects.exists())
+
+
+class InProcessStoreTests(WriteBehindMixin, APITestCase):
+    backend = "memory"
+
+    def test_store_type(self):
+        self.assertIsInstance(self.store, InProcessSessionStore)
+        self._submit("test")
+        self.assertEqual(len(self.store), 1)
+        self.store.close(self.session)
+        self.assertEqual(len(self.store), 0)
+
+    def test_sweep_persists_and_evicts_expired_sessions(self):
+        self._submit("test")
+        state = self.store._get(self.session.id)
+        state["expires_at"] = time.time() - 1
+        self.store._swept_at = 0
+        self.store._sweep()
+        self.assertEqual(len(self.store), 0)
+        self.assertNotIn(self.session.id, self.store._locks)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.score, 4)
+        self.assertEqual(self.session.found_words(), {"TEST"})
+
+    def test_close_keeps_the_lock_while_another_thread_waits(self):
+        self._submit("test")
+        session_id = self.session.id
+        entered, release = threading.Event(), threading.Event()
+
+        def waiter():
+            with self.store._lock(session_id):
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=waiter)
+        with self.store._lock(session_id):
+            thread.start()
+            while self.store._locks[session_id][1] < 2:
+                time.sleep(0.001)
+            self.store._delete(session_id)
+        self.assertTrue(entered.wait(5))
+        # A later caller must queue behind the waiter rather than get a fresh lock.
+        self.assertFalse(self.store._acquire(session_id, blocking=False))
+        release.set()
+        thread.join()
+        self.assertNotIn(session_id, self.store._locks)
+
+    def test_store_base_class_is_abstract(self):
+        with self.assertRaises(TypeError):
+            LiveSessionStore()
+
+
+class CacheStoreTests(WriteBehindMixin, APITestCase):
+    backend = "cache"
+
+    def setUp(self):
+        caches["default"].clear()
+        super().setUp()
+
+    def test_clear_leaves_the_rest_of_the_cache(self):
+        caches["default"].set("unrelated", 1)
+        self.store.clear()
+        self.assertEqual(caches["default"].get("unrelated"), 1)
+
+    def test_store_type(self):
+        self.assertIsInstance(self.store, CacheSessionStore)
+        self._submit("test")
+        self.assertEqual(self.store._get(self.session.id)["found"], ["TEST"])
+
+    def test_lock_times_out_when_held(self):
+        self.addCleanup(setattr, self.store, "lock_wait", self.store.lock_wait)
+        self.store.lock_wait = 0.05
+        with self.store._lock(self.session.id):
+            with self.assertRaises(TimeoutError):
+                with self.store._lock(self.session.id):
+                    pass
+        with self.store._lock(self.session.id):
+            pass
+
+
+class StoreSelectionTests(APITestCase):
+    def test_defaults_to_write_through(self):
+        self.assertIsInstance(get_live_session_store(), DatabaseSessionStore)
+
+    @override_settings(LIVE_SESSION_STORE="nope")
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_live_session_store()
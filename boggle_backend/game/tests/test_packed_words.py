@@ -0,0 +1,95 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from game.boggle_engine import get_valid_words, get_word_path
+from game.dictionaries import DictionaryArtifact, compile_artifact
+from game.models import Challenge
+from game.packed_words import _unpack_cached, pack_words, unpack_words
+from game.serializers import ChallengeSerializer
+
+GRID = [["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]]
+WORDS = ["CAT", "COD", "DOG", "GOD", "TOAD"]
+ARTIFACT = DictionaryArtifact.from_buffer(compile_artifact(WORDS + ["ZEBRA", "ZOO"], "en", b"\x07" * 16))
+
+
+class PackWordsTests(SimpleTestCase):
+    def test_round_trip_with_paths(self):
+        paths = {"CAT": [[0, 0], [0, 1], [0, 2]], "DOG": [[1, 0], [1, 1], [1, 2]]}
+        data = pack_words(["dog", "CAT", "CAT"], paths, ARTIFACT, cols=3)
+        unpacked = unpack_words(data, ARTIFACT, cols=3)
+        self.assertEqual(unpacked.words, ("CAT", "DOG"))
+        self.assertEqual(unpacked.word_set, frozenset({"CAT", "DOG"}))
+        self.assertEqual(unpacked.paths, paths)
+
+    def test_ids_are_delta_encoded(self):
+        data = pack_words(WORDS, {}, ARTIFACT, cols=3)
+        # count + five one-byte deltas + an empty path per word
+        self.assertEqual(len(data), 1 + 5 + 5)
+
+    def test_words_outside_the_dictionary_are_not_packed(self):
+        self.assertIsNone(pack_words(["CAT", "MOUSE"], {}, ARTIFACT, cols=3))
+
+
+@override_settings(COMPACT_VALID_WORDS=True)
+@mock.patch("game.packed_words.load_dictionary_artifact", return_value=ARTIFACT)
+class PackedChallengeTests(TestCase):
+    def setUp(self):
+        _unpack_cached.cache_clear()
+        self.addCleanup(_unpack_cached.cache_clear)
+
+    def _challenge(self, words=WORDS):
+        return Challenge.objects.create(
+            creator_user_id="1", title="C", description="", grid=GRID, difficulty="easy", valid_words=words,
+        )
+
+    def test_saved_packed_and_read_back(self, _artifact):
+        challenge = Challenge.objects.get(pk=self._challenge().pk)
+        self.assertTrue(challenge.is_packed)
+        self.assertEqual((challenge.valid_words, challenge.word_paths), ([], {}))
+        self.assertEqual(challenge.dictionary_version, "07" * 16)
+
+        self.assertEqual(challenge.word_list(), ["CAT", "COD", "DOG", "GOD", "TOAD"])
+        self.assertEqual(get_valid_words(challenge), frozenset(WORDS))
+        self.assertEqual(get_word_path(challenge, "cat"), [[0, 0], [0, 1], [0, 2]])
+        self.assertEqual(ChallengeSerializer(challenge).data["valid_words"], challenge.word_list())
+
+    def test_unknown_words_stay_json(self, _artifact):
+        challenge = self._challenge(["CAT", "MOUSE"])
+        self.assertFalse(challenge.is_packed)
+        self.assertEqual(challenge.word_list(), ["CAT", "MOUSE"])
+
+    def test_partial_save_does_not_pack(self, _artifact):
+        with override_settings(COMPACT_VALID_WORDS=False):
+            challenge = self._challenge()
+        challenge.status = "archived"
+        challenge.save(update_fields=["status", "updated_at"])
+        self.assertFalse(challenge.is_packed)
+        self.assertEqual(challenge.valid_words, WORDS)
+        challenge.refresh_from_db()
+        self.assertEqual(challenge.word_list(), WORDS)
+
+    @mock.patch("game.solve_cache.cached_solve", return_value=["CAT", "DOG"])
+    def test_dictionary_change_re_solves(self, _solve, _artifact):
+        challenge = self._challenge()
+        Challenge.objects.filter(pk=challenge.pk).update(dictionary_version="ff" * 16)
+        challenge.refresh_from_db()
+        self.assertEqual(get_valid_words(challenge), frozenset({"CAT", "DOG"}))
+        self.assertEqual(get_word_path(challenge, "DOG"), [[1, 0], [1, 1], [1, 2]])
+
+    def test_command_packs_and_unpacks(self, _artifact):
+        with self.settings(COMPACT_VALID_WORDS=False):
+            challenge = self._challenge()
+        out = StringIO()
+        call_command("pack_valid_words", stdout=out)
+        self.assertIn("1 challenges packed", out.getvalue())
+        challenge.refresh_from_db()
+        self.assertTrue(challenge.is_packed)
+
+        call_command("pack_valid_words", "--unpack", stdout=out)
+        challenge.refresh_from_db()
+        self.assertFalse(challenge.is_packed)
+        self.assertEqual(challenge.valid_words, WORDS)
+        self.assertEqual(challenge.word_paths["TOAD"], [[0, 2], [1, 1], [0, 1], [1, 0]])
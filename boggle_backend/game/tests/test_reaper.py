@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import DailyChallenge, DailyChallengeResult
+from game.models import Challenge, GameSession, SessionSubmission
+from game.reaper import collect_guest_practice, finalize_expired_sessions
+
+GRID = [["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]]
+
+
+def _challenge(creator="1", **kwargs):
+    return Challenge.objects.create(
+        creator_user_id=creator, title="C", description="", grid=GRID, difficulty="easy",
+        valid_words=["CAT", "DOG"], **kwargs,
+    )
+
+
+class ReaperTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="reaped", password="pw123456")
+        self.challenge = _challenge()
+        self.now = timezone.now()
+
+    def _session(self, started_ago, duration=60, **kwargs):
+        return GameSession.objects.create(
+            challenge=kwargs.pop("challenge", self.challenge), start_time=self.now - timedelta(seconds=started_ago),
+            duration_seconds=duration, **kwargs,
+        )
+
+    def test_finalizes_only_expired_sessions(self):
+        expired = self._session(120, player_user_id=str(self.user.id), score=5)
+        expired_long = self._session(400, duration=300)
+        running = self._session(30)
+        untimed = self._session(9999, duration=None)
+
+        metrics = finalize_expired_sessions(self.now)
+        self.assertEqual(metrics["finalized"], 2)
+        for session in (expired, expired_long, running, untimed):
+            session.refresh_from_db()
+        self.assertEqual(expired.end_time, expired.start_time + timedelta(seconds=60))
+        self.assertEqual(expired_long.end_time, expired_long.start_time + timedelta(seconds=300))
+        self.assertIsNone(running.end_time)
+        self.assertIsNone(untimed.end_time)
+        self.assertEqual(finalize_expired_sessions(self.now)["finalized"], 0)
+
+    def test_skips_finalizing_with_a_process_local_store(self):
+        expired = self._session(120)
+        for backend in ("memory", "cache"):  # the test cache is LocMem
+            with override_settings(LIVE_SESSION_STORE=backend), self.assertLogs("game.reaper", "WARNING"):
+                self.assertEqual(finalize_expired_sessions(self.now)["finalized"], 0)
+        expired.refresh_from_db()
+        self.assertIsNone(expired.end_time)
+
+    def test_records_daily_results(self):
+        DailyChallenge.objects.create(date=date.today(), challenge=self.challenge)
+        self._session(120, player_user_id=str(self.user.id), score=7)
+        self._session(120, score=9)  # guest
+
+        self.assertEqual(finalize_expired_sessions(self.now)["daily_results"], 1)
+        self.assertEqual(DailyChallengeResult.objects.get(user=self.user).score, 7)
+
+    def test_daily_result_uses_the_day_the_session_started(self):
+        yesterday = timezone.localdate(self.now) - timedelta(days=1)
+        DailyChallenge.objects.create(date=yesterday, challenge=self.challenge)
+        DailyChallenge.objects.create(date=yesterday + timedelta(days=1), challenge=_challenge())
+        self._session(86400, player_user_id=str(self.user.id), score=4)
+
+        self.assertEqual(finalize_expired_sessions(self.now)["daily_results"], 1)
+        result = DailyChallengeResult.objects.get(user=self.user)
+        self.assertEqual((result.daily_challenge.date, result.score), (yesterday, 4))
+
+    def test_collects_guest_practice_leftovers(self):
+        practice = _challenge(creator="practice")
+        Challenge.objects.filter(pk=practice.pk).update(created_at=self.now - timedelta(hours=2))
+        guest = self._session(600, challenge=practice, mode=GameSession.MODE_PRACTICE,
+                              submissions=[{"word": "CAT", "is_valid": True, "score_delta": 3}])
+        kept = self._session(600, challenge=self.challenge, mode=GameSession.MODE_PRACTICE,
+                             player_user_id=str(self.user.id))
+        fresh = _challenge(creator="practice")
+
+        finalize_expired_sessions(self.now)
+        metrics = collect_guest_practice(self.now)
+        self.assertEqual(metrics, {"guest_sessions_deleted": 1, "practice_challenges_deleted": 1})
+        self.assertFalse(GameSession.objects.filter(pk=guest.pk).exists())
+        self.assertFalse(SessionSubmission.objects.exists())
+        self.assertFalse(Challenge.objects.filter(pk=practice.pk).exists())
+        self.assertTrue(GameSession.objects.filter(pk=kept.pk).exists())
+        self.assertTrue(Challenge.objects.filter(pk=fresh.pk).exists())
+
+    def test_command_reports_metrics(self):
+        self._session(120)
+        out = StringIO()
+        call_command("reap_sessions", "--batch-size", "1", stdout=out)
+        self.assertIn("finalized=1", out.getvalue())
+        self.assertIn("guest_sessions_deleted=0", out.getvalue())
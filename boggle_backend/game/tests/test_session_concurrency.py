@@ -0,0 +1,89 @@
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from game.models import Challenge, GameSession, SessionSubmission
+
+GRID = [["T", "E", "S", "T"], ["A", "B", "C", "D"], ["E", "F", "G", "H"], ["I", "J", "K", "L"]]
+
+
+class ConcurrentSessionUpdateTests(TransactionTestCase):
+    """
+    Fire parallel requests at one session; each thread uses its own DB connection.
+    SQLite's shared-cache test database reports table locks instead of waiting, so a
+    locked request is retried the way a client would.
+    """
+
+    threads = 8
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="racer", password="pw123456")
+        self.challenge = Challenge.objects.create(
+            creator_user_id=str(self.user.id), title="C", description="", grid=GRID,
+            difficulty="easy", valid_words=["TEST", "SET", "BET", "TAB"],
+        )
+        self.session = GameSession.objects.create(
+            challenge=self.challenge, player_user_id=str(self.user.id), duration_seconds=300,
+        )
+
+    def _run_parallel(self, method, url, payloads):
+        barrier = threading.Barrier(len(payloads))
+        responses = [None] * len(payloads)
+
+        def worker(index, payload):
+            client = APIClient()
+            client.force_authenticate(user=self.user)
+            barrier.wait()
+            try:
+                for _ in range(50):
+                    try:
+                        responses[index] = getattr(client, method)(url, payload, format="json")
+                        break
+                    except OperationalError:
+                        time.sleep(0.01)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker, args=(i, p)) for i, p in enumerate(payloads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        return responses
+
+    def test_parallel_submits_score_each_word_once(self):
+        url = reverse("game_sessions_submit_word", args=[self.session.id])
+        words = ["test", "TEST", "set", "bet", "tab", "Test", "set", "nope"]
+        responses = self._run_parallel("post", url, [{"word": w} for w in words])
+
+        self.assertTrue(all(r.status_code == 200 for r in responses), [r.status_code for r in responses])
+        scored = [r.data["word"] for r in responses if r.data["is_valid"]]
+        self.assertEqual(len(scored), len(set(scored)))
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.score, 4 + 3 + 3 + 3)
+        valid_rows = SessionSubmission.objects.filter(session=self.session, is_valid=True)
+        self.assertEqual(valid_rows.count(), 4)
+
+    def test_parallel_hints_respect_limit(self):
+        url = reverse("game_sessions_hint", args=[self.session.id])
+        responses = self._run_parallel("get", url, [None] * self.threads)
+
+        self.assertLessEqual([r.status_code for r in responses].count(200), 3)
+        self.assertTrue(all(r.status_code in (200, 429) for r in responses))
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.hint_uses, 3)
+
+    def test_parallel_shuffles_respect_limit(self):
+        url = reverse("game_challenges_shuffle", args=[self.challenge.id])
+        responses = self._run_parallel("post", url, [{"session_id": self.session.id}] * self.threads)
+
+        self.assertLessEqual([r.status_code for r in responses].count(200), 2)
+        self.assertTrue(all(r.status_code in (200, 429) for r in responses))
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.shuffle_uses, 2)
@@ -0,0 +1,138 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from game.models import Challenge, GameSession, SessionSubmission
+from game.serializers import GameSessionSerializer
+
+
+class SessionSubmissionModelTests(TestCase):
+    def setUp(self):
+        self.challenge = Challenge.objects.create(
+            creator_user_id="1", title="C", description="", grid=[["T", "E"], ["S", "T"]],
+            difficulty="easy", valid_words=["TEST"],
+        )
+
+    def test_valid_word_is_unique_per_session(self):
+        session = GameSession.objects.create(challenge=self.challenge)
+        SessionSubmission.objects.create(session=session, word="TEST", is_valid=True, score_delta=4)
+        SessionSubmission.objects.create(session=session, word="TSET", is_valid=False)
+        SessionSubmission.objects.create(session=session, word="TSET", is_valid=False)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            SessionSubmission.objects.create(session=session, word="TEST", is_valid=True, score_delta=4)
+
+        other = GameSession.objects.create(challenge=self.challenge)
+        SessionSubmission.objects.create(session=other, word="TEST", is_valid=True, score_delta=4)
+
+    def test_submissions_property_round_trip(self):
+        stamp = timezone.now()
+        session = GameSession.objects.create(
+            challenge=self.challenge,
+            submissions=[
+                {"word": "test", "is_valid": True, "score_delta": 4, "timestamp": stamp.isoformat()},
+                {"word": "TEST", "is_valid": True, "score_delta": 4},
+                {"word": "XYZ", "is_valid": False},
+            ],
+        )
+        session = GameSession.objects.get(pk=session.pk)
+        self.assertEqual(
+            session.submissions,
+            [
+                {"word": "TEST", "is_valid": True, "score_delta": 4, "timestamp": stamp.isoformat()},
+                {"word": "TEST", "is_valid": False, "score_delta": 0, "timestamp": session.submissions[1]["timestamp"]},
+                {"word": "XYZ", "is_valid": False, "score_delta": 0, "timestamp": session.submissions[2]["timestamp"]},
+            ],
+        )
+        self.assertEqual(session.found_words(), {"TEST"})
+
+    def test_serializer_keeps_submissions_shape(self):
+        session = GameSession.objects.create(challenge=self.challenge, submissions=[{"word": "TEST", "is_valid": True}])
+        data = GameSessionSerializer(session).data
+        self.assertEqual(len(data["submissions"]), 1)
+        self.assertEqual(set(data["submissions"][0]), {"word", "is_valid", "score_delta", "timestamp"})
+        self.assertEqual(data["players"][0]["words"], 1)
+
+
+class SubmitWordInsertTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="sub", password="pw123456")
+        self.challenge = Challenge.objects.create(
+            creator_user_id=str(self.user.id), title="C", description="",
+            grid=[["T", "E", "S", "T"], ["A", "B", "C", "D"], ["E", "F", "G", "H"], ["I", "J", "K", "L"]],
+            difficulty="easy", valid_words=["TEST"],
+        )
+        self.session = GameSession.objects.create(
+            challenge=self.challenge, player_user_id=str(self.user.id), duration_seconds=300,
+        )
+        self.url = reverse("game_sessions_submit_word", args=[self.session.id])
+        self.client.force_authenticate(user=self.user)
+
+    def test_each_submission_is_one_row(self):
+        self.client.post(self.url, {"word": "test"}, format="json")
+        self.client.post(self.url, {"word": "nope"}, format="json")
+        resp = self.client.post(self.url, {"word": "TEST"}, format="json")
+        self.assertTrue(resp.data["already_found"])
+
+        rows = list(SessionSubmission.objects.filter(session=self.session).values_list("word", "is_valid"))
+        self.assertEqual(rows, [("TEST", True), ("NOPE", False)])
+
+    def test_valid_submission_returns_its_path(self):
+        resp = self.client.post(self.url, {"word": "test"}, format="json")
+        self.assertEqual(resp.data["path"], [[0, 0], [0, 1], [0, 2], [0, 3]])
+        self.assertIsNone(self.client.post(self.url, {"word": "nope"}, format="json").data["path"])
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.score, 4)
+
+
+class SubmitWordsBatchTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="batch", password="pw123456")
+        self.challenge = Challenge.objects.create(
+            creator_user_id=str(self.user.id), title="C", description="",
+            grid=[["T", "E", "S", "T"], ["A", "B", "C", "D"], ["E", "F", "G", "H"], ["I", "J", "K", "L"]],
+            difficulty="easy", valid_words=["TEST", "SET", "BET"],
+        )
+        self.session = GameSession.objects.create(
+            challenge=self.challenge, player_user_id=str(self.user.id), duration_seconds=300,
+            start_time=timezone.now() - timezone.timedelta(seconds=60),
+            submissions=[{"word": "SET", "is_valid": True, "score_delta": 3}], score=3,
+        )
+        self.url = reverse("game_sessions_submit_words", args=[self.session.id])
+        self.client.force_authenticate(user=self.user)
+
+    def test_batch_results_in_order_with_final_score(self):
+        sent_at = self.session.start_time + timezone.timedelta(seconds=5)
+        resp = self.client.post(self.url, {"words": [
+            {"word": "test", "timestamp": sent_at.isoformat()},
+            {"word": "set"},
+            {"word": "zzz"},
+            {"word": "TEST"},
+            {"word": "bet"},
+        ]}, format="json")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            [(r["word"], r["is_valid"], r["already_found"], r["score_delta"]) for r in resp.data["results"]],
+            [("TEST", True, False, 4), ("SET", False, True, 0), ("ZZZ", False, False, 0),
+             ("TEST", False, True, 0), ("BET", True, False, 3)],
+        )
+        self.assertEqual(resp.data["score_delta"], 7)
+        self.assertEqual(resp.data["score"], 10)
+
+        rows = SessionSubmission.objects.filter(session=self.session)
+        self.assertEqual([r.word for r in rows], ["SET", "TEST", "ZZZ", "BET"])
+        self.assertEqual(rows.get(word="TEST").timestamp, sent_at)
+
+    def test_future_client_timestamps_are_clamped(self):
+        future = timezone.now() + timezone.timedelta(days=1)
+        self.client.post(self.url, {"words": [{"word": "test", "timestamp": future.isoformat()}]}, format="json")
+        self.assertLessEqual(SessionSubmission.objects.get(word="TEST").timestamp, timezone.now())
+
+    def test_rejects_empty_batch_and_ended_session(self):
+        self.assertEqual(self.client.post(self.url, {"words": []}, format="json").status_code, 400)
+        self.session.end_time = timezone.now()
+        self.session.save(update_fields=["end_time"])
+        resp = self.client.post(self.url, {"words": [{"word": "test"}]}, format="json")
+        self.assertEqual(resp.data["error_code"], "TIME_UP")
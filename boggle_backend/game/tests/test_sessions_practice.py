@@ -1,7 +1,10 @@
+from datetime import timedelta
 from unittest import mock
 
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -60,3 +63,85 @@ class PracticeSessionTests(APITestCase):
         self.assertIn("Q", pool)
         self.assertIn("Z", pool)
         self.assertIn("X", pool)
+
+
+@mock.patch('game.practice.take_board', return_value=([["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], ["CAT", "DOG", "COD"]))
+@mock.patch('game.practice.EphemeralPracticeStore.shared', True)  # the test cache is LocMem
+class EphemeralPracticeTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='eph', password='pw123456')
+        self.url = reverse('game_sessions_create')
+
+    def _start(self):
+        resp = self.client.post(self.url, {"mode": "practice", "difficulty": "easy", "ephemeral": True}, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        return resp.data["token"]
+
+    def test_guest_game_never_touches_the_database(self, _board):
+        token = self._start()
+        submit_url = reverse('game_practice_submit_word', args=[token])
+        self.assertEqual(self.client.post(submit_url, {"word": "cat"}, format='json').data["score"], 3)
+        self.assertTrue(self.client.post(submit_url, {"word": "CAT"}, format='json').data["already_found"])
+        self.assertEqual(self.client.get(reverse('game_practice_hint', args=[token])).data["hint"]["word"], "COD")
+        self.assertFalse(Challenge.objects.exists())
+
+        resp = self.client.post(reverse('game_practice_end', args=[token]))
+        self.assertEqual(resp.data["status"], "ended_and_discarded")
+        self.assertEqual(resp.data["results"], {"all_valid_words": ["CAT", "COD", "DOG"], "found_words": ["CAT"], "score": 3})
+        self.assertFalse(Challenge.objects.exists() or GameSession.objects.exists())
+        self.assertEqual(self.client.post(submit_url, {"word": "dog"}, format='json').status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_registered_player_keeps_finished_game(self, _board):
+        self.client.force_authenticate(user=self.user)
+        token = self._start()
+        self.client.post(reverse('game_practice_submit_word', args=[token]), {"word": "dog"}, format='json')
+
+        resp = self.client.post(reverse('game_practice_end', args=[token]), {}, format='json')
+        self.assertEqual(resp.data["status"], "ended")
+        session = GameSession.objects.get(pk=resp.data["session_id"])
+        self.assertEqual((session.mode, session.player_user_id, session.score), ("practice", str(self.user.id), 3))
+        self.assertEqual(session.found_words(), {"DOG"})
+        self.assertIsNotNone(session.end_time)
+        self.assertEqual(session.challenge.word_paths["DOG"], [[1, 0], [1, 1], [1, 2]])
+
+    def test_other_players_cannot_use_the_token(self, _board):
+        self.client.force_authenticate(user=self.user)
+        token = self._start()
+        other = get_user_model().objects.create_user(username='other', password='pw123456')
+        self.client.force_authenticate(user=other)
+        resp = self.client.post(reverse('game_practice_submit_word', args=[token]), {"word": "dog"}, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_batch_submit_and_time_up(self, _board):
+        token = self._start()
+        resp = self.client.post(
+            reverse('game_practice_submit_words', args=[token]), {"words": [{"word": "cat"}, {"word": "dog"}]}, format='json',
+        )
+        self.assertEqual((resp.data["token"], resp.data["score"]), (token, 6))
+        state = caches["default"].get(f"practice:{token}")
+        state["start_time"] = (timezone.now() - timedelta(hours=1)).isoformat()
+        caches["default"].set(f"practice:{token}", state)
+        resp = self.client.post(reverse('game_practice_submit_word', args=[token]), {"word": "cod"}, format='json')
+        self.assertEqual(resp.data["error_code"], "TIME_UP")
+        self.assertFalse(GameSession.objects.exists())
+
+    def test_kept_game_ends_when_its_timer_did(self, _board):
+        self.client.force_authenticate(user=self.user)
+        token = self._start()
+        state = caches["default"].get(f"practice:{token}")
+        started = timezone.now() - timedelta(hours=1)
+        state["start_time"] = started.isoformat()
+        caches["default"].set(f"practice:{token}", state)
+
+        resp = self.client.post(reverse('game_practice_end', args=[token]), {}, format='json')
+        session = GameSession.objects.get(pk=resp.data["session_id"])
+        self.assertEqual(session.end_time, started + timedelta(seconds=session.duration_seconds))
+
+
+class EphemeralPracticeCacheTests(APITestCase):
+    def test_refused_without_a_shared_cache(self):
+        resp = self.client.post(
+            reverse('game_sessions_create'), {"mode": "practice", "difficulty": "easy", "ephemeral": True}, format='json',
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data["error_code"], "EPHEMERAL_UNAVAILABLE")
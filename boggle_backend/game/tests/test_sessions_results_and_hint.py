@@ -6,6 +6,7 @@ from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from accounts.models import ChallengeLeaderboardEntry
 from game.models import Challenge, GameSession
 
 
@@ -82,3 +83,39 @@ class SessionResultsAndHintTests(APITestCase):
         resp = self.client.get(self.hint_url)
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(resp.data.get("error_code"), "TIME_UP")
+        # Finalized like a timed-out submission: ended when the timer ran out, on the leaderboard.
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.end_time, self.session.start_time + timedelta(seconds=1))
+        self.assertTrue(ChallengeLeaderboardEntry.objects.filter(challenge=self.challenge).exists())
+
+
+class HintTierTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='hinter', password='pw123456')
+        self.challenge = Challenge.objects.create(
+            creator_user_id=str(self.user.id), title="Hints", description="", difficulty="easy",
+            grid=[["C", "A", "T"], ["D", "O", "G"], ["X", "Y", "Z"]], valid_words=["TOAD", "COD", "CAT", "DOG"],
+        )
+        self.session = GameSession.objects.create(
+            challenge=self.challenge, player_user_id=str(self.user.id), duration_seconds=300,
+            submissions=[{"word": "CAT", "is_valid": True, "score_delta": 3}], score=3,
+        )
+        self.hint_url = reverse('game_sessions_hint', args=[self.session.id])
+        self.client.force_authenticate(user=self.user)
+
+    def test_tiers_reveal_more_of_the_next_unfound_word(self):
+        first = self.client.get(self.hint_url).data["hint"]
+        self.assertEqual((first["word"], first["tier"]), ("COD", 1))
+        self.assertNotIn("start", first)
+
+        second = self.client.get(self.hint_url).data["hint"]
+        self.assertEqual((second["word"], second["start"]), ("COD", [0, 0]))
+        self.assertNotIn("path_prefix", second)
+
+        self.client.post(reverse('game_sessions_submit_word', args=[self.session.id]), {"word": "cod"}, format='json')
+        third = self.client.get(self.hint_url).data["hint"]
+        self.assertEqual((third["word"], third["tier"]), ("DOG", 3))
+        self.assertEqual(third["path_prefix"], [[1, 0], [1, 1]])
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.hint_cursor, 2)
@@ -0,0 +1,96 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from game.board_transforms import rotate_grid
+from game.models import SolvedBoard
+from game.solve_cache import SolveCache, cached_solve, canonical_grid, get_solve_cache, grid_symmetries
+
+GRID = [["C", "A", "T"], ["D", "O", "G"], ["R", "A", "T"]]
+
+
+def _fake_solver(grid, language="en", min_length=3):
+    return ["CAT", "DOG"]
+
+
+def _flip(grid):
+    return [list(reversed(row)) for row in grid]
+
+
+class CanonicalGridTests(SimpleTestCase):
+    def test_all_symmetries_share_a_canonical_form(self):
+        canonical = canonical_grid(GRID)
+        for angle in (90, 180, 270):
+            self.assertEqual(canonical_grid(rotate_grid(GRID, angle=angle)), canonical)
+            self.assertEqual(canonical_grid(_flip(rotate_grid(GRID, angle=angle))), canonical)
+        self.assertEqual(len(set(grid_symmetries(GRID))), 8)
+
+    def test_case_and_whitespace_are_normalized(self):
+        self.assertEqual(canonical_grid([[" c", "a"], ["t", "s "]]), canonical_grid([["C", "A"], ["T", "S"]]))
+
+    def test_non_square_grids(self):
+        grid = [["A", "B", "C"], ["D", "E", "F"]]
+        self.assertEqual(canonical_grid(grid), canonical_grid([list(col) for col in zip(*grid)]))
+
+
+class SolveCacheTests(SimpleTestCase):
+    def setUp(self):
+        get_solve_cache().clear()
+        self.addCleanup(get_solve_cache().clear)
+
+    def test_lru_eviction(self):
+        cache = SolveCache(maxsize=2)
+        cache.put("a", "v1", ("A",))
+        cache.put("b", "v1", ("B",))
+        cache.get("a", "v1")
+        cache.put("c", "v1", ("C",))
+        self.assertIsNone(cache.get("b", "v1"))
+        self.assertEqual(cache.get("a", "v1"), ("A",))
+        self.assertIsNone(cache.get("a", "v2"))
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_rotations_do_not_re_solve(self):
+        solver = mock.Mock(side_effect=_fake_solver, __module__="tests", __qualname__="solver")
+        first = cached_solve(GRID, solver=solver)
+        for angle in (90, 180, 270):
+            self.assertEqual(cached_solve(rotate_grid(GRID, angle=angle), solver=solver), first)
+        self.assertEqual(solver.call_count, 1)
+
+    def test_language_and_min_length_are_part_of_the_key(self):
+        solver = mock.Mock(side_effect=_fake_solver, __module__="tests", __qualname__="solver")
+        cached_solve(GRID, "en", 3, solver=solver)
+        cached_solve(GRID, "es", 3, solver=solver)
+        cached_solve(GRID, "en", 4, solver=solver)
+        self.assertEqual(solver.call_count, 3)
+
+    def test_default_solver_matches_solve_boggle(self):
+        from game.word_solver import solve_boggle
+
+        self.assertEqual(cached_solve(rotate_grid(GRID)), solve_boggle(GRID))
+
+
+@override_settings(SOLVE_CACHE_DB=True)
+class SolveCacheDatabaseTierTests(TestCase):
+    def setUp(self):
+        get_solve_cache().clear()
+        self.addCleanup(get_solve_cache().clear)
+
+    def test_second_tier_survives_in_process_eviction(self):
+        solver = mock.Mock(side_effect=_fake_solver, __module__="tests", __qualname__="solver")
+        cached_solve(GRID, solver=solver)
+        self.assertEqual(SolvedBoard.objects.count(), 1)
+
+        get_solve_cache().clear()
+        self.assertEqual(cached_solve(_flip(GRID), solver=solver), ["CAT", "DOG"])
+        self.assertEqual(solver.call_count, 1)
+
+    def test_new_dictionary_version_misses_both_tiers(self):
+        solver = mock.Mock(side_effect=_fake_solver, __module__="tests", __qualname__="solver")
+        with mock.patch("game.solve_cache.dictionary_version", return_value="aa" * 16):
+            cached_solve(GRID, solver=solver)
+        with mock.patch("game.solve_cache.dictionary_version", return_value="bb" * 16):
+            cached_solve(GRID, solver=solver)
+            get_solve_cache().clear()
+            cached_solve(GRID, solver=solver)
+        self.assertEqual(solver.call_count, 2)
+        self.assertEqual(SolvedBoard.objects.count(), 2)
@@ -0,0 +1,100 @@
+import json
+import os
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api.boggle_solver import Boggle
+from game.benchmarks import seeded_boards
+from game.dawg import Dawg
+from game.dictionaries import load_words
+from game.solver import is_on_board, paths, solve, solve_many, solve_paths, trace_paths
+from game.word_solver import solve_boggle_reference
+
+# Boards with the expected English word sets, produced by running the three solvers this
+# engine replaced (api.boggle_solver.Boggle, the trie solve_boggle and the frontend's
+# boggle_solver.py) and keeping only boards on which all three agreed. Boards avoid lone
+# I/S/Q tiles, which the older grid validators rejected outright.
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "solver_parity_corpus.json")
+
+
+def _load_corpus():
+    with open(CORPUS_PATH, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+class SolverParityTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.corpus = _load_corpus()
+
+    def test_engine_matches_corpus(self):
+        for case in self.corpus["cases"]:
+            with self.subTest(grid=case["grid"]):
+                self.assertEqual(solve(case["grid"], self.corpus["language"], self.corpus["min_length"]), case["words"])
+
+    def test_reference_dfs_matches_corpus(self):
+        for case in self.corpus["cases"]:
+            self.assertEqual(solve_boggle_reference(case["grid"]), case["words"])
+
+    def test_legacy_boggle_adapter_matches_corpus(self):
+        dictionary = list(load_words("en"))
+        for case in self.corpus["cases"][:8]:
+            self.assertEqual(sorted(Boggle(case["grid"], dictionary).getSolution()), case["words"])
+
+    def test_custom_dictionary_cases(self):
+        for case in self.corpus["dictionary_cases"]:
+            dawg = Dawg.from_words(word.upper() for word in case["dictionary"])
+            self.assertEqual(solve(case["grid"], dawg=dawg), case["words"])
+            self.assertEqual(sorted(Boggle(case["grid"], list(case["dictionary"])).getSolution()), case["words"])
+
+    def test_solve_many_preserves_order(self):
+        boards = [case["grid"] for case in self.corpus["cases"][:6]]
+        self.assertEqual(solve_many(boards), [solve(board) for board in boards])
+
+
+class PathTests(SimpleTestCase):
+    grid = [["C", "A", "Z"], ["X", "QU", "T"], ["T", "E", "S"]]
+
+    def test_paths_follow_adjacent_unused_tiles(self):
+        self.assertEqual(paths(self.grid, "cat"), [[(0, 0), (0, 1), (1, 2)]])
+        self.assertEqual(len(paths(self.grid, "QUEST")), 1)
+        for path in paths(self.grid, "QUEST"):
+            self.assertEqual("".join(self.grid[r][c] for r, c in path), "QUEST")
+            self.assertEqual(len(set(path)), len(path))
+
+    def test_multi_letter_tiles_must_match_whole(self):
+        self.assertTrue(is_on_board(self.grid, "quest"))
+        self.assertFalse(is_on_board(self.grid, "QEST"))
+
+    def test_limit_and_misses(self):
+        self.assertEqual(len(paths([["A", "A"], ["A", "A"]], "AA", limit=2)), 2)
+        self.assertEqual(len(paths([["A", "A"], ["A", "A"]], "AA")), 12)
+        self.assertFalse(is_on_board(self.grid, "TACT"))
+        self.assertFalse(is_on_board(self.grid, ""))
+
+    def test_paths_agree_with_solve(self):
+        for board in seeded_boards(4, 3, seed=11):
+            for word in solve(board):
+                self.assertTrue(is_on_board(board, word), word)
+
+    def test_solve_paths_emits_one_traceable_path_per_word(self):
+        for board in seeded_boards(4, 3, seed=5):
+            word_paths = solve_paths(board)
+            self.assertEqual(list(word_paths), solve(board))
+            for word, path in word_paths.items():
+                self.assertEqual("".join(board[r][c] for r, c in path), word)
+                self.assertEqual(len(set(path)), len(path))
+
+    def test_trace_paths_skips_words_off_the_board(self):
+        self.assertEqual(trace_paths(self.grid, ["cat", "CAT", "tact", ""]), {"CAT": [(0, 0), (0, 1), (1, 2)]})
+
+    def test_trace_paths_reuses_known_paths_that_still_spell_the_word(self):
+        path = [[0, 0], [0, 1], [1, 2]]
+        with mock.patch("game.solver.paths") as search:
+            self.assertEqual(trace_paths(self.grid, ["CAT"], known={"CAT": path}), {"CAT": path})
+        search.assert_not_called()
+        # Not adjacent, off the board, or spelling something else: traced again.
+        for stale in ([[0, 0], [0, 1], [2, 2]], [[0, 0], [0, 1], [9, 9]], [[0, 1], [0, 0], [1, 2]], "junk"):
+            self.assertEqual(trace_paths(self.grid, ["CAT"], known={"CAT": stale}), {"CAT": [(0, 0), (0, 1), (1, 2)]})
@@ -0,0 +1,63 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from game.benchmarks import seeded_boards
+from game.solver import _get_solver_pool, _neighbor_table, _reset_solver_pool
+from game.word_solver import generate_solvable_grid, solve_boggle, solve_boggle_reference
+
+
+class BitmaskSolverTests(SimpleTestCase):
+    def test_neighbor_table_corners_edges_and_center(self):
+        table = _neighbor_table(4, 4)
+        self.assertEqual(table[0], (1, 4, 5))
+        self.assertEqual(len(table[1]), 5)
+        self.assertEqual(len(table[5]), 8)
+        self.assertIs(_neighbor_table(4, 4), table)
+
+    def test_matches_reference_on_seeded_boards(self):
+        for size in (4, 5, 6):
+            for board in seeded_boards(size, 3, seed=7):
+                self.assertEqual(solve_boggle(board), solve_boggle_reference(board))
+                self.assertEqual(solve_boggle(board, min_length=5), solve_boggle_reference(board, min_length=5))
+
+    def test_empty_cells_are_skipped(self):
+        grid = [["C", "", "T"], ["", "A", ""], ["S", "", "T"]]
+        self.assertEqual(solve_boggle(grid), solve_boggle_reference(grid))
+        self.assertIn("CAT", solve_boggle(grid))
+
+
+class GenerateSolvableGridTests(SimpleTestCase):
+    def tearDown(self):
+        _reset_solver_pool()
+
+    def test_pool_returns_grid_meeting_threshold(self):
+        grid, words = generate_solvable_grid(size=4, min_words=5, workers=2)
+        self.assertEqual(len(grid), 4)
+        self.assertGreaterEqual(len(words), 5)
+        self.assertEqual(words, solve_boggle(grid))
+
+    def test_serial_when_single_worker(self):
+        with mock.patch("game.word_solver._get_solver_pool") as mock_pool:
+            grid, words = generate_solvable_grid(size=4, min_words=1, workers=1)
+        mock_pool.assert_not_called()
+        self.assertEqual(words, solve_boggle(grid))
+
+    def test_falls_back_to_serial_without_fork(self):
+        with mock.patch("game.word_solver._get_solver_pool", return_value=None):
+            grid, words = generate_solvable_grid(size=5, min_words=1, workers=4)
+        self.assertEqual(words, solve_boggle(grid))
+
+    def test_defaults_to_serial(self):
+        with mock.patch("game.word_solver._get_solver_pool") as mock_pool:
+            generate_solvable_grid(size=4, min_words=1)
+        mock_pool.assert_not_called()
+
+    def test_pool_is_resized_for_a_different_worker_count(self):
+        pool = _get_solver_pool(2, "en")
+        if pool is None:
+            self.skipTest("fork unavailable")
+        self.assertIs(_get_solver_pool(2, "en"), pool)
+        resized = _get_solver_pool(3, "en")
+        self.assertIsNot(resized, pool)
+        self.assertEqual(resized._max_workers, 3)
@@ -11,6 +11,7 @@ from .views import (
     ChallengeInviteView,
     SessionCreateView,
     SessionSubmitWordView,
+    SessionSubmitWordsView,
     SessionEndView,
     SessionResultsView,
     SessionHintView,
@@ -29,7 +30,12 @@ urlpatterns = [
     path('challenges/<int:pk>/invite/', ChallengeInviteView.as_view(), name='game_challenges_invite'),
     path('sessions/', SessionCreateView.as_view(), name='game_sessions_create'),
     path('sessions/<int:pk>/submit-word/', SessionSubmitWordView.as_view(), name='game_sessions_submit_word'),
+    path('sessions/<int:pk>/submit-words/', SessionSubmitWordsView.as_view(), name='game_sessions_submit_words'),
     path('sessions/<int:pk>/end/', SessionEndView.as_view(), name='game_sessions_end'),
     path('sessions/<int:pk>/results/', SessionResultsView.as_view(), name='game_sessions_results'),
     path('sessions/<int:pk>/hint/', SessionHintView.as_view(), name='game_sessions_hint'),
+    path('practice/<str:token>/submit-word/', SessionSubmitWordView.as_view(), name='game_practice_submit_word'),
+    path('practice/<str:token>/submit-words/', SessionSubmitWordsView.as_view(), name='game_practice_submit_words'),
+    path('practice/<str:token>/hint/', SessionHintView.as_view(), name='game_practice_hint'),
+    path('practice/<str:token>/end/', SessionEndView.as_view(), name='game_practice_end'),
 ]
@@ -2,31 +2,42 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView
+from django.db import transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
 from .models import Challenge, GameSession
-from .boggle_engine import get_valid_words, is_word_on_board, score_word, meets_min_length
+from .boggle_engine import get_valid_words, get_word_path, score_word, meets_min_length
 from .serializers import (
     ChallengeSerializer,
     ChallengeListSerializer,
     GameSessionSerializer,
     SessionSubmitWordSerializer,
+    SessionSubmitWordsSerializer,
     SessionResultsSerializer,
 )
-from .hints import choose_hint
-from .practice import create_practice_challenge
+from .hints import next_hint
+from .live_sessions import get_live_session_store
+from .practice import (
+    create_practice_challenge,
+    end_ephemeral_practice,
+    get_ephemeral_session,
+    get_practice_store,
+    start_ephemeral_practice,
+)
 from .difficulty import get_difficulty_config
 from .board_transforms import shuffle_grid, rotate_grid
 from .slug_utils import generate_share_slug
 from accounts.authentication import FirebaseAuthentication, FirebaseOptionalAuthentication
 from accounts.permissions import IsRegisteredUser
 from accounts.daily import record_daily_result
-from accounts.leaderboards import compute_session_rank, milestone_for_rank
+from accounts.leaderboards import compute_session_rank, milestone_for_rank, record_session_result
+from accounts.stats import record_session_stats
 from api.models import Games as LegacyGames
 import json
 from .boggle_engine import get_valid_words, meets_min_length, is_word_on_board
-from .word_solver import generate_solvable_grid
+from .board_pool import take_or_generate_board
 
 # Dev A scan (FR-02): No game endpoints existed; legacy challenge endpoints are in api/views.py.
 # Plan for FR-03: Add a "my challenges" listing that filters by authenticated user and reuses the Challenge model with a slim serializer.
@@ -51,7 +62,7 @@ class ChallengeCreateView(APIView):
             try:
                 grid = challenge.grid or []
                 size = len(grid) if isinstance(grid, list) else 0
-                valid_words = challenge.valid_words or []
+                valid_words = challenge.word_list()
                 LegacyGames.objects.create(
                     name=challenge.title or f"Challenge {challenge.id}",
                     size=size,
@@ -159,6 +170,19 @@ class SessionCreateView(APIView):
         if mode == GameSession.MODE_PRACTICE:
             user_id = self._get_user_id(request)
             difficulty = request.data.get('difficulty') or "easy"
+            if request.data.get('ephemeral'):
+                if not get_practice_store().shared:
+                    # Each worker would hold its own games; a token could 404 on the next request.
+                    return Response(
+                        {
+                            "error_code": "EPHEMERAL_UNAVAILABLE",
+                            "message": "Ephemeral practice needs a shared PRACTICE_CACHE; start a regular practice session.",
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                # No Challenge/GameSession rows; play continues under /practice/<token>/.
+                state = start_ephemeral_practice(difficulty, user_id)
+                return Response(_ephemeral_payload(state), status=status.HTTP_201_CREATED)
             practice_challenge = create_practice_challenge(difficulty, user_id)
             cfg = get_difficulty_config(practice_challenge.difficulty)
             session = GameSession.objects.create(
@@ -208,7 +232,7 @@ class ChallengeTransformMixin:
         return get_object_or_404(Challenge.objects.active(), pk=pk)
 
     def _challenge_response(self, grid):
-        # TODO: Recompute dictionary for transformed grids if needed for gameplay.
+        # Words are still validated against the stored board, so only the layout changes.
         return {"grid": grid}
 
 
@@ -240,13 +264,11 @@ class ChallengeShuffleView(APIView, ChallengeTransformMixin):
                     {"error_code": "FORBIDDEN", "message": "You cannot shuffle this session."},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            if session.shuffle_uses >= 2:
+            if get_live_session_store(session).consume(session, 'shuffle_uses', 2) is None:
                 return Response(
                     {"error_code": "SHUFFLE_LIMIT_REACHED", "message": "Shuffle limit reached for this session."},
                     status=status.HTTP_429_TOO_MANY_REQUESTS,
                 )
-            session.shuffle_uses += 1
-            session.save(update_fields=['shuffle_uses'])
 
         shuffled = shuffle_grid(challenge.grid)
         return Response(self._challenge_response(shuffled), status=status.HTTP_200_OK)
@@ -307,14 +329,62 @@ class ChallengeRotateView(APIView, ChallengeTransformMixin):
         return None
 
 
+def _evaluate_word(challenge, word_norm, valid_set):
+    """Return (is_valid, score_delta, path) for an uppercase word on the challenge board."""
+    if word_norm not in valid_set or not meets_min_length(word_norm, challenge.difficulty):
+        return False, 0, None
+    path = get_word_path(challenge, word_norm)
+    if path is None:
+        return False, 0, None
+    return True, score_word(word_norm), path
+
+
+def _get_session(pk=None, token=None):
+    """The session `pk`, or the ephemeral practice game `token` as an unsaved GameSession."""
+    if token is None:
+        return get_object_or_404(GameSession.objects.select_related('challenge'), pk=pk)
+    session = get_ephemeral_session(token)
+    if session is None:
+        raise Http404("Practice game not found or expired.")
+    return session
+
+
+def _session_ref(session):
+    token = getattr(session, 'practice_token', None)
+    return {"token": token} if token else {"session_id": session.id}
+
+
+def _finish_session(session, end_time):
+    """
+    Set the session's end_time unless it already has one. Only the request that sets
+    it adds the session to the challenge leaderboard and the player's stats, in the
+    same transaction. Ephemeral practice games have no row; they end in SessionEndView.
+    """
+    if session.end_time or session.pk is None:
+        return
+    with transaction.atomic():
+        if GameSession.objects.filter(pk=session.pk, end_time__isnull=True).update(end_time=end_time):
+            session.end_time = end_time
+            record_session_result(session)
+            record_session_stats(session)
+            return
+    session.refresh_from_db(fields=['end_time'])
+
+
+def _expire_session(session):
+    """Close a timed-out session's live state and finalize it as of when its timer ran out."""
+    get_live_session_store(session).close(session)
+    _finish_session(session, session.start_time + timezone.timedelta(seconds=session.duration_seconds or 0))
+
+
 class SessionSubmitWordView(APIView):
     """
     Submit a single word to an active session (FR-06).
     """
     authentication_classes = [FirebaseOptionalAuthentication]
 
-    def post(self, request, pk):
-        session = get_object_or_404(GameSession.objects.select_related('challenge'), pk=pk)
+    def post(self, request, pk=None, token=None):
+        session = _get_session(pk, token)
 
         if not self._is_owner_or_guest(session, request):
             return Response(
@@ -323,9 +393,7 @@ class SessionSubmitWordView(APIView):
             )
 
         if session.is_time_up():
-            if not session.end_time:
-                session.end_time = session.start_time + timezone.timedelta(seconds=session.duration_seconds or 0)
-                session.save(update_fields=['end_time'])
+            _expire_session(session)
             return Response(
                 {"error_code": "TIME_UP", "message": "Session has ended."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -340,55 +408,44 @@ class SessionSubmitWordView(APIView):
 
         word = serializer.validated_data['word']
         word_norm = word.strip().upper()
-        
+        store = get_live_session_store(session)
+
         # Check for duplicate - already found valid words should not be scored again
-        already_found = {s.get("word") for s in session.submissions if s.get("is_valid")}
-        if word_norm in already_found:
-            return Response(
-                {
-                    "status": "accepted",
-                    "word": word_norm,
-                    "session_id": session.id,
-                    "is_valid": False,
-                    "already_found": True,
-                    "message": "This word was already found!",
-                    "score_delta": 0,
-                    "score": session.score,
-                },
-                status=status.HTTP_200_OK,
-            )
-        
-        valid_set = get_valid_words(session.challenge)
-        is_valid = (
-            word_norm in valid_set
-            and meets_min_length(word_norm, session.challenge.difficulty)
-            and is_word_on_board(session.challenge.grid, word_norm)
-        )
-        score_delta = score_word(word_norm) if is_valid else 0
+        if word_norm in store.found_words(session):
+            session.score = store.score(session)
+            return self._already_found_response(session, word_norm)
+
+        is_valid, score_delta, path = _evaluate_word(session.challenge, word_norm, get_valid_words(session.challenge))
 
-        submissions = list(session.submissions)
-        submissions.append(
+        # The store applies the duplicate check and the score change together, so a
+        # concurrent request that recorded this word first wins.
+        (recorded,), score = store.record(session, [(word_norm, is_valid, score_delta, None)])
+        if not recorded:
+            return self._already_found_response(session, word_norm)
+
+        return Response(
             {
+                "status": "accepted",
                 "word": word_norm,
+                **_session_ref(session),
                 "is_valid": is_valid,
                 "score_delta": score_delta,
-                "timestamp": timezone.now().isoformat(),
-            }
+                "score": score,
+                "path": path,
+            },
+            status=status.HTTP_200_OK,
         )
-        session.submissions = submissions
-        if is_valid:
-            session.score = (session.score or 0) + score_delta
-            session.save(update_fields=['submissions', 'score'])
-        else:
-            session.save(update_fields=['submissions'])
 
+    def _already_found_response(self, session, word_norm):
         return Response(
             {
                 "status": "accepted",
                 "word": word_norm,
-                "session_id": session.id,
-                "is_valid": is_valid,
-                "score_delta": score_delta,
+                **_session_ref(session),
+                "is_valid": False,
+                "already_found": True,
+                "message": "This word was already found!",
+                "score_delta": 0,
                 "score": session.score,
             },
             status=status.HTTP_200_OK,
@@ -407,6 +464,92 @@ class SessionSubmitWordView(APIView):
         return False
 
 
+class SessionSubmitWordsView(APIView):
+    """
+    Submit an ordered batch of queued words to an active session in one round trip.
+    Body: { "words": [{"word": "cat", "timestamp": "<client ISO time>"}, ...] }
+    """
+    authentication_classes = [FirebaseOptionalAuthentication]
+
+    def post(self, request, pk=None, token=None):
+        session = _get_session(pk, token)
+
+        if not self._is_owner_or_guest(session, request):
+            return Response(
+                {"error_code": "FORBIDDEN", "message": "You cannot submit to this session."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        if session.is_time_up():
+            _expire_session(session)
+            return Response(
+                {"error_code": "TIME_UP", "message": "Session has ended."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = SessionSubmitWordsSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {"error_code": "VALIDATION_ERROR", "message": "Invalid submission.", "details": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        store = get_live_session_store(session)
+        evaluated = self._evaluate(session, serializer.validated_data['words'], store.found_words(session))
+        recorded, score = store.record(session, evaluated)
+
+        results, total_delta = [], 0
+        for (word_norm, is_valid, score_delta, _), was_recorded in zip(evaluated, recorded):
+            if not was_recorded:
+                results.append({"word": word_norm, "is_valid": False, "already_found": True, "score_delta": 0, "path": None})
+                continue
+            total_delta += score_delta
+            results.append({
+                "word": word_norm, "is_valid": is_valid, "already_found": False, "score_delta": score_delta,
+                "path": get_word_path(session.challenge, word_norm) if is_valid else None,
+            })
+
+        return Response(
+            {
+                "status": "accepted",
+                **_session_ref(session),
+                "results": results,
+                "score_delta": total_delta,
+                "score": score,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def _evaluate(self, session, entries, found):
+        now = timezone.now()
+        valid_set = get_valid_words(session.challenge)
+        verdicts = {}
+        evaluated = []
+        for entry in entries:
+            word_norm = entry['word'].upper()
+            if word_norm not in verdicts:
+                # Words already found are reported as such by the store; skip the board walk.
+                verdicts[word_norm] = (
+                    (False, 0) if word_norm in found else _evaluate_word(session.challenge, word_norm, valid_set)[:2]
+                )
+            # Client clocks are only trusted within the session's lifetime.
+            timestamp = min(max(entry.get('timestamp') or now, session.start_time), now)
+            evaluated.append((word_norm, *verdicts[word_norm], timestamp))
+        return evaluated
+
+    def _is_owner_or_guest(self, session, request):
+        if session.player_user_id is None:
+            return True
+        user = getattr(request, 'user', None)
+        if user is not None and getattr(user, 'is_authenticated', False):
+            return str(user.pk) == session.player_user_id
+        if hasattr(request, 'user_id'):
+            user_id = getattr(request, 'user_id')
+            if user_id is not None:
+                return str(user_id) == session.player_user_id
+        return False
+
+
 class SessionResultsView(APIView):
     """
     Return all valid words, found words, and final score for an ended session (FR-08).
@@ -426,6 +569,7 @@ class SessionResultsView(APIView):
                 {"error_code": "SESSION_ACTIVE", "message": "Session is still active."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        get_live_session_store(session).close(session)
 
         valid_set = get_valid_words(session.challenge)
         payload = self._build_results_payload(session, valid_set)
@@ -445,9 +589,7 @@ class SessionResultsView(APIView):
 
     def _build_results_payload(self, session, valid_set=None):
         valid_set = valid_set or get_valid_words(session.challenge)
-        found = sorted(
-            {s.get("word") for s in session.submissions if s.get("is_valid")}
-        )
+        found = sorted(session.found_words())
         return {
             "all_valid_words": sorted(valid_set),
             "found_words": found,
@@ -461,8 +603,8 @@ class SessionHintView(APIView):
     """
     authentication_classes = [FirebaseOptionalAuthentication]
 
-    def get(self, request, pk):
-        session = get_object_or_404(GameSession.objects.select_related('challenge'), pk=pk)
+    def get(self, request, pk=None, token=None):
+        session = _get_session(pk, token)
 
         if not self._is_owner_or_guest(session, request):
             return Response(
@@ -470,25 +612,27 @@ class SessionHintView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        store = get_live_session_store(session)
         if session.is_time_up():
+            _expire_session(session)
             return Response(
                 {"error_code": "TIME_UP", "message": "Session has ended."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if session.hint_uses >= 3:
+        hint_uses = store.consume(session, 'hint_uses', 3)
+        if hint_uses is None:
             return Response(
                 {"error_code": "HINT_LIMIT_REACHED", "message": "Hint limit reached for this session."},
                 status=status.HTTP_429_TOO_MANY_REQUESTS,
             )
 
-        valid_set = get_valid_words(session.challenge)
-        found_set = {s.get("word") for s in session.submissions if s.get("is_valid")}
-        unfound = sorted(valid_set - found_set)
-        hint = choose_hint(unfound)
-        session.hint_uses += 1
-        session.save(update_fields=['hint_uses'])
-        return Response({"hint": hint, "remaining": max(0, 3 - session.hint_uses)}, status=status.HTTP_200_OK)
+        # Each hint reveals more about the same next unfound word (see game.hints.HintIndex.hint).
+        hint, cursor = next_hint(
+            session.challenge, store.found_words(session), store.hint_cursor(session), tier=hint_uses,
+        )
+        store.set_hint_cursor(session, cursor)
+        return Response({"hint": hint, "remaining": max(0, 3 - hint_uses)}, status=status.HTTP_200_OK)
 
     def _is_owner_or_guest(self, session, request):
         if session.player_user_id is None:
@@ -505,12 +649,13 @@ class SessionHintView(APIView):
 
 class SessionEndView(APIView):
     """
-    Explicitly end a session (FR-06).
+    Explicitly end a session (FR-06). Ending an ephemeral practice game drops it;
+    registered players keep it as a practice session unless they send {"save": false}.
     """
     authentication_classes = [FirebaseOptionalAuthentication]
 
-    def post(self, request, pk):
-        session = get_object_or_404(GameSession.objects.select_related('challenge'), pk=pk)
+    def post(self, request, pk=None, token=None):
+        session = _get_session(pk, token)
 
         if not self._is_owner_or_guest(session, request):
             return Response(
@@ -518,16 +663,19 @@ class SessionEndView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        if not session.end_time:
-            session.end_time = timezone.now()
-            session.save(update_fields=['end_time'])
+        if session.pk is None:
+            return self._end_ephemeral(request, session)
+
+        # Write any buffered gameplay state before scoring the session.
+        get_live_session_store(session).close(session)
+        _finish_session(session, timezone.now())
 
         # Build results payload upfront (in case we delete practice sessions later)
         valid_set = get_valid_words(session.challenge)
         results_payload = {
             "results": {
                 "all_valid_words": sorted(valid_set),
-                "found_words": sorted({s.get("word") for s in session.submissions if s.get("is_valid")}),
+                "found_words": sorted(session.found_words()),
                 "score": session.score,
             }
         }
@@ -565,6 +713,27 @@ class SessionEndView(APIView):
             status=status.HTTP_200_OK,
         )
 
+    def _end_ephemeral(self, request, session):
+        user = getattr(request, 'user', None)
+        keep = (
+            user is not None and getattr(user, 'is_authenticated', False)
+            and session.player_user_id is not None and request.data.get('save', True)
+        )
+        token = session.practice_token
+        state = end_ephemeral_practice(session, keep=bool(keep))
+        if state is None:
+            raise Http404("Practice game not found or expired.")
+        results_payload = {
+            "results": {
+                "all_valid_words": sorted(get_valid_words(session.challenge)),
+                "found_words": sorted(state["found"]),
+                "score": session.score,
+            }
+        }
+        if keep:
+            return Response({"status": "ended", "session_id": session.id, **results_payload}, status=status.HTTP_200_OK)
+        return Response({"status": "ended_and_discarded", "token": token, **results_payload}, status=status.HTTP_200_OK)
+
     def _is_owner_or_guest(self, session, request):
         if session.player_user_id is None:
             return True
@@ -578,6 +747,20 @@ class SessionEndView(APIView):
         return False
 
 
+def _ephemeral_payload(state):
+    return {
+        "token": state["token"],
+        "mode": GameSession.MODE_PRACTICE,
+        "ephemeral": True,
+        "grid": state["grid"],
+        "difficulty": state["difficulty"],
+        "language": state["language"],
+        "start_time": state["start_time"],
+        "duration_seconds": state["duration_seconds"],
+        "score": state["score"],
+    }
+
+
 class ChallengeGenerateView(APIView):
     """
     Auto-generate a solvable boggle grid with valid words (FR-20 Stretch Goal).
@@ -598,14 +781,8 @@ class ChallengeGenerateView(APIView):
         if language not in ('en', 'es', 'fr'):
             language = 'en'
         
-        # Generate a solvable grid with at least 10 valid words
-        min_words = {'easy': 15, 'medium': 10, 'hard': 8}.get(difficulty, 10)
-        grid, valid_words = generate_solvable_grid(
-            size=size,
-            difficulty=difficulty,
-            language=language,
-            min_words=min_words
-        )
+        # Take a pre-solved board from the pool; generate live only if the bucket is empty
+        grid, valid_words = take_or_generate_board(size, difficulty, language)
         
         return Response({
             'grid': grid,
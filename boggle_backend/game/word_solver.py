@@ -1,100 +1,32 @@
 """
-Fast boggle word solver for challenge creation.
-Uses a Trie for efficient prefix matching and DFS for board traversal.
+Solvable-grid generation for challenge creation, on top of the game.solver engine.
 """
-import json
-import os
-from functools import lru_cache
-from typing import List, Set, Optional
-from django.conf import settings
+import logging
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Set
 
+from .dawg import Dawg, NO_NODE
+from .dictionaries import get_wordlist_path
+from .solver import _get_dawg, _get_solver_pool, _reset_solver_pool, solve
 
-class TrieNode:
-    """Trie node for efficient prefix/word lookup."""
-    __slots__ = ['children', 'is_word']
-    
-    def __init__(self):
-        self.children = {}
-        self.is_word = False
-
-
-class Trie:
-    """Trie data structure for O(m) word/prefix lookup where m = word length."""
-    
-    def __init__(self):
-        self.root = TrieNode()
-    
-    def insert(self, word: str):
-        node = self.root
-        for char in word.upper():
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_word = True
-    
-    def search(self, word: str) -> bool:
-        node = self._traverse(word.upper())
-        return node is not None and node.is_word
-    
-    def starts_with(self, prefix: str) -> bool:
-        return self._traverse(prefix.upper()) is not None
-    
-    def _traverse(self, text: str) -> Optional[TrieNode]:
-        node = self.root
-        for char in text:
-            if char not in node.children:
-                return None
-            node = node.children[char]
-        return node
+logger = logging.getLogger(__name__)
 
 
 def _get_dictionary_path(language: str = 'en') -> str:
     """Get the path to the dictionary file for a given language."""
-    base_path = os.path.join(settings.BASE_DIR, 'boggle_backend', 'static', 'data')
-    
-    if language == 'es':
-        return os.path.join(base_path, 'spanish-wordlist.json')
-    elif language == 'fr':
-        return os.path.join(base_path, 'french-wordlist.json')
-    else:
-        return os.path.join(base_path, 'full-wordlist.json')
-
-
-@lru_cache(maxsize=4)
-def _load_dictionary(language: str = 'en') -> List[str]:
-    """Load and cache the dictionary for a language."""
-    path = _get_dictionary_path(language)
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Handle different JSON formats
-            if isinstance(data, dict) and 'words' in data:
-                words = data['words']
-            elif isinstance(data, list):
-                words = data
-            else:
-                words = list(data.values()) if isinstance(data, dict) else []
-            # Filter to words >= 3 chars
-            return [w.upper() for w in words if isinstance(w, str) and len(w) >= 3]
-    except FileNotFoundError:
-        # Fall back to English
-        if language != 'en':
-            return _load_dictionary('en')
-        return []
+    return get_wordlist_path(language)
 
 
-@lru_cache(maxsize=4)
-def _get_trie(language: str = 'en') -> Trie:
-    """Build and cache a Trie for efficient word lookup."""
-    trie = Trie()
-    for word in _load_dictionary(language):
-        trie.insert(word)
-    return trie
+# Existing imports of solve_boggle get the shared engine (game.solver.solve).
+solve_boggle = solve
 
 
-def solve_boggle(grid: List[List[str]], language: str = 'en', min_length: int = 3) -> List[str]:
+def solve_boggle_reference(grid: List[List[str]], language: str = 'en', min_length: int = 3) -> List[str]:
     """
-    Find all valid words in a Boggle grid.
+    Straightforward set-of-coordinates DFS, kept as the reference for parity tests
+    and benchmarks against game.solver.solve().
     
     Args:
         grid: 2D list of letters (e.g., [['A','B'],['C','D']])
@@ -107,7 +39,7 @@ def solve_boggle(grid: List[List[str]], language: str = 'en', min_length: int =
     if not grid or not grid[0]:
         return []
     
-    trie = _get_trie(language)
+    dawg = _get_dawg(language)
     rows = len(grid)
     cols = len(grid[0])
     
@@ -116,14 +48,14 @@ def solve_boggle(grid: List[List[str]], language: str = 'en', min_length: int =
     
     found_words: Set[str] = set()
     
-    def dfs(r: int, c: int, current: str, node: TrieNode, visited: Set[tuple]):
+    def dfs(r: int, c: int, current: str, node: int, visited: Set[tuple]):
         """DFS to explore all paths from position (r, c)."""
         # Check if current path is a valid word
-        if len(current) >= min_length and node.is_word:
+        if len(current) >= min_length and dawg.is_terminal(node):
             found_words.add(current)
         
         # Early termination: if no words start with this prefix, stop
-        if not node.children:
+        if not dawg.has_children(node):
             return
         
         # Explore all 8 adjacent cells
@@ -134,18 +66,10 @@ def solve_boggle(grid: List[List[str]], language: str = 'en', min_length: int =
                 nr, nc = r + dr, c + dc
                 if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in visited:
                     cell = norm_grid[nr][nc]
-                    # Handle multi-character tiles like "QU"
-                    if cell and cell[0] in node.children:
-                        next_node = node.children[cell[0]]
-                        # For multi-char tiles, traverse through each char
-                        valid = True
-                        for i, char in enumerate(cell[1:], 1):
-                            if char in next_node.children:
-                                next_node = next_node.children[char]
-                            else:
-                                valid = False
-                                break
-                        if valid:
+                    # Multi-character tiles like "QU" traverse one edge per char
+                    if cell:
+                        next_node = dawg.walk(node, cell)
+                        if next_node != NO_NODE:
                             new_visited = visited | {(nr, nc)}
                             dfs(nr, nc, current + cell, next_node, new_visited)
     
@@ -153,24 +77,42 @@ def solve_boggle(grid: List[List[str]], language: str = 'en', min_length: int =
     for r in range(rows):
         for c in range(cols):
             cell = norm_grid[r][c]
-            if cell and cell[0] in trie.root.children:
-                start_node = trie.root.children[cell[0]]
-                # Handle multi-char starting tiles
-                valid = True
-                for char in cell[1:]:
-                    if char in start_node.children:
-                        start_node = start_node.children[char]
-                    else:
-                        valid = False
-                        break
-                if valid:
+            if cell:
+                start_node = dawg.walk(Dawg.ROOT, cell)
+                if start_node != NO_NODE:
                     dfs(r, c, cell, start_node, {(r, c)})
     
     return sorted(found_words)
 
 
+# Letter frequency for English (weighted toward vowels for playability)
+_VOWELS = 'AEIOUA'  # Extra A for common words
+_CONSONANTS = 'BCDFGHJKLMNPQRSTVWXYZ'
+
+# Difficulty affects vowel/consonant ratio
+_VOWEL_RATIOS = {'easy': 0.45, 'medium': 0.38, 'hard': 0.32}
+
+
+def _random_grid(size: int, vowel_ratio: float) -> List[List[str]]:
+    grid = []
+    for _ in range(size):
+        row = []
+        for _ in range(size):
+            if random.random() < vowel_ratio:
+                letter = random.choice(_VOWELS)
+            else:
+                letter = random.choice(_CONSONANTS)
+            # Handle special tiles
+            if letter == 'Q':
+                letter = 'QU'
+            row.append(letter)
+        grid.append(row)
+    return grid
+
+
 def generate_solvable_grid(size: int = 4, difficulty: str = 'medium', language: str = 'en', 
-                           min_words: int = 10, max_attempts: int = 50) -> tuple:
+                           min_words: int = 10, max_attempts: int = 50,
+                           workers: int = 1) -> tuple:
     """
     Generate a random grid that has at least min_words valid solutions.
     
@@ -180,39 +122,58 @@ def generate_solvable_grid(size: int = 4, difficulty: str = 'medium', language:
         language: Language code
         min_words: Minimum number of valid words required
         max_attempts: Maximum generation attempts
+        workers: Solver processes to fan candidates out to. 1 (the default)
+            solves candidates serially, as requests should; batch jobs such as
+            refill_board_pool pass more.
     
     Returns:
         Tuple of (grid, valid_words)
     """
-    import random
+    vowel_ratio = _VOWEL_RATIOS.get(difficulty, 0.38)
     
-    # Letter frequency for English (weighted toward vowels for playability)
-    vowels = list('AEIOUA')  # Extra A for common words
-    consonants = list('BCDFGHJKLMNPQRSTVWXYZ')
-    
-    # Difficulty affects vowel/consonant ratio
-    vowel_ratio = {'easy': 0.45, 'medium': 0.38, 'hard': 0.32}.get(difficulty, 0.38)
+    if workers > 1:
+        pool = _get_solver_pool(workers, language)
+        if pool is not None:
+            try:
+                return _generate_in_pool(pool, workers, size, vowel_ratio, language, min_words, max_attempts)
+            except BrokenProcessPool:
+                logger.warning("Solver pool broke; generating grid serially.")
+                _reset_solver_pool()
     
     for attempt in range(max_attempts):
-        # Generate grid
-        grid = []
-        for _ in range(size):
-            row = []
-            for _ in range(size):
-                if random.random() < vowel_ratio:
-                    letter = random.choice(vowels)
-                else:
-                    letter = random.choice(consonants)
-                # Handle special tiles
-                if letter == 'Q':
-                    letter = 'QU'
-                row.append(letter)
-            grid.append(row)
+        grid = _random_grid(size, vowel_ratio)
         
         # Solve and check word count
-        valid_words = solve_boggle(grid, language)
+        valid_words = solve(grid, language)
         if len(valid_words) >= min_words:
             return grid, valid_words
     
     # If we couldn't generate a good grid, return the last attempt
     return grid, valid_words
+
+
+def _generate_in_pool(pool: ProcessPoolExecutor, workers: int, size: int, vowel_ratio: float,
+                      language: str, min_words: int, max_attempts: int) -> tuple:
+    """
+    Keep twice `workers` candidates queued, topping up as each finishes, and return the
+    first that meets min_words; queued candidates not yet started are cancelled. Grids
+    are drawn in the parent so forked children never share random state.
+    """
+    grid, valid_words = None, []
+    attempts = 0
+    futures = {}
+    while futures or attempts < max_attempts:
+        while attempts < max_attempts and len(futures) < 2 * workers:
+            candidate = _random_grid(size, vowel_ratio)
+            futures[pool.submit(solve, candidate, language)] = candidate
+            attempts += 1
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            grid, valid_words = futures.pop(future), future.result()
+            if len(valid_words) >= min_words:
+                for other in futures:
+                    other.cancel()
+                return grid, valid_words
+    
+    # If we couldn't generate a good grid, return the last attempt
+    return grid, valid_words